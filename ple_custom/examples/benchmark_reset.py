@@ -0,0 +1,43 @@
+"""
+Times how long a game takes to reset, i.e. to start a new episode.
+
+    python benchmark_reset.py [resets] [new|keep|pool]
+
+The first reset also pays for loading the assets (and, for "pool", for
+generating the level pool); the following ones show the cost an agent
+pays at the start of every episode.
+"""
+import os
+import sys
+import time
+
+import numpy as np
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+import pygame
+
+from ple.games.monsterkong import MonsterKong
+
+resets = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+levels = sys.argv[2] if len(sys.argv) > 2 else "new"
+
+pygame.init()
+game = MonsterKong(levels=levels)
+game.screen = pygame.display.set_mode(game.getScreenDims(), 0, 32)
+game.clock = pygame.time.Clock()
+game.rng = np.random.RandomState(24)
+
+start = time.perf_counter()
+game.init()
+first = time.perf_counter() - start
+
+times = []
+for i in range(resets):
+    start = time.perf_counter()
+    game.init()
+    times.append(time.perf_counter() - start)
+
+times = np.array(times) * 1000.0
+print("first reset: {:.2f} ms".format(first * 1000.0))
+print("next {} resets: mean {:.3f} ms, median {:.3f} ms, max {:.3f} ms".format(
+    resets, times.mean(), np.median(times), times.max()))
@@ -1,3 +1,5 @@
+import os
+
 import numpy as np
 from collections import deque
 
@@ -132,64 +134,335 @@ class ExampleAgent():
 
 
 class ReplayMemory():
+    """
+        Replay memory in preallocated numpy arrays used as a ring buffer.
+
+        Each transition is (frame, action, reward, terminal). Frames are stored once; the stacked
+        states of a sample are rebuilt from consecutive frames, so a state of num_frames frames
+        does not cost num_frames copies. Samples whose frames span two episodes are skipped.
 
-    def __init__(self, max_size, min_size):
+        max_bytes caps the memory used, whatever max_size is; frames are stored as frame_dtype
+        (by default the dtype of the first frame added), e.g. uint8 for screens. The memory
+        must hold at least num_frames + 2 transitions to sample states of num_frames frames.
+    """
+
+    def __init__(self, max_size, min_size, max_bytes=None, frame_dtype=None, num_frames=1):
         self.min_replay_size = min_size
-        self.memory = deque(maxlen=max_size)
+        self.max_size = max_size
+        self.max_bytes = max_bytes
+        self.frame_dtype = frame_dtype
+        self.num_frames = num_frames
+
+        self.capacity = None
+        self.frames = None
+        self.start = 0  # slot of the oldest transition
+        self.size = 0
 
     def __len__(self):
-        return len(self.memory)
+        return self.size
+
+    def _allocate(self, frame):
+        frame = np.asarray(frame)
+        dtype = np.dtype(self.frame_dtype or frame.dtype)
+
+        self.capacity = self.max_size
+        if self.max_bytes is not None:
+            per_transition = frame.size * dtype.itemsize + 4 + 4 + 1
+            self.capacity = min(self.capacity, self.max_bytes // per_transition)
+        if self.capacity < self.num_frames + 2:
+            raise ValueError("Replay memory holds %d transitions, %d are needed to sample "
+                             "states of %d frames." % (self.capacity, self.num_frames + 2,
+                                                       self.num_frames))
+
+        # untouched pages of np.empty are not backed by memory until written
+        self.frames = np.empty((self.capacity,) + frame.shape, dtype=dtype)
+        self.actions = np.empty(self.capacity, dtype=np.int32)
+        self.rewards = np.empty(self.capacity, dtype=np.float32)
+        self.terminals = np.empty(self.capacity, dtype=bool)
 
     def add(self, transition):
-        self.memory.append(transition)
+        frame, action, reward, terminal = transition
+        if self.frames is None:
+            self._allocate(frame)
+
+        if self.size < self.capacity:
+            i = (self.start + self.size) % self.capacity
+            self.size += 1
+        else:  # overwrite the oldest
+            i = self.start
+            self.start = (self.start + 1) % self.capacity
+
+        self.frames[i] = frame
+        self.actions[i] = action
+        self.rewards[i] = reward
+        self.terminals[i] = terminal
+
+    def nbytes(self):
+        if self.frames is None:
+            return 0
+        return self.frames.nbytes + self.actions.nbytes + self.rewards.nbytes + self.terminals.nbytes
 
     def train_agent_batch(self, agent):
-        if len(self.memory) > self.min_replay_size:
+        if len(self) > self.min_replay_size:
             states, targets = self._random_batch(agent)  # get a random batch
             return agent.model.train_on_batch(states, targets)  # ERR?
         else:
             return None
 
+    def _slots(self, idx):
+        # storage slots of the transitions idx, counted from the oldest one
+        return (self.start + idx) % self.capacity
+
+    def _take(self, name, slots):
+        return getattr(self, name)[slots]
+
+    def _sample_windows(self, agent):
+        """
+            Distinct random windows of num_frames + 1 consecutive transitions within one episode,
+            as a (batch_size, num_frames + 1) array of slots, oldest first.
+        """
+        high = len(self) - agent.num_frames - 1
+        if high <= 0:
+            raise ValueError("Not enough transitions in memory to sample from.")
+
+        offsets = np.arange(agent.num_frames + 1)
+        chosen = np.zeros(0, dtype=int)
+        for attempt in range(64):
+            idx = np.concatenate([chosen, agent.rng.randint(0, high, size=2 * agent.batch_size)])
+            # keep the first occurrence of each index, in sampling order
+            _, first = np.unique(idx, return_index=True)
+            idx = idx[np.sort(first)]
+
+            # the window's state must not contain the end of an episode
+            slots = self._slots(idx[:, np.newaxis] + offsets)
+            chosen = idx[~self._take("terminals", slots[:, :-2]).any(axis=1)]
+            if len(chosen) >= agent.batch_size:
+                return self._slots(chosen[:agent.batch_size, np.newaxis] + offsets)
+
+        raise ValueError("Could not sample %d distinct transitions." % agent.batch_size)
+
     def _random_batch(self, agent):
-        inputs = np.zeros(agent.input_shape)
-        targets = np.zeros((agent.batch_size, agent.num_actions))
+        slots = self._sample_windows(agent)
 
-        seen = []
-        idx = agent.rng.randint(
-            0,
-            high=len(
-                self.memory) -
-            agent.num_frames -
-            1)
+        # one gather for all the frames, the states are overlapping windows of it
+        frames = self._take("frames", slots)
+        states = frames[:, :-1].reshape(agent.input_shape)
+        states_next = frames[:, 1:].reshape(agent.input_shape)
 
-        for i in range(agent.batch_size):
-            while idx in seen:
-                idx = agent.rng.randint(0, high=len(
-                    self.memory) - agent.num_frames - 1)
+        # the transition taken from the last frame of each state
+        last = slots[:, -2]
+        actions = self._take("actions", last)
+        rewards = self._take("rewards", last)
+        terminals = self._take("terminals", last)
 
-            states = np.array([self.memory[idx + j][0]
-                               for j in range(agent.num_frames + 1)])
-            art = np.array([self.memory[idx + j][1:]
-                            for j in range(agent.num_frames)])
+        # a single forward pass for the states and the next states
+        q = agent.model.predict(np.concatenate([states, states_next]))
+        targets = q[:agent.batch_size]
+        Q_prime = np.max(q[agent.batch_size:], axis=1)
 
-            actions = art[:, 0].astype(int)
-            rewards = art[:, 1]
-            terminals = art[:, 2]
+        rows = np.arange(agent.batch_size)
+        targets[rows, actions] = rewards + \
+            (1 - terminals) * (agent.discount * Q_prime)
 
-            state = states[:-1]
-            state_next = states[1:]
+        return states, targets
 
-            inputs[i, ...] = state.reshape(agent.state_shape)
-            # we could make zeros but pointless.
-            targets[i] = agent.predict_single(state)
-            Q_prime = np.max(agent.predict_single(state_next))
 
-            targets[i, actions] = rewards + \
-                (1 - terminals) * (agent.discount * Q_prime)
+# Layout of head.npy; frame_shape holds the first frame_ndim dimensions of a frame
+HEAD_MAX_NDIM = 8
+HEAD_DTYPE = np.dtype([("first", np.int64), ("end", np.int64), ("segment_size", np.int64),
+                       ("frame_dtype", "S16"), ("frame_ndim", np.int64),
+                       ("frame_shape", np.int64, (HEAD_MAX_NDIM,))])
 
-            seen.append(idx)
 
-        return inputs, targets
+class MappedReplayMemory(ReplayMemory):
+    """
+        Replay memory stored on disk in memory-mapped .npy files, for runs longer than RAM.
+
+        Transitions are numbered from the start of the run and written into segments of
+        segment_size transitions, each a set of files "<n>-frames.npy", "<n>-actions.npy",
+        "<n>-rewards.npy" and "<n>-terminals.npy" in directory. Once more than max_size
+        transitions are kept the oldest segment is deleted, so between max_size - segment_size
+        and max_size transitions are kept; segment_size is capped at half of max_size.
+
+        head.npy holds the numbers of the oldest kept transition and of the next one to be
+        written, along with the segment size and the frame shape and dtype. It is written
+        with the first transition, and later openers take the layout from it rather than
+        from their own arguments. A transition is counted there only after it has been
+        written, so a learner process opening the same directory with readonly=True samples
+        while a collector appends. Opening a directory that already holds a buffer resumes
+        it, ending the episode that was being written; segments are read from disk as they
+        are sampled and never loaded whole.
+    """
+
+    def __init__(self, directory, max_size, min_size, segment_size=65536,
+                 frame_dtype=None, readonly=False):
+        ReplayMemory.__init__(self, max_size, min_size, frame_dtype=frame_dtype)
+        self.directory = directory
+        self.segment_size = min(segment_size, max(1, max_size // 2))
+        self.frame_shape = None
+        self.readonly = readonly
+
+        self.head = None
+        self.snapshot = None  # (first, end) of the transitions being sampled
+        self.segments = {}  # segment number -> {name: memmap}
+
+        if not readonly and not os.path.isdir(directory):
+            os.makedirs(directory)
+        self._open_head()
+
+    def _path(self, name):
+        return os.path.join(self.directory, name)
+
+    def _open_head(self):
+        path = self._path("head.npy")
+        if not os.path.exists(path):
+            return  # created by the first add()
+        self.head = np.load(path, mmap_mode="r" if self.readonly else "r+")
+
+        # the layout of the files is the one of the collector that created them
+        self.segment_size = int(self.head["segment_size"])
+        self.frame_dtype = np.dtype(self.head["frame_dtype"][()].decode("ascii"))
+        self.frame_shape = tuple(int(v) for v in self.head["frame_shape"][:int(self.head["frame_ndim"])])
+
+        if not self.readonly:
+            if self.max_size < 2 * self.segment_size:
+                raise ValueError("Replay memory in %s has segments of %d transitions, "
+                                 "max_size must be at least %d." % (
+                                     self.directory, self.segment_size, 2 * self.segment_size))
+            if self.head["end"] > self.head["first"]:
+                # the collector may have stopped mid-episode; the next one must not continue it
+                n, i = divmod(int(self.head["end"]) - 1, self.segment_size)
+                self._segment(n)["terminals"][i] = True
+
+    def _create_head(self, frame):
+        frame = np.asarray(frame)
+        if frame.ndim > HEAD_MAX_NDIM:
+            raise ValueError("Frames of %d dimensions do not fit in head.npy, at most %d." % (
+                frame.ndim, HEAD_MAX_NDIM))
+
+        head = np.zeros((), dtype=HEAD_DTYPE)
+        head["segment_size"] = self.segment_size
+        head["frame_dtype"] = np.dtype(self.frame_dtype or frame.dtype).str
+        head["frame_ndim"] = frame.ndim
+        head["frame_shape"][:frame.ndim] = frame.shape
+
+        # created aside then renamed, so that readers never see it half written
+        path = self._path("head.npy")
+        np.save(path + ".tmp.npy", head)
+        os.rename(path + ".tmp.npy", path)
+        self._open_head()
+
+    def __len__(self):
+        if self.snapshot is not None:
+            return self.snapshot[1] - self.snapshot[0]
+        if self.head is None:
+            self._open_head()
+            if self.head is None:  # the collector has not started yet
+                return 0
+        return int(self.head["end"] - self.head["first"])
+
+    def _segment(self, n, frame=None):
+        if n not in self.segments:
+            prefix = "%08d-" % n
+            if frame is None or os.path.exists(self._path(prefix + "frames.npy")):
+                mode = "r" if self.readonly else "r+"
+                self.segments[n] = dict(
+                    (name, np.load(self._path(prefix + name + ".npy"), mmap_mode=mode))
+                    for name in ("frames", "actions", "rewards", "terminals"))
+            else:
+                shapes = {
+                    "frames": ((self.segment_size,) + self.frame_shape, self.frame_dtype),
+                    "actions": ((self.segment_size,), np.int32),
+                    "rewards": ((self.segment_size,), np.float32),
+                    "terminals": ((self.segment_size,), bool),
+                }
+                self.segments[n] = dict(
+                    (name, np.lib.format.open_memmap(
+                        self._path(prefix + name + ".npy"), mode="w+", dtype=dtype, shape=shape))
+                    for name, (shape, dtype) in shapes.items())
+        return self.segments[n]
+
+    def _drop_segment(self, n):
+        segment = self.segments.pop(n, None)
+        if not self.readonly:
+            for name in ("frames", "actions", "rewards", "terminals"):
+                path = self._path("%08d-%s.npy" % (n, name))
+                if os.path.exists(path):
+                    os.remove(path)
+
+    def add(self, transition):
+        if self.readonly:
+            raise ValueError("Cannot add to a replay memory opened readonly.")
+
+        frame, action, reward, terminal = transition
+        if self.head is None:
+            self._create_head(frame)
+        if np.shape(frame) != self.frame_shape:
+            raise ValueError("Frame of shape %s added to a replay memory of %s frames." % (
+                np.shape(frame), self.frame_shape))
+
+        t = int(self.head["end"])
+        n, i = divmod(t, self.segment_size)
+        segment = self._segment(n, frame)
+
+        segment["frames"][i] = frame
+        segment["actions"][i] = action
+        segment["rewards"][i] = reward
+        segment["terminals"][i] = terminal
+        self.head["end"] = t + 1  # publishes the transition
+
+        if i == self.segment_size - 1:
+            segment["frames"].flush()
+        if t + 1 - self.head["first"] > self.max_size:
+            # forget the oldest segment; it is never the one being written
+            oldest = int(self.head["first"]) // self.segment_size
+            self.head["first"] = (oldest + 1) * self.segment_size
+            self._drop_segment(oldest)
+
+    def flush(self):
+        """
+            Writes the pending changes to disk, e.g. before stopping the collector.
+        """
+        for segment in self.segments.values():
+            for array in segment.values():
+                array.flush()
+        if self.head is not None and not self.readonly:
+            self.head.flush()
+
+    def nbytes(self):
+        return sum(array.nbytes for segment in self.segments.values() for array in segment.values())
+
+    def _slots(self, idx):
+        # transition numbers, counted from the oldest one kept
+        return self.snapshot[0] + idx
+
+    def _take(self, name, slots):
+        n, i = np.divmod(slots, self.segment_size)
+        first = self._segment(int(n.flat[0]))[name]
+        out = np.empty(slots.shape + first.shape[1:], dtype=first.dtype)
+        for s in np.unique(n):
+            where = n == s
+            out[where] = self._segment(int(s))[name][i[where]]
+        return out
+
+    def _random_batch(self, agent):
+        for attempt in range(2):
+            # the collector moves the head meanwhile, sample from a fixed range
+            self.snapshot = (int(self.head["first"]), int(self.head["end"]))
+
+            # a reader keeps the segments it has opened; forget the ones the collector deleted
+            oldest = self.snapshot[0] // self.segment_size
+            for n in [n for n in self.segments if n < oldest]:
+                self._drop_segment(n)
+
+            try:
+                return ReplayMemory._random_batch(self, agent)
+            except (IOError, OSError):
+                # the oldest segment was deleted while sampling, draw again
+                if attempt:
+                    raise
+            finally:
+                self.snapshot = None
 
 
 def loop_play_forever(env, agent):
@@ -89,7 +89,7 @@ if __name__ == "__main__":
                   discount, rng, optimizer="sgd_nesterov")
     agent.build_model()
 
-    memory = ReplayMemory(max_memory_size, min_memory_size)
+    memory = ReplayMemory(max_memory_size, min_memory_size, num_frames=num_frames)
 
     env.init()
 
@@ -1 +1,3 @@
 from .ple import PLE
+from .vector import VectorPLE
+from .pipeline import ObservationPipeline
@@ -75,9 +75,16 @@ class DoomWrapper(object):
         else:
             raise ValueError("ViZDoom needs an int passed as rng")
 
+    def enableProfiling(self, profiler):
+        # ViZDoom steps in one call; PLE times it as a whole
+        self.profiler = profiler
+
     def getScreenRGB(self):
         return self.state.image_buffer.copy()
 
+    def getScreenView(self):
+        return self.state.image_buffer
+
     def tick(self, fps):
         time.sleep(1.0/fps) #sleep a bit here (in seconds)
         return fps
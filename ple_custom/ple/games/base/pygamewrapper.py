@@ -87,6 +87,11 @@ class PyGameWrapper(object):
         if draw_screen == True:
             pygame.display.update()
 
+    def _screenSurface(self):
+        if self.screen is not None:
+            return self.screen
+        return pygame.display.get_surface()
+
     def getScreenRGB(self):
         """
         Returns the current game screen in RGB format.
@@ -98,8 +103,23 @@ class PyGameWrapper(object):
 
         """
 
-        return pygame.surfarray.array3d(
-            pygame.display.get_surface()).astype(np.uint8)
+        return pygame.surfarray.array3d(self._screenSurface())
+
+    def getScreenView(self):
+        """
+        Returns the current game screen in RGB format, without copying it.
+
+        The array references the screen's pixels and locks the screen: it
+        must be deleted before the game draws again.
+
+        Returns
+        --------
+        numpy uint8 array
+            Returns a numpy array view with the shape (width, height, 3).
+
+        """
+
+        return pygame.surfarray.pixels3d(self._screenSurface())
 
     def tick(self, fps):
         """
@@ -130,6 +150,22 @@ class PyGameWrapper(object):
         if self.rng is None:
             self.rng = rng
 
+    def enableProfiling(self, profiler):
+        """
+        Turns on per-phase timing of the game step.
+
+        Games that split their step into phase methods override this to
+        wrap those methods with :meth:`Profiler.wrap`, so the step itself
+        stays the same. By default the whole step is only timed by PLE.
+
+        Parameters
+        ----------
+        profiler : ple.profiling.Profiler
+            Collects the phase timings.
+
+        """
+        self.profiler = profiler
+
     def getGameState(self):
         """
         Gets a non-visual state representation of the game.
@@ -174,11 +210,12 @@ class PyGameWrapper(object):
         """
         raise NotImplementedError("Please override this method")
 
-    def reset(self,Gap_Vector,MAX_CONT):#Modificação
+    def reset(self, *args):#Modificação
         """
         Wraps the init() function, can be setup to reset certain poritions of the game only if needed.
+        The arguments are passed on to init() (FlappyBird takes Gap_Vector and MAX_CONT).
         """
-        self.init(Gap_Vector,MAX_CONT)
+        self.init(*args)
 
     def getScore(self):
         """
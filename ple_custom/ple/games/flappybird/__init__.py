@@ -182,9 +182,14 @@ class FlappyBird(base.PyGameWrapper):
     pipe_gap : int (default: 100)
         The gap in pixels left between the top and bottom pipes.
 
+    reset_velocity : bool (default: False)
+        Starts every episode at rest. By default the bird keeps the fall
+        speed it had when the previous episode ended.
+
     """
 
-    def __init__(self,Var=False,Gap_Vector=[],MAX_CONT=0,width=288, height=512, pipe_gap=100):#Modificação
+    def __init__(self,Var=False,Gap_Vector=[],MAX_CONT=0,width=288, height=512, pipe_gap=100,
+                 reset_velocity=False):#Modificação
 
         actions = {
             "up": K_w
@@ -196,6 +201,7 @@ class FlappyBird(base.PyGameWrapper):
         self.MAX_CONT = MAX_CONT
         self.Var = Var
         ################################
+        self.reset_velocity = reset_velocity
 
         pygame.init()
         
@@ -307,6 +313,8 @@ class FlappyBird(base.PyGameWrapper):
         # instead of recreating
         color = self.rng.choice(["red", "blue", "yellow"])
         self.player.init(self.init_pos, color)
+        if self.reset_velocity:
+            self.player.vel = 0.0
 
         self.pipe_color = self.rng.choice(["red", "green"])
         for i, p in enumerate(self.pipe_group):
@@ -416,12 +424,23 @@ class FlappyBird(base.PyGameWrapper):
     def step(self, dt):
         self.game_tick += 1
         dt = dt / 1000.0
-        
+
         self.score += self.rewards["tick"]
 
         # handle player movement
         self._handle_player_events()
-
+        self._check_collisions()
+        self._update_physics(dt)
+        self._draw_scene(dt)
+
+    def enableProfiling(self, profiler):
+        self.profiler = profiler
+        self._handle_player_events = profiler.wrap("flappybird.events", self._handle_player_events)
+        self._check_collisions = profiler.wrap("flappybird.collision", self._check_collisions)
+        self._update_physics = profiler.wrap("flappybird.physics", self._update_physics)
+        self._draw_scene = profiler.wrap("flappybird.draw", self._draw_scene)
+
+    def _check_collisions(self):
         for p in self.pipe_group:
             hit = pygame.sprite.spritecollide(
                 self.player, self.pipe_group, False)
@@ -457,14 +476,14 @@ class FlappyBird(base.PyGameWrapper):
         if self.player.pos_y <= 0:
             self.lives -= 1
 
+    def _update_physics(self, dt):
         self.player.update(dt)
         self.pipe_group.update(dt)#
 
         if self.lives <= 0:
             self.score += self.rewards["loss"]
 
-
-        
+    def _draw_scene(self, dt):
         self.backdrop.draw_background(self.screen)
         self.pipe_group.draw(self.screen)
         self.backdrop.update_draw_base(self.screen, dt)
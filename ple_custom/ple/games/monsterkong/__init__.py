@@ -3,6 +3,8 @@ import pygame
 import sys
 from pygame.constants import K_a, K_d, K_SPACE, K_w, K_s, QUIT, KEYDOWN
 from .board import Board
+from .tileGrid import TileGrid
+from . import assets
 #from ..base import base
 #from ple.games import base
 from ple.games.base.pygamewrapper import PyGameWrapper
@@ -12,13 +14,23 @@ import os
 
 class MonsterKong(PyGameWrapper):
 
-    def __init__(self):
+    def __init__(self, levels="new", level_pool_size=16, level_seed=None):
         """
         Parameters
         ----------
-        None
+        levels : str (default: "new")
+            How a reset picks the level layout. "new" generates a new level on every reset.
+            "keep" generates one level and restarts on it, so only the player, monsters, fireballs,
+            coins, score and lives are reset. "pool" draws each level from a pool generated once.
+
+        level_pool_size : int (default: 16)
+            Number of levels in the pool when levels is "pool".
+
+        level_seed : int (default: None)
+            Seed the level pool is generated from. By default it is drawn from the game's rng.
 
         """
+        assert levels in ("new", "keep", "pool"), "levels must be 'new', 'keep' or 'pool'"
 
         self.height = 465
         self.width = 500
@@ -45,22 +57,49 @@ class MonsterKong(PyGameWrapper):
 
         self._dir = os.path.dirname(os.path.abspath(__file__))
 
-        self.IMAGES = {
-            "right": pygame.image.load(os.path.join(self._dir, 'assets/right.png')),
-            "right2": pygame.image.load(os.path.join(self._dir, 'assets/right2.png')),
-            "left": pygame.image.load(os.path.join(self._dir, 'assets/left.png')),
-            "left2": pygame.image.load(os.path.join(self._dir, 'assets/left2.png')),
-            "still": pygame.image.load(os.path.join(self._dir, 'assets/still.png'))
-        }
+        self.IMAGES = assets.loadImages(self._dir, assets.PLAYER, convert=False)
+
+        self.levels = levels
+        self.level_pool_size = level_pool_size
+        self.level_seed = level_seed
+        self.levelPool = None
+        self.newGame = None
+
+    # Generate the level pool, from its own rng so that it does not depend on how the game was played
+    def _makeLevelPool(self):
+        seed = self.level_seed
+        if seed is None:
+            seed = self.rng.randint(2 ** 31)
+        rng = np.random.RandomState(seed)
+        self.levelPool = [
+            Board(self.width, self.height, self.rewards, rng, self._dir).level
+            for _ in range(self.level_pool_size)]
 
     def init(self):
-        # Create a new instance of the Board class
-        self.newGame = Board(
-            self.width,
-            self.height,
-            self.rewards,
-            self.rng,
-            self._dir)
+        if self.levels == "new" or self.newGame is None and self.levels == "keep":
+            # Create a new instance of the Board class
+            self.newGame = Board(
+                self.width,
+                self.height,
+                self.rewards,
+                self.rng,
+                self._dir)
+        elif self.levels == "keep":
+            self.newGame.restart()
+        else:
+            if self.levelPool is None:
+                self._makeLevelPool()
+            level = self.levelPool[self.rng.randint(len(self.levelPool))]
+            if self.newGame is None:
+                self.newGame = Board(
+                    self.width,
+                    self.height,
+                    self.rewards,
+                    self.rng,
+                    self._dir,
+                    level)
+            else:
+                self.newGame.restart(level)
 
         # Initialize the fireball timer
         self.fireballTimer = 0
@@ -69,6 +108,7 @@ class MonsterKong(PyGameWrapper):
         self.playerGroup = self.newGame.playerGroup
         self.wallGroup = self.newGame.wallGroup
         self.ladderGroup = self.newGame.ladderGroup
+        self.tiles = self.newGame.tiles
 
     def getScore(self):
         return self.newGame.score
@@ -100,21 +140,17 @@ class MonsterKong(PyGameWrapper):
         for coin in self.coinGroup:
             coin.animateCoin()
 
-        # To check collisions below, we move the player downwards then check
-        # and move him back to his original location
-        self.newGame.Players[0].updateY(2)
-        self.laddersCollidedBelow = self.newGame.Players[
-            0].checkCollision(self.ladderGroup)
-        self.wallsCollidedBelow = self.newGame.Players[
-            0].checkCollision(self.wallGroup)
-        self.newGame.Players[0].updateY(-2)
-
-        # To check for collisions above, we move the player up then check and
-        # then move him back down
-        self.newGame.Players[0].updateY(-2)
-        self.wallsCollidedAbove = self.newGame.Players[
-            0].checkCollision(self.wallGroup)
-        self.newGame.Players[0].updateY(2)
+        # Bring the player's rect up to date with his position (he may have
+        # been sent back to the start at the end of the last step)
+        self.newGame.Players[0].setCenter(self.newGame.Players[0].getPosition())
+
+        # Check the tiles just below and just above the player
+        self.laddersCollidedBelow = self.tiles.collideSprite(
+            TileGrid.LADDER, self.newGame.Players[0], dy=2)
+        self.wallsCollidedBelow = self.tiles.collideSprite(
+            TileGrid.WALL, self.newGame.Players[0], dy=2)
+        self.wallsCollidedAbove = self.tiles.collideSprite(
+            TileGrid.WALL, self.newGame.Players[0], dy=-2)
 
         # Sets the onLadder state of the player
         self.newGame.ladderCheck(
@@ -130,8 +166,8 @@ class MonsterKong(PyGameWrapper):
 
             if event.type == KEYDOWN:
                 # Get the ladders collided with the player
-                self.laddersCollidedExact = self.newGame.Players[
-                    0].checkCollision(self.ladderGroup)
+                self.laddersCollidedExact = self.tiles.collideSprite(
+                    TileGrid.LADDER, self.newGame.Players[0])
                 if (event.key == self.actions["jump"] and self.newGame.Players[0].onLadder == 0) or (
                         event.key == self.actions["up"] and self.laddersCollidedExact):
                     # Set the player to move up
@@ -156,8 +192,8 @@ class MonsterKong(PyGameWrapper):
                         # Display the second image for half the cycles
                         self.newGame.Players[0].updateWH(self.IMAGES["right2"], "H",
                                                          self.newGame.Players[0].getSpeed(), 15, 15)
-                    wallsCollidedExact = self.newGame.Players[
-                        0].checkCollision(self.wallGroup)
+                    wallsCollidedExact = self.tiles.collideSprite(
+                        TileGrid.WALL, self.newGame.Players[0])
                     if wallsCollidedExact:
                         # If we have collided a wall, move the player back to
                         # where he was in the last state
@@ -177,8 +213,8 @@ class MonsterKong(PyGameWrapper):
                         # Display the second image for half the cycles
                         self.newGame.Players[0].updateWH(self.IMAGES["left2"], "H",
                                                          -self.newGame.Players[0].getSpeed(), 15, 15)
-                    wallsCollidedExact = self.newGame.Players[
-                        0].checkCollision(self.wallGroup)
+                    wallsCollidedExact = self.tiles.collideSprite(
+                        TileGrid.WALL, self.newGame.Players[0])
                     if wallsCollidedExact:
                         # If we have collided a wall, move the player back to
                         # where he was in the last state
@@ -190,8 +226,8 @@ class MonsterKong(PyGameWrapper):
                         "up"] and self.newGame.Players[0].onLadder:
                     self.newGame.Players[0].updateWH(self.IMAGES["still"], "V",
                                                      -self.newGame.Players[0].getSpeed() / 2, 15, 15)
-                    if len(self.newGame.Players[0].checkCollision(self.ladderGroup)) == 0 or len(
-                            self.newGame.Players[0].checkCollision(self.wallGroup)) != 0:
+                    if len(self.tiles.collideSprite(TileGrid.LADDER, self.newGame.Players[0])) == 0 or len(
+                            self.tiles.collideSprite(TileGrid.WALL, self.newGame.Players[0])) != 0:
                         self.newGame.Players[0].updateWH(self.IMAGES["still"], "V",
                                                          self.newGame.Players[0].getSpeed() / 2, 15, 15)
 
@@ -202,8 +238,7 @@ class MonsterKong(PyGameWrapper):
                                                      self.newGame.Players[0].getSpeed() / 2, 15, 15)
 
         # Update the player's position and process his jump if he is jumping
-        self.newGame.Players[0].continuousUpdate(
-            self.wallGroup, self.ladderGroup)
+        self.newGame.Players[0].continuousUpdate(self.tiles)
 
         '''
         We use cycles to animate the character, when we change direction we also reset the cycles
@@ -227,4 +262,4 @@ class MonsterKong(PyGameWrapper):
 
         # Update all the monsters
         for enemy in self.newGame.Enemies:
-            enemy.continuousUpdate(self.wallGroup, self.ladderGroup)
+            enemy.continuousUpdate(self.tiles)
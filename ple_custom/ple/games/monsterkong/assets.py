@@ -0,0 +1,56 @@
+import os
+import weakref
+
+import pygame
+
+'''
+The asset atlas of MonsterKong.
+Every image is decoded from disk, scaled and converted once per process, then shared by reference between all the
+boards, players, monsters, coins and fireballs. Resetting the game therefore does not touch the disk.
+Images handed out here are shared, so they must never be drawn on.
+'''
+
+# Animation frames of each sprite kind
+BOARD = ("still", "monster0", "princess", "fireballright", "coin1", "wood_block", "ladder")
+PLAYER = ("right", "right2", "left", "left2", "still")
+MONSTER = ("monster0", "monster1", "monster2", "monster3",
+           "monster01", "monster11", "monster21", "monster31",
+           "monsterstill0", "monsterstill10", "monsterstill1", "monsterstill11")
+COIN = ("coin1", "coin2", "coin3", "coin4", "coin5")
+FIREBALL = ("fireballright", "fireballleft")
+
+_images = {}
+_sets = {}
+_scaled = weakref.WeakKeyDictionary()
+
+
+# Load an image from the assets directory, optionally scaled to size and converted for fast blitting
+def loadImage(_dir, name, size=None, convert=True):
+    key = (_dir, name, size, convert)
+    if key not in _images:
+        image = pygame.image.load(os.path.join(_dir, 'assets', name + '.png'))
+        if size is not None:
+            image = pygame.transform.scale(image, size)
+        if convert:
+            image = image.convert_alpha()
+        _images[key] = image
+    return _images[key]
+
+
+# A name -> image dictionary for a set of frames, shared by all the sprites that use it
+def loadImages(_dir, names, size=None, convert=True):
+    key = (_dir, names, size, convert)
+    if key not in _sets:
+        _sets[key] = dict((name, loadImage(_dir, name, size, convert)) for name in names)
+    return _sets[key]
+
+
+# A copy of image scaled to size (and converted), made once per image and size
+def scaledImage(image, size, convert=False):
+    if image not in _scaled:
+        _scaled[image] = {}
+    variants = _scaled[image]
+    if (size, convert) not in variants:
+        scaled = pygame.transform.scale(image, size)
+        variants[(size, convert)] = scaled.convert_alpha() if convert else scaled
+    return variants[(size, convert)]
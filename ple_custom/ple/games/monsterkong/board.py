@@ -10,6 +10,23 @@ from .coin import Coin
 from .player import Player
 from .fireball import Fireball
 from .monsterPerson import MonsterPerson
+from .tileGrid import TileGrid
+from . import assets
+
+
+class Level(object):
+    '''
+    This class holds the layout of a generated level: its map, the wall and ladder sprites with their tile grid,
+    and where its coins start. A board can restart on a level without generating it again.
+    The sprites of a level are never modified, so a level can be shared between boards.
+    '''
+
+    def __init__(self, map, walls, ladders, tiles, coins):
+        self.map = [row[:] for row in map]
+        self.Walls = walls
+        self.Ladders = ladders
+        self.tiles = tiles
+        self.coinPositions = [coin.getPosition() for coin in coins]
 
 
 class Board(object):
@@ -19,7 +36,7 @@ class Board(object):
     The generation of the level also happens in this class.
     '''
 
-    def __init__(self, width, height, rewards, rng, _dir):
+    def __init__(self, width, height, rewards, rng, _dir, level=None):
         self.__width = width
         self.__actHeight = height
         self.__height = self.__actHeight + 10
@@ -30,15 +47,7 @@ class Board(object):
         self.direction = 0
         self._dir = _dir
 
-        self.IMAGES = {
-            "still": pygame.image.load(os.path.join(_dir, 'assets/still.png')).convert_alpha(),
-            "monster0": pygame.image.load(os.path.join(_dir, 'assets/monster0.png')).convert_alpha(),
-            "princess": pygame.image.load(os.path.join(_dir, 'assets/princess.png')).convert_alpha(),
-            "fireballright": pygame.image.load(os.path.join(_dir, 'assets/fireballright.png')).convert_alpha(),
-            "coin1": pygame.image.load(os.path.join(_dir, 'assets/coin1.png')).convert_alpha(),
-            "wood_block": pygame.image.load(os.path.join(_dir, 'assets/wood_block.png')).convert_alpha(),
-            "ladder": pygame.image.load(os.path.join(_dir, 'assets/ladder.png')).convert_alpha()
-        }
+        self.IMAGES = assets.loadImages(_dir, assets.BOARD)
 
         self.white = (255, 255, 255)
 
@@ -59,22 +68,28 @@ class Board(object):
         self.Boards = []
         self.FireballEndpoints = []
 
+        # Initialize the instance groups which we use to display our instances
+        # on the screen. They live as long as the board; events add or remove
+        # single sprites and only a new level refills them
+        self.fireballGroup = pygame.sprite.RenderPlain()
+        self.playerGroup = pygame.sprite.RenderPlain()
+        self.enemyGroup = pygame.sprite.RenderPlain()
+        self.wallGroup = pygame.sprite.RenderPlain()
+        self.ladderGroup = pygame.sprite.RenderPlain()
+        self.coinGroup = pygame.sprite.RenderPlain()
+        self.allyGroup = pygame.sprite.RenderPlain()
+        self.fireballEndpointsGroup = pygame.sprite.RenderPlain()
+
         # Resets the above groups and initializes the game for us
-        self.resetGroups()
+        self.resetGroups(level)
 
-        # Initialize the instance groups which we use to display our instances
-        # on the screen
-        self.fireballGroup = pygame.sprite.RenderPlain(self.Fireballs)
-        self.playerGroup = pygame.sprite.RenderPlain(self.Players)
-        self.enemyGroup = pygame.sprite.RenderPlain(self.Enemies)
-        self.wallGroup = pygame.sprite.RenderPlain(self.Walls)
-        self.ladderGroup = pygame.sprite.RenderPlain(self.Ladders)
-        self.coinGroup = pygame.sprite.RenderPlain(self.Coins)
-        self.allyGroup = pygame.sprite.RenderPlain(self.Allies)
-        self.fireballEndpointsGroup = pygame.sprite.RenderPlain(
-            self.FireballEndpoints)
-
-    def resetGroups(self):
+    # Start over on the current level, or on the given one, without generating a new map
+    def restart(self, level=None):
+        self.cycles = 0
+        self.direction = 0
+        self.resetGroups(level if level is not None else self.level)
+
+    def resetGroups(self, level=None):
         self.score = 0
         self.lives = 3
         self.map = []  # We will create the map again when we reset the game
@@ -99,8 +114,22 @@ class Board(object):
         self.Ladders = []
         self.Fireballs = []
         self.FireballEndpoints = [OnBoard(self.IMAGES["still"], (50, 440))]
-        self.initializeGame()  # This initializes the game and generates our map
-        self.createGroups()  # This creates the instance groups
+        if level is None:
+            self.initializeGame()  # This initializes the game, generates our map and fills the groups
+            self.level = Level(self.map, self.Walls, self.Ladders, self.tiles, self.Coins)
+        else:
+            self.loadLevel(level)
+
+    # Use the layout of a level that was already generated, with its initial coins
+    def loadLevel(self, level):
+        self.level = level
+        self.map = [row[:] for row in level.map]
+        self.Walls = list(level.Walls)
+        self.Ladders = list(level.Ladders)
+        self.tiles = level.tiles
+        self.Coins = [Coin(self.IMAGES["coin1"], position, self._dir)
+                      for position in level.coinPositions]
+        self.createGroups()
 
     # Checks to destroy a fireball when it reaches its terminal point
     def checkFireballDestroy(self, fireball):
@@ -112,28 +141,28 @@ class Board(object):
     # Creates a new fireball and adds it to our fireball group
     def CreateFireball(self, location, monsterIndex):
         if len(self.Fireballs) < len(self.Enemies) * 5:
-            self.Fireballs.append(
-                Fireball(self.IMAGES["fireballright"], (location[0], location[1] + 15), len(self.Fireballs),
-                         2 + len(self.Enemies) / 2, self.rng, self._dir))
+            fireball = Fireball(self.IMAGES["fireballright"], (location[0], location[1] + 15), len(self.Fireballs),
+                                2 + len(self.Enemies) / 2, self.rng, self._dir)
+            self.Fireballs.append(fireball)
+            self.fireballGroup.add(fireball)
             # Starts monster's animation
             self.Enemies[monsterIndex].setStopDuration(15)
             self.Enemies[monsterIndex].setPosition(
                 (self.Enemies[monsterIndex].getPosition()[0], self.Enemies[monsterIndex].getPosition()[1] - 12))
             self.Enemies[monsterIndex].setCenter(
                 self.Enemies[monsterIndex].getPosition())
-            self.createGroups()  # We recreate the groups so the fireball is added
 
     # Destroy a fireball if it has collided with a player or reached its
     # endpoint
     def DestroyFireball(self, index):
         for fireBall in range(len(self.Fireballs)):
             if self.Fireballs[fireBall].index == index:
+                self.fireballGroup.remove(self.Fireballs[fireBall])
                 self.Fireballs.remove(self.Fireballs[fireBall])
                 for fireBallrem in range(
                         len(self.Fireballs)):  # We need to reduce the indices of all fireballs greater than this
                     if self.Fireballs[fireBallrem].index > index:
                         self.Fireballs[fireBallrem].index -= 1
-                self.createGroups()  # Recreate the groups so the fireball is removed
                 break
 
     # Randomly Generate coins in the level where there is a wall below the
@@ -150,13 +179,14 @@ class Board(object):
                         if j - 1 >= 0 and self.map[i][j - 1] == 3:
                             self.map[i][j] = 0
                         if self.map[i][j] == 3:
-                            # Add the coin to our coin list
-                            self.Coins.append(
-                                Coin(
-                                    self.IMAGES["coin1"],
-                                    (j * 15 + 15 / 2,
-                                     i * 15 + 15 / 2),
-                                    self._dir))
+                            # Add the coin to our coin list and group
+                            coin = Coin(
+                                self.IMAGES["coin1"],
+                                (j * 15 + 15 / 2,
+                                 i * 15 + 15 / 2),
+                                self._dir)
+                            self.Coins.append(coin)
+                            self.coinGroup.add(coin)
         if len(
                 self.Coins) <= 15:  # If there are less than 21 coins, we call the function again
             self.GenerateCoins()
@@ -247,6 +277,9 @@ class Board(object):
                             self.IMAGES["ladder"],
                             (y * 15 + 15 / 2,
                              x * 15 + 15 / 2)))
+        # Index the walls and ladders by tile for collision queries
+        self.tiles = TileGrid(
+            {TileGrid.WALL: self.Walls, TileGrid.LADDER: self.Ladders})
 
     # Check if the player is on a ladder or not
     def ladderCheck(self, laddersCollidedBelow,
@@ -265,13 +298,13 @@ class Board(object):
     # Update all the fireball positions and check for collisions with player
     def fireballCheck(self):
         for fireball in self.fireballGroup:
-            fireball.continuousUpdate(self.wallGroup, self.ladderGroup)
+            fireball.continuousUpdate(self.tiles)
             if fireball.checkCollision(self.playerGroup, "V"):
                 self.Fireballs.remove(fireball)
+                self.fireballGroup.remove(fireball)
                 self.Players[0].setPosition((50, 440))
                 self.score += self.rewards["negative"]
                 self.lives += -1
-                self.createGroups()
             self.checkFireballDestroy(fireball)
 
     # Check for coins collided and add the appropriate score
@@ -281,10 +314,9 @@ class Board(object):
             # We also remove the coin entry from our map
             self.map[int((coin.getPosition()[1] - 15 / 2) /
                      15)][int((coin.getPosition()[0] - 15 / 2) / 15)] = 0
-            # Remove the coin entry from our list
+            # Remove the coin entry from our list and group
             self.Coins.remove(coin)
-            # Update the coin group since we modified the coin list
-            self.createGroups()
+            self.coinGroup.remove(coin)
 
     # Check if the player wins
     def checkVictory(self):
@@ -298,8 +330,10 @@ class Board(object):
             # This is just the next level so we only clear the fireballs and
             # regenerate the coins
             self.Fireballs = []
+            self.fireballGroup.empty()
             self.Players[0].setPosition((50, 440))
             self.Coins = []
+            self.coinGroup.empty()
             self.GenerateCoins()
 
             # Add monsters
@@ -311,8 +345,7 @@ class Board(object):
                 self.Enemies.append(
                     MonsterPerson(
                         self.IMAGES["monster0"], (400, 117), self.rng, self._dir))
-            # Create the groups again so the enemies are effected
-            self.createGroups()
+            self.enemyGroup.add(self.Enemies)
 
     # Redraws the entire game screen for us
     def redrawScreen(self, screen, width, height):
@@ -326,17 +359,20 @@ class Board(object):
         self.enemyGroup.draw(screen)
         self.allyGroup.draw(screen)
 
-    # Update all the groups from their corresponding lists
+    # Refill all the groups from their corresponding lists, once per level;
+    # afterwards the groups are kept in step with the lists sprite by sprite
     def createGroups(self):
-        self.fireballGroup = pygame.sprite.RenderPlain(self.Fireballs)
-        self.playerGroup = pygame.sprite.RenderPlain(self.Players)
-        self.enemyGroup = pygame.sprite.RenderPlain(self.Enemies)
-        self.wallGroup = pygame.sprite.RenderPlain(self.Walls)
-        self.ladderGroup = pygame.sprite.RenderPlain(self.Ladders)
-        self.coinGroup = pygame.sprite.RenderPlain(self.Coins)
-        self.allyGroup = pygame.sprite.RenderPlain(self.Allies)
-        self.fireballEndpointsGroup = pygame.sprite.RenderPlain(
-            self.FireballEndpoints)
+        groups = [(self.fireballGroup, self.Fireballs),
+                  (self.playerGroup, self.Players),
+                  (self.enemyGroup, self.Enemies),
+                  (self.wallGroup, self.Walls),
+                  (self.ladderGroup, self.Ladders),
+                  (self.coinGroup, self.Coins),
+                  (self.allyGroup, self.Allies),
+                  (self.fireballEndpointsGroup, self.FireballEndpoints)]
+        for group, sprites in groups:
+            group.empty()
+            group.add(sprites)
 
     '''
     Initialize the game by making the map, generating walls, generating princess chamber, generating ladders randomly,
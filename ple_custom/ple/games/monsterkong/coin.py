@@ -1,7 +1,6 @@
 __author__ = 'Batchu Vishal'
-import pygame
-import os
 from .onBoard import OnBoard
+from . import assets
 
 
 class Coin(OnBoard):
@@ -15,13 +14,7 @@ class Coin(OnBoard):
     def __init__(self, raw_image, position, _dir):
         OnBoard.__init__(self, raw_image, position)
         self.__coinAnimState = 0  # Initialize animation state to 0
-        self.IMAGES = {
-            "coin1": pygame.transform.scale(pygame.image.load(os.path.join(_dir, 'assets/coin1.png')), (15, 15)).convert_alpha(),
-            "coin2": pygame.transform.scale(pygame.image.load(os.path.join(_dir, 'assets/coin2.png')), (15, 15)).convert_alpha(),
-            "coin3": pygame.transform.scale(pygame.image.load(os.path.join(_dir, 'assets/coin3.png')), (15, 15)).convert_alpha(),
-            "coin4": pygame.transform.scale(pygame.image.load(os.path.join(_dir, 'assets/coin4.png')), (15, 15)).convert_alpha(),
-            "coin5": pygame.transform.scale(pygame.image.load(os.path.join(_dir, 'assets/coin5.png')), (15, 15)).convert_alpha()
-        }
+        self.IMAGES = assets.loadImages(_dir, assets.COIN, (15, 15))
 
     # Update the image of the coin
     def updateImage(self, raw_image):
@@ -1,8 +1,9 @@
 __author__ = 'Erilyth'
 import pygame
 import math
-import os
 from .onBoard import OnBoard
+from . import assets
+from .tileGrid import TileGrid
 
 '''
 This class defines all our fireballs.
@@ -22,10 +23,7 @@ class Fireball(OnBoard):
         self.wallsBelow = []
         self.laddersBelow = []
 
-        self.IMAGES = {
-            "fireballright": pygame.transform.scale(pygame.image.load(os.path.join(dir, 'assets/fireballright.png')), (20, 20)).convert_alpha(),
-            "fireballleft": pygame.transform.scale(pygame.image.load(os.path.join(dir, 'assets/fireballleft.png')), (20, 20)).convert_alpha()
-        }
+        self.IMAGES = assets.loadImages(dir, assets.FIREBALL, (20, 20))
         # The newly spawned fireball is not falling
         self.__fall = 0
         # The speed of a fireball is set
@@ -49,13 +47,13 @@ class Fireball(OnBoard):
         return self.__direction
 
     # Moves the fireball in the required direction
-    def continuousUpdate(self, wallGroup, ladderGroup):
+    def continuousUpdate(self, tiles):
 
         # The fireball is falling
         if self.__fall == 1:
             # We move the fireball downwards with speed of self.__speed
             self.update(self.image, "V", self.__speed)
-            if self.checkCollision(wallGroup, "V"):
+            if self.checkTiles(tiles, TileGrid.WALL, "V"):
                 # We have collided with a wall below, so the fireball can stop
                 # falling
                 self.__fall = 0
@@ -66,8 +64,8 @@ class Fireball(OnBoard):
 
             # While we are on the ladder, we use a probability of 4/20 to make
             # the fireball start falling
-            if self.checkCollision(ladderGroup, "V") and len(
-                    self.checkCollision(wallGroup, "V")) == 0:
+            if self.checkTiles(tiles, TileGrid.LADDER, "V") and len(
+                    self.checkTiles(tiles, TileGrid.WALL, "V")) == 0:
                 randVal = int(math.floor(self.rng.rand() * 100)) % 20
                 if randVal < 15:
                     self.__fall = 0
@@ -75,15 +73,15 @@ class Fireball(OnBoard):
                     self.__fall = 1
 
             # We are at the edge of the floor so the fireball starts falling
-            if len(self.checkCollision(ladderGroup, "V")) == 0 and len(
-                    self.checkCollision(wallGroup, "V")) == 0:
+            if len(self.checkTiles(tiles, TileGrid.LADDER, "V")) == 0 and len(
+                    self.checkTiles(tiles, TileGrid.WALL, "V")) == 0:
                 self.__fall = 1
 
             # We are moving right, so update the fireball image to the right
             if self.__direction == 0:
                 self.update(self.IMAGES["fireballright"], "H", self.__speed)
                 # When we hit a wall, we change direction
-                if self.checkCollision(wallGroup, "H"):
+                if self.checkTiles(tiles, TileGrid.WALL, "H"):
                     self.__direction = 1
                     self.update(self.image, "H", -self.__speed)
 
@@ -91,7 +89,7 @@ class Fireball(OnBoard):
             else:
                 self.update(self.IMAGES["fireballleft"], "H", -self.__speed)
                 # When we hit a wall, we change direction
-                if self.checkCollision(wallGroup, "H"):
+                if self.checkTiles(tiles, TileGrid.WALL, "H"):
                     self.__direction = 0
                     self.update(self.image, "H", self.__speed)
 
@@ -132,3 +130,11 @@ class Fireball(OnBoard):
             Colliders = pygame.sprite.spritecollide(self, colliderGroup, False)
             self.update(self.image, "V", -self.__speed)
         return Colliders
+
+    # Same as checkCollision for the walls or ladders of the level, looked up in the tile grid without moving the fireball
+    def checkTiles(self, tiles, kind, direction):
+        if direction == "H":
+            if self.__direction == 0:
+                return tiles.collideSprite(kind, self, dx=self.__speed)  # Right collision
+            return tiles.collideSprite(kind, self, dx=-self.__speed)  # Left collision
+        return tiles.collideSprite(kind, self, dy=self.__speed)  # Bottom collision
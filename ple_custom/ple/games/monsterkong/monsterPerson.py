@@ -1,7 +1,7 @@
 __author__ = 'Erilyth'
-import pygame
-import os
 from .person import Person
+from . import assets
+from .tileGrid import TileGrid
 
 '''
 This class defines all the Monsters present in our game.
@@ -18,20 +18,7 @@ class MonsterPerson(Person):
         self.__direction = int(self.rng.rand() * 100) % 2
         self.__cycles = 0
         self.__stopDuration = 0
-        self.IMAGES = {
-            "monster0": pygame.image.load(os.path.join(dir, 'assets/monster0.png')).convert_alpha(),
-            "monster1": pygame.image.load(os.path.join(dir, 'assets/monster1.png')).convert_alpha(),
-            "monster2": pygame.image.load(os.path.join(dir, 'assets/monster2.png')).convert_alpha(),
-            "monster3": pygame.image.load(os.path.join(dir, 'assets/monster3.png')).convert_alpha(),
-            "monster01": pygame.image.load(os.path.join(dir, 'assets/monster01.png')).convert_alpha(),
-            "monster11": pygame.image.load(os.path.join(dir, 'assets/monster11.png')).convert_alpha(),
-            "monster21": pygame.image.load(os.path.join(dir, 'assets/monster21.png')).convert_alpha(),
-            "monster31": pygame.image.load(os.path.join(dir, 'assets/monster31.png')).convert_alpha(),
-            "monsterstill0": pygame.image.load(os.path.join(dir, 'assets/monsterstill0.png')).convert_alpha(),
-            "monsterstill10": pygame.image.load(os.path.join(dir, 'assets/monsterstill10.png')).convert_alpha(),
-            "monsterstill1": pygame.image.load(os.path.join(dir, 'assets/monsterstill1.png')).convert_alpha(),
-            "monsterstill11": pygame.image.load(os.path.join(dir, 'assets/monsterstill11.png')).convert_alpha()
-        }
+        self.IMAGES = assets.loadImages(dir, assets.MONSTER)
 
     # Getters and Setters
     def getSpeed(self):
@@ -48,24 +35,15 @@ class MonsterPerson(Person):
 
     # Checks for collisions with walls in order to change direction when hit
     # by a wall
-    def checkWall(self, colliderGroup):
+    def checkWall(self, tiles):
         if self.__direction == 0:
             # Right collision with wall
-            self.updateWH(self.image, "H", 20, 40, 40)
-        if self.__direction == 1:
-            # Left collision with wall
-            self.updateWH(self.image, "H", -20, 40, 40)
-        Colliders = pygame.sprite.spritecollide(self, colliderGroup, False)
-        if self.__direction == 0:
-            # Right collision with wall
-            self.updateWH(self.image, "H", -20, 40, 40)
-        if self.__direction == 1:
-            # Left collision with wall
-            self.updateWH(self.image, "H", 20, 40, 40)
-        return Colliders
+            return tiles.collideSprite(TileGrid.WALL, self, dx=20)
+        # Left collision with wall
+        return tiles.collideSprite(TileGrid.WALL, self, dx=-20)
 
     # This is used to animate the monster
-    def continuousUpdate(self, GroupList, GroupList2):
+    def continuousUpdate(self, tiles):
 
         # If the stop duration is 0 then monster is currently moving either
         # left or right
@@ -86,7 +64,7 @@ class MonsterPerson(Person):
                 else:
                     self.updateWH(
                         self.IMAGES["monster3"], "H", self.__speed, 45, 45)
-                if self.checkWall(GroupList):
+                if self.checkWall(tiles):
                     self.__direction = 1
                     self.__cycles = 0
                     self.updateWH(self.image, "H", -self.__speed, 45, 45)
@@ -106,7 +84,7 @@ class MonsterPerson(Person):
                 else:
                     self.updateWH(
                         self.IMAGES["monster31"], "H", -self.__speed, 45, 45)
-                if self.checkWall(GroupList):
+                if self.checkWall(tiles):
                     self.__direction = 0
                     self.__cycles = 0
                     self.updateWH(self.image, "H", self.__speed, 45, 45)
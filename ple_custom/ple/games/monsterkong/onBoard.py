@@ -1,5 +1,6 @@
 __author__ = 'Batchu Vishal'
 import pygame
+from . import assets
 
 
 class OnBoard(pygame.sprite.Sprite):
@@ -12,9 +13,8 @@ class OnBoard(pygame.sprite.Sprite):
     def __init__(self, raw_image, position):
         pygame.sprite.Sprite.__init__(self)
         self.__position = position
-        self.image = raw_image
-        self.image = pygame.transform.scale(self.image,
-                                            (15, 15))  # Image and Rect required for the draw function on sprites
+        # Image and Rect required for the draw function on sprites; the scaled image is shared
+        self.image = assets.scaledImage(raw_image, (15, 15))
         self.rect = self.image.get_rect()
         self.rect.center = self.__position
 
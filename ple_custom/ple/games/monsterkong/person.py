@@ -1,5 +1,6 @@
 __author__ = 'Batchu Vishal'
 import pygame
+from . import assets
 
 '''
 This class defines all living things in the game, ex.Donkey Kong, Player etc
@@ -14,9 +15,7 @@ class Person(pygame.sprite.Sprite):
         self.width = width
         self.height = height
         self.__position = position
-        self.image = raw_image
-        self.image = pygame.transform.scale(
-            self.image, (width, height)).convert_alpha()
+        self.image = assets.scaledImage(raw_image, (width, height), convert=True)
         self.rect = self.image.get_rect()
         self.rect.center = self.__position
 
@@ -65,7 +64,7 @@ class Person(pygame.sprite.Sprite):
 
     # This is another abstract function, and it must be implemented in child
     # classes inheriting from this class
-    def continuousUpdate(self, GroupList, GroupList2):
+    def continuousUpdate(self, tiles):
         # continuousUpdate that gets called frequently for collision checks,
         # movement etc
         raise NotImplementedError("Subclass must implement this")
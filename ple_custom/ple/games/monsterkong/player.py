@@ -1,5 +1,6 @@
 __author__ = 'Batchu Vishal'
 from .person import Person
+from .tileGrid import TileGrid
 
 '''
 This class defines our player.
@@ -27,18 +28,16 @@ class Player(Person):
 
     # This manages the players jump
     # Only the player can jump (For the player's jump)
-    def continuousUpdate(self, wallGroupList, ladderGroupList):
+    def continuousUpdate(self, tiles):
         # Only gets run when the player is not on the ladder
         if self.onLadder == 0:
-            wallsCollided = self.checkCollision(wallGroupList)
+            wallsCollided = tiles.collideSprite(TileGrid.WALL, self)
 
             # If the player is not jumping
             if self.isJumping == 0:
-                # We move down a little and check if we collide with anything
-                self.updateY(2)
-                laddersCollided = self.checkCollision(ladderGroupList)
-                wallsCollided = self.checkCollision(wallGroupList)
-                self.updateY(-2)
+                # We check if we would collide with anything a little below
+                laddersCollided = tiles.collideSprite(TileGrid.LADDER, self, dy=2)
+                wallsCollided = tiles.collideSprite(TileGrid.WALL, self, dy=2)
                 # If we are not colliding with anything below, then we start a
                 # jump with 0 speed so that we just fall down
                 if len(wallsCollided) == 0 and len(laddersCollided) == 0:
@@ -0,0 +1,53 @@
+'''
+This class indexes the static tiles of a level (walls and ladders) by the cells of the 15 pixel grid they lie on.
+Collision queries look up the few cells under a rect instead of testing every wall or ladder sprite on the board.
+It is shared by the Player, the Monsters and the Fireballs.
+'''
+
+
+class TileGrid(object):
+    # Tile kinds, as stored in Board.map
+    WALL = 1
+    LADDER = 2
+
+    def __init__(self, tiles, tileSize=15):
+        '''
+        tiles maps a tile kind to its sprites, in the order of their sprite group.
+        Each sprite is indexed under every cell its rect overlaps.
+        '''
+        self.tileSize = tileSize
+        self.__cells = {}
+        self.__order = {}
+        for kind, sprites in tiles.items():
+            for index, sprite in enumerate(sprites):
+                self.__order[sprite] = index
+                for cell in self.__cellsUnder(sprite.rect):
+                    self.__cells.setdefault((kind,) + cell, []).append(sprite)
+
+    def __cellsUnder(self, rect):
+        for row in range(rect.top // self.tileSize, (rect.bottom - 1) // self.tileSize + 1):
+            for column in range(rect.left // self.tileSize, (rect.right - 1) // self.tileSize + 1):
+                yield row, column
+
+    # The tiles of the given kind colliding with rect, in the order spritecollide would return them from the group
+    def collide(self, kind, rect):
+        if rect.width <= 0 or rect.height <= 0:
+            return []
+        Colliders = set()
+        for cell in self.__cellsUnder(rect):
+            for sprite in self.__cells.get((kind,) + cell, ()):
+                if rect.colliderect(sprite.rect):
+                    Colliders.add(sprite)
+        return sorted(Colliders, key=self.__order.get)
+
+    '''
+    The tiles a sprite collides with once it is moved by (dx, dy) from its position, without actually moving it.
+    The rect is rounded the same way as if the sprite had been moved there.
+    '''
+
+    def collideSprite(self, kind, sprite, dx=0, dy=0):
+        rect = sprite.rect
+        if dx or dy:
+            rect = rect.copy()
+            rect.center = (sprite.getPosition()[0] + dx, sprite.getPosition()[1] + dy)
+        return self.collide(kind, rect)
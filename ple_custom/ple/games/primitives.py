@@ -1,82 +1,152 @@
 import pygame
 import math
+import numpy as np
 from .utils.vec2d import vec2d
+from .utils import round_half_away
 
 
-class Creep(pygame.sprite.Sprite):
+class Creeps():
+    """
+    All the creeps of a game, stored as rows of preallocated arrays.
 
-    def __init__(self,
-                 color,
-                 radius,
-                 pos_init,
-                 dir_init,
-                 speed,
-                 reward,
-                 TYPE,
-                 SCREEN_WIDTH,
-                 SCREEN_HEIGHT,
-                 jitter_speed):
+    Row ``i`` of ``pos``, ``direction``, ``speed``, ``radius``, ``type``,
+    ``reward`` and ``jitter_speed`` describes the ``i``-th creep, in the
+    order they were added. Creeps move, bounce and are tested against the
+    player in single array operations, so no Python object is kept per
+    creep. The buffers double in size when they are full.
+    """
 
-        pygame.sprite.Sprite.__init__(self)
+    _COLUMNS = ("_pos", "_direction", "_speed", "_radius", "_type",
+                "_reward", "_jitter_speed", "_images")
 
+    def __init__(self, SCREEN_WIDTH, SCREEN_HEIGHT, capacity=16):
         self.SCREEN_WIDTH = SCREEN_WIDTH
         self.SCREEN_HEIGHT = SCREEN_HEIGHT
-        self.TYPE = TYPE
-        self.jitter_speed = jitter_speed
-        self.speed = speed
-        self.reward = reward
-        self.radius = radius
-        self.pos = vec2d(pos_init)
-
-        self.direction = vec2d(dir_init)
-        self.direction.normalize()  # normalized
-
-        image = pygame.Surface((radius * 2, radius * 2))
-        image.fill((0, 0, 0))
-        image.set_colorkey((0, 0, 0))
-
-        pygame.draw.circle(
-            image,
-            color,
-            (radius, radius),
-            radius,
-            0
-        )
-
-        self.image = image.convert()
-        self.rect = self.image.get_rect()
-        self.rect.center = pos_init
+        self.count = 0
+
+        self._pos = np.zeros((capacity, 2))
+        self._direction = np.zeros((capacity, 2))
+        self._speed = np.zeros(capacity)
+        self._radius = np.zeros(capacity, dtype=int)
+        self._type = np.zeros(capacity, dtype=int)
+        self._reward = np.zeros(capacity)
+        self._jitter_speed = np.zeros(capacity)
+        self._images = np.empty(capacity, dtype=object)
+        self._surfaces = {}
+
+    # (count, ...) views of the live rows
+    pos = property(lambda self: self._pos[:self.count])
+    direction = property(lambda self: self._direction[:self.count])
+    speed = property(lambda self: self._speed[:self.count])
+    radius = property(lambda self: self._radius[:self.count])
+    type = property(lambda self: self._type[:self.count])
+    reward = property(lambda self: self._reward[:self.count])
+    jitter_speed = property(lambda self: self._jitter_speed[:self.count])
+
+    def __len__(self):
+        return self.count
+
+    def add(self, color, radius, pos_init, dir_init, speed, reward, TYPE,
+            jitter_speed):
+        """Appends a creep; ``TYPE`` is an integer the game gives meaning to."""
+        if self.count == len(self._pos):
+            for name in self._COLUMNS:
+                column = getattr(self, name)
+                setattr(self, name, np.concatenate([column, np.empty_like(column)]))
+
+        i = self.count
+        self.count += 1
+
+        self._pos[i] = pos_init
+        direction = np.asarray(dir_init, dtype=float)
+        self._direction[i] = direction / math.sqrt(
+            direction[0] * direction[0] + direction[1] * direction[1])
+        self._speed[i] = speed
+        self._radius[i] = radius
+        self._type[i] = TYPE
+        self._reward[i] = reward
+        self._jitter_speed[i] = jitter_speed
+        self._images[i] = self._surface(color, radius)
+
+    def _surface(self, color, radius):
+        # creeps of the same color and size share one image
+        key = (tuple(color), int(radius))
+        if key not in self._surfaces:
+            image = pygame.Surface((radius * 2, radius * 2))
+            image.fill((0, 0, 0))
+            image.set_colorkey((0, 0, 0), pygame.RLEACCEL)
+
+            pygame.draw.circle(
+                image,
+                color,
+                (radius, radius),
+                radius,
+                0
+            )
+
+            self._surfaces[key] = image.convert()
+        return self._surfaces[key]
+
+    def remove(self, indices):
+        """Removes the creeps at ``indices``, keeping the others in order."""
+        keep = np.ones(self.count, dtype=bool)
+        keep[indices] = False
+        kept = int(keep.sum())
+        for name in self._COLUMNS:
+            column = getattr(self, name)
+            column[:kept] = column[:self.count][keep]
+        self.count = kept
+
+    def clear(self):
+        self.count = 0
 
     def update(self, dt):
+        pos = self.pos
+        direction = self.direction
+        radius = self.radius[:, np.newaxis]
+        bounds = np.array([self.SCREEN_WIDTH, self.SCREEN_HEIGHT]) - radius
+
+        moved = pos + direction * self.speed[:, np.newaxis] * dt
+        high = moved > bounds
+        low = ~high & (moved <= radius)
+        pos[:] = np.where(high, bounds, np.where(low, radius, moved))
+
+        # a little jitter on every bounce
+        bounce = high | low
+        jitter = (1 + 0.5 * self.jitter_speed)[:, np.newaxis]
+        direction[bounce] = (-1 * direction * jitter)[bounce]
+
+        norm = np.sqrt(direction[:, 0] * direction[:, 0] +
+                       direction[:, 1] * direction[:, 1])
+        direction /= norm[:, np.newaxis]
+
+    def _corners(self):
+        # top left of each creep's rect, rounded the way pygame rounds centers
+        return round_half_away(self.pos) - self.radius[:, np.newaxis]
+
+    def collide(self, rect):
+        """Indices of the creeps whose rect overlaps ``rect``, in order."""
+        if rect.width <= 0 or rect.height <= 0:
+            return np.zeros(0, dtype=int)
+
+        corners = self._corners()
+        size = 2 * self.radius
+        overlap = ((rect.left < corners[:, 0] + size) & (corners[:, 0] < rect.right) &
+                   (rect.top < corners[:, 1] + size) & (corners[:, 1] < rect.bottom) &
+                   (size > 0))
+        return np.flatnonzero(overlap)
+
+    def distances(self, x, y):
+        """Distance from ``(x, y)`` to the center of each creep."""
+        dx = x - self.pos[:, 0]
+        dy = y - self.pos[:, 1]
+        return np.sqrt(dx * dx + dy * dy)
 
-        dx = self.direction.x * self.speed * dt
-        dy = self.direction.y * self.speed * dt
-
-        if self.pos.x + dx > self.SCREEN_WIDTH - self.radius:
-            self.pos.x = self.SCREEN_WIDTH - self.radius
-            self.direction.x = -1 * self.direction.x * \
-                (1 + 0.5 * self.jitter_speed)  # a little jitter
-        elif self.pos.x + dx <= self.radius:
-            self.pos.x = self.radius
-            self.direction.x = -1 * self.direction.x * \
-                (1 + 0.5 * self.jitter_speed)  # a little jitter
-        else:
-            self.pos.x = self.pos.x + dx
-
-        if self.pos.y + dy > self.SCREEN_HEIGHT - self.radius:
-            self.pos.y = self.SCREEN_HEIGHT - self.radius
-            self.direction.y = -1 * self.direction.y * \
-                (1 + 0.5 * self.jitter_speed)  # a little jitter
-        elif self.pos.y + dy <= self.radius:
-            self.pos.y = self.radius
-            self.direction.y = -1 * self.direction.y * \
-                (1 + 0.5 * self.jitter_speed)  # a little jitter
-        else:
-            self.pos.y = self.pos.y + dy
-
-        self.direction.normalize()
-
-        self.rect.center = ((self.pos.x, self.pos.y))
+    def draw(self, screen):
+        corners = self._corners()
+        screen.blits(zip(self._images[:self.count].tolist(),
+                         zip(corners[:, 0].tolist(), corners[:, 1].tolist())),
+                     doreturn=False)
 
 
 class Wall(pygame.sprite.Sprite):
@@ -6,7 +6,7 @@ import math
 from .base.pygamewrapper import PyGameWrapper
 
 from pygame.constants import K_w, K_a, K_s, K_d
-from .primitives import Player, Creep
+from .primitives import Player, Creeps
 from .utils.vec2d import vec2d
 from .utils import percent_round_int
 
@@ -157,8 +157,8 @@ class PuckWorld(PyGameWrapper):
             "player_y": self.player.pos.y,
             "player_velocity_x": self.player.vel.x,
             "player_velocity_y": self.player.vel.y,
-            "good_creep_x": self.good_creep.pos.x,
-            "good_creep_y": self.good_creep.pos.y,
+            "good_creep_x": float(self.creeps.pos[0, 0]),
+            "good_creep_y": float(self.creeps.pos[0, 1]),
             "bad_creep_x": self.bad_creep.pos.x,
             "bad_creep_y": self.bad_creep.pos.y
         }
@@ -193,16 +193,15 @@ class PuckWorld(PyGameWrapper):
             self.width,
             self.height)
 
-        self.good_creep = Creep(
+        self.creeps = Creeps(self.width, self.height, capacity=1)
+        self.creeps.add(
             self.CREEP_GOOD['color'],
             self.CREEP_GOOD['radius'],
             self._rngCreepPos(),
             (1, 1),
             0.0,
             1.0,
-            "GOOD",
-            self.width,
-            self.height,
+            0,
             0.0  # jitter
         )
 
@@ -213,10 +212,6 @@ class PuckWorld(PyGameWrapper):
             self.screen_dim[0] * 0.75,
             self.screen_dim[1] * 0.75)
 
-        self.creeps = pygame.sprite.Group()
-        self.creeps.add(self.good_creep)
-        self.creeps.add(self.bad_creep)
-
         self.score = 0
         self.ticks = 0
         self.lives = -1
@@ -234,9 +229,8 @@ class PuckWorld(PyGameWrapper):
         self._handle_player_events()
         self.player.update(self.dx, self.dy, dt)
 
-        dx = self.player.pos.x - self.good_creep.pos.x
-        dy = self.player.pos.y - self.good_creep.pos.y
-        dist_to_good = math.sqrt(dx * dx + dy * dy)
+        dist_to_good = float(self.creeps.distances(
+            self.player.pos.x, self.player.pos.y)[0])
 
         dx = self.player.pos.x - self.bad_creep.pos.x
         dy = self.player.pos.y - self.bad_creep.pos.y
@@ -252,17 +246,17 @@ class PuckWorld(PyGameWrapper):
 
         if self.ticks % 500 == 0:
             x, y = self._rngCreepPos()
-            self.good_creep.pos.x = x
-            self.good_creep.pos.y = y
+            self.creeps.pos[0] = (x, y)
 
         ndx = 0.0 if dist_to_bad == 0.0 else dx / dist_to_bad
         ndy = 0.0 if dist_to_bad == 0.0 else dy / dist_to_bad
 
         self.bad_creep.update(ndx, ndy, dt)
-        self.good_creep.update(dt)
+        self.creeps.update(dt)
 
         self.player.draw(self.screen)
         self.creeps.draw(self.screen)
+        self.screen.blit(self.bad_creep.image, self.bad_creep.rect)
 
 
 if __name__ == "__main__":
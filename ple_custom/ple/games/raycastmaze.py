@@ -5,6 +5,7 @@ import pygame
 import numpy as np
 import math
 from .raycast import RayCastPlayer
+from .utils.maze import make_maze, MazeIndex
 from pygame.constants import K_w, K_a, K_d, K_s
 
 
@@ -84,50 +85,13 @@ class RaycastMaze(PyGameWrapper, RayCastPlayer):
         self.init_plane = np.array([init_plane], dtype=np.float32)
 
         self.obj_loc = None
+        self.maze = None
         self.map_size = map_size
         self.is_game_over = False
 
     def _make_maze(self, complexity=0.75, density=0.75):
-        """
-            ty wikipedia?
-        """
-        dim = int(np.floor(self.map_size / 2) * 2 + 1)
-        shape = (dim, dim)
-
-        complexity = int(complexity * (5 * (shape[0] + shape[1])))
-        density = int(density * (shape[0] // 2 * shape[1] // 2))
-
-        # Build actual maze
-        Z = np.zeros(shape, dtype=bool)
-        # Fill borders
-        Z[0, :] = Z[-1, :] = 1
-        Z[:, 0] = Z[:, -1] = 1
-        # Make isles
-        for i in range(density):
-            x = self.rng.random_integers(0, shape[1] // 2) * 2
-            y = self.rng.random_integers(0, shape[0] // 2) * 2
-
-            Z[y, x] = 1
-            for j in range(complexity):
-                neighbours = []
-                if x > 1:
-                    neighbours.append((y, x - 2))
-                if x < shape[1] - 2:
-                    neighbours.append((y, x + 2))
-                if y > 1:
-                    neighbours.append((y - 2, x))
-                if y < shape[0] - 2:
-                    neighbours.append((y + 2, x))
-                if len(neighbours):
-                    y_, x_ = neighbours[
-                        self.rng.random_integers(
-                            0, len(neighbours) - 1)]
-                    if Z[y_, x_] == 0:
-                        Z[y_, x_] = 1
-                        Z[y_ + (y - y_) // 2, x_ + (x - x_) // 2] = 1
-                        x, y = x_, y_
-
-        return Z.astype(int)
+        return make_maze(self.map_size, self.rng,
+                         complexity=complexity, density=density)
 
     def getGameState(self):
         """
@@ -148,32 +112,6 @@ class RaycastMaze(PyGameWrapper, RayCastPlayer):
     def game_over(self):
         return self.is_game_over
 
-    def getFiltredPositions(self, pos_input, pos_list, wall_list):
-        pos_check = pos_input['pos']
-        if self.map_[pos_check[0], pos_check[1]] == 0:
-            for y, x in [(0, 0), (-1, 0), (1, 0), (0, -1), (0, 1)]:
-                if self.map_[pos_check[0] + y, pos_check[1] + x] == 0:
-                    # aile
-                    if not any(it for it in pos_list if it['pos'][0] == pos_check[0] + y and it['pos'][1] == pos_check[1] + x):
-                        pos_list.append({
-                            'pos': [pos_check[0] + y, pos_check[1] + x],
-                            'dist': pos_input['dist'] + (0 if (x == 0 and y == 0) else 1),
-                            'checked': (x == 0 and y == 0)
-                        })
-                    else:
-                        for it in pos_list:
-                            if it['pos'][0] == pos_check[0] + y and it['pos'][1] == pos_check[1] + x:
-                                it['checked'] = True
-                                break
-                else:
-                    # wall
-                    if not any(it for it in wall_list if it['pos'][0] == pos_check[0] + y and it['pos'][1] == pos_check[1] + x):
-                        wall_list.append({
-                            'pos': [pos_check[0] + y, pos_check[1] + x],
-                            'dist': pos_input['dist'] + (0 if (x == 0 and y == 0) else 1)
-                        })
-
-
     def init(self):
         self.score = 0 #reset score
         self.is_game_over = False
@@ -183,31 +121,10 @@ class RaycastMaze(PyGameWrapper, RayCastPlayer):
 
         self.map_ = self._make_maze()
 
-        pos_list = []
-        wall_list = []
-        check_list = []
-        pos_input = {
-            'pos': self.pos.astype(np.int)[0],
-            'dist': 0,
-            'checked': False
-        }
-        pos_list.append(pos_input)
-        check_list.append(pos_input)
-        while len(check_list):
-            for pos_each in check_list:
-                self.getFiltredPositions(pos_each, pos_list, wall_list)
-            check_list = [it for it in pos_list if not it['checked']]
-
-
-        available_positions = []
-        for y in range(self.map_size + 1):
-            for x in range(self.map_size + 1):
-                # in a wall
-                if self.map_[y, x] == 1:
-                    # check access to this point
-                    if any(it for it in wall_list if it['dist'] <= self.init_pos_distance_to_target and it['pos'][0] == y and it['pos'][1] == x):
-                        available_positions.append([y,x])
-
+        # lookup tables for the whole episode: target placement, collisions
+        # and nearest-wall queries are array lookups from here on
+        self.maze = MazeIndex(self.map_, self.pos.astype(int)[0])
+        available_positions = self.maze.targets(self.init_pos_distance_to_target)
 
         self.obj_loc = np.array([available_positions[self.rng.randint(0, high=len(available_positions))]])
         self.map_[self.obj_loc[0][0], self.obj_loc[0][1]] = 2
@@ -217,6 +134,23 @@ class RaycastMaze(PyGameWrapper, RayCastPlayer):
             self.dir *= -1.0
             self.plane *= -1.0
 
+    def _pass_through(self, x, y):
+        return not self.maze.is_wall(x, y)
+
+    def nearest_wall(self):
+        """
+        Distance from the player to the closest wall.
+
+        Returns
+        -------
+
+        int
+            City-block distance in grid cells, looked up in the distance
+            transform of the maze.
+
+        """
+        return self.maze.nearest_wall(self.pos[0])
+
     def reset(self):
         self.init()
 
@@ -240,8 +174,8 @@ class RaycastMaze(PyGameWrapper, RayCastPlayer):
 
             for i in range(len(c)):
                 color = (col[i][0], col[i][1], col[i][2])
-                p0 = (c[i], t[i])
-                p1 = (c[i], b[i])
+                p0 = (c[i], t[i, 0])
+                p1 = (c[i], b[i, 0])
 
                 pygame.draw.line(self.screen, color, p0, p1, self.resolution)
 
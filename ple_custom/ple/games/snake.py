@@ -1,13 +1,14 @@
 import pygame
 import sys
 import math
+import numpy as np
 
 #import .base
 from .base.pygamewrapper import PyGameWrapper
 
 from pygame.constants import K_w, K_a, K_s, K_d
 from .utils.vec2d import vec2d
-from .utils import percent_round_int
+from .utils import percent_round_int, round_half_away
 
 
 class Food(pygame.sprite.Sprite):
@@ -39,10 +40,9 @@ class Food(pygame.sprite.Sprite):
         self.rect.center = pos_init
 
     def new_position(self, snake):
-        new_pos = snake.body[0].pos
-        snake_body = [s.pos for s in snake.body]
+        new_pos = vec2d(snake.positions[0])
 
-        while (new_pos in snake_body):
+        while snake.contains(new_pos):
             _x = self.rng.choice(range(
                 self.width * 2, self.SCREEN_WIDTH - self.width * 2, self.width
             ))
@@ -60,81 +60,57 @@ class Food(pygame.sprite.Sprite):
         screen.blit(self.image, self.rect.center)
 
 
-class SnakeSegment(pygame.sprite.Sprite):
-
-    def __init__(self, pos_init, width, height, color):
-        pygame.sprite.Sprite.__init__(self)
-
-        self.pos = vec2d(pos_init)
-        self.color = color
-        self.width = width
-        self.height = height
-
-        image = pygame.Surface((width, height))
-        image.fill((0, 0, 0))
-        image.set_colorkey((0, 0, 0))
-
-        pygame.draw.rect(
-            image,
-            color,
-            (0, 0, self.width, self.height),
-            0
-        )
-
-        self.image = image
-        # use half the size
-        self.rect = pygame.Rect(pos_init, (self.width / 2, self.height / 2))
-        self.rect.center = pos_init
-
-    def draw(self, screen):
-        screen.blit(self.image, self.rect.center)
-
-
-# basically just holds onto all of them
 class SnakePlayer():
+    """
+    The snake, with its segments stored as rows of preallocated arrays.
+
+    Row 0 is the head. Every frame each segment moves towards the one in
+    front of it in a single array operation, and the head is tested
+    against the whole body with array math, so no Python object is kept
+    per segment. The buffers double in size when the snake outgrows them.
+    """
 
     def __init__(self, speed, length, pos_init, width,
                  color, SCREEN_WIDTH, SCREEN_HEIGHT):
         self.dir = vec2d((1, 0))
         self.speed = speed
-        self.pos = vec2d(pos_init)
         self.color = color
         self.width = width
         self.length = length
-        self.body = []
-        self.update_head = True
+
+        capacity = max(16, 2 * length)
+        self.positions = np.zeros((capacity, 2))
+        self.colors = np.zeros((capacity, 3), dtype=int)
+        self.images = np.empty(capacity, dtype=object)
+        self._surfaces = {}
 
         # build our body up
-        for i in range(self.length):
-            self.body.append(
-                # makes a neat "zapping" in effect
-                SnakeSegment(
-                            (self.pos.x - (width) * i, self.pos.y),
-                    self.width,
-                    self.width,
-                    tuple([c - 100 for c in self.color]
-                          ) if i == 0 else self.color
-                )
-            )
-        # we dont add the first few because it cause never actually hit it
-        self.body_group = pygame.sprite.Group()
-        self.head = self.body[0]
+        self.positions[:length, 0] = pos_init[0] - width * np.arange(length)
+        self.positions[:length, 1] = pos_init[1]
+        for i in range(length):
+            # makes a neat "zapping" in effect
+            self._set_color(i, [c - 100 for c in self.color] if i == 0 else self.color)
 
-    def update(self, dt):
-        for i in range(self.length - 1, 0, -1):
-            scale = 0.1
-
-            self.body[i].pos = vec2d((
-                ((1.0 - scale) *
-                 self.body[i - 1].pos.x + scale * self.body[i].pos.x),
-                ((1.0 - scale) *
-                 self.body[i - 1].pos.y + scale * self.body[i].pos.y)
-            ))
+        # hit boxes of the body segments are half their size; we dont test
+        # the first few segments because the head can never actually hit them
+        self.segment_size = pygame.Rect((0, 0), (width / 2, width / 2)).size
+        self.collide_from = max(length, 3)
+
+        self.head_rect = pygame.Rect(pos_init, self.segment_size)
+        self.head_rect.center = pos_init
 
-            self.body[i].rect.center = (self.body[i].pos.x, self.body[i].pos.y)
+    @property
+    def body(self):
+        """(length, 2) view of the segment positions, head first."""
+        return self.positions[:self.length]
 
-        self.head.pos.x += self.dir.x * self.speed * dt
-        self.head.pos.y += self.dir.y * self.speed * dt
+    def update(self, dt):
+        scale = 0.1
+        body = self.body
+        body[1:] = (1.0 - scale) * body[:-1] + scale * body[1:]
+
+        self.positions[0, 0] += self.dir.x * self.speed * dt
+        self.positions[0, 1] += self.dir.y * self.speed * dt
         self.update_hitbox()
 
     def update_hitbox(self):
@@ -142,8 +118,7 @@ class SnakePlayer():
         # instead of counting the entire head square as a hit box, since
         # the head touchs the body on turns and causes game overs.
 
-        x = self.head.pos.x
-        y = self.head.pos.y
+        x, y = self.positions[0]
 
         if self.dir.x == 0:
             w = self.width
@@ -165,44 +140,59 @@ class SnakePlayer():
             if self.dir.x == -1:
                 x -= percent_round_int(self.width, 0.25)
 
-        if self.update_head:
-            image = pygame.Surface((w, h))
-            image.fill((0, 0, 0))
-            image.set_colorkey((0, 0, 0))
-
-            pygame.draw.rect(
-                image,
-                (255, 0, 0),
-                (0, 0, w, h),
-                0
-            )
-
-            self.head.image = image
-            self.head.rect = self.head.image.get_rect()
-            self.update_head = False
-
-        self.head.rect.center = (x, y)
+        self.head_rect = pygame.Rect(0, 0, w, h)
+        self.head_rect.center = (x, y)
 
     def grow(self):
+        if self.length == len(self.positions):
+            self.positions = np.concatenate([self.positions, np.zeros_like(self.positions)])
+            self.colors = np.concatenate([self.colors, np.zeros_like(self.colors)])
+            self.images = np.concatenate([self.images, np.empty_like(self.images)])
+
         self.length += 1
         add = 100 if self.length % 2 == 0 else -100
-        color = (self.color[0] + add, self.color[1], self.color[2] + add)
-        last = self.body[-1].pos
-
-        self.body.append(
-            SnakeSegment(
-                        (last.x, last.y),  # initially off screen?
-                self.width,
-                self.width,
-                color
-            )
-        )
-        if self.length > 3:  # we cant actually hit another segment until this point.
-            self.body_group.add(self.body[-1])
+        self._set_color(self.length - 1, (self.color[0] + add, self.color[1], self.color[2] + add))
+        # starts on top of the last segment
+        self.positions[self.length - 1] = self.positions[self.length - 2]
+
+    def contains(self, pos):
+        """Whether a segment is exactly at ``pos``."""
+        body = self.body
+        return bool(np.any((body[:, 0] == pos.x) & (body[:, 1] == pos.y)))
+
+    def collides(self):
+        """Whether the head hit box overlaps the hit box of a body segment."""
+        w, h = self.segment_size
+        if self.length <= self.collide_from or w <= 0 or h <= 0:
+            return False
+
+        centers = round_half_away(self.positions[self.collide_from:self.length])
+        left = centers[:, 0] - w // 2
+        top = centers[:, 1] - h // 2
+        head = self.head_rect
+        return bool(np.any((head.left < left + w) & (left < head.right) &
+                           (head.top < top + h) & (top < head.bottom)))
+
+    def _set_color(self, i, color):
+        # segments of the same color share one image
+        color = tuple(color)
+        if color not in self._surfaces:
+            image = pygame.Surface((self.width, self.width))
+            image.fill(color)
+            self._surfaces[color] = image
+        self.colors[i] = color
+        self.images[i] = self._surfaces[color]
 
     def draw(self, screen):
-        for b in self.body[::-1]:
-            b.draw(screen)
+        # segments are drawn from their rounded center, tail first
+        corners = round_half_away(self.body[:0:-1])
+        screen.blits(zip(self.images[self.length - 1:0:-1].tolist(),
+                         zip(corners[:, 0].tolist(), corners[:, 1].tolist())),
+                     doreturn=False)
+
+        head = pygame.Surface(self.head_rect.size)
+        head.fill((255, 0, 0))
+        screen.blit(head, self.head_rect.center)
 
 
 class Snake(PyGameWrapper):
@@ -272,8 +262,6 @@ class Snake(PyGameWrapper):
                 if key == self.actions["down"] and self.player.dir.y != -1:
                     self.player.dir = vec2d((0, 1))
 
-                self.player.update_head = True
-
     def getGameState(self):
         """
 
@@ -291,21 +279,17 @@ class Snake(PyGameWrapper):
 
         """
 
+        body = self.player.body
+        head = body[0]
         state = {
-            "snake_head_x": self.player.head.pos.x,
-            "snake_head_y": self.player.head.pos.y,
+            "snake_head_x": head[0],
+            "snake_head_y": head[1],
             "food_x": self.food.pos.x,
             "food_y": self.food.pos.y,
-            "snake_body": [],
-            "snake_body_pos": [],
+            "snake_body": np.sqrt(((body - head) ** 2).sum(axis=1)).tolist(),
+            "snake_body_pos": body.tolist(),
         }
 
-        for s in self.player.body:
-            dist = math.sqrt((self.player.head.pos.x - s.pos.x)
-                             ** 2 + (self.player.head.pos.y - s.pos.y)**2)
-            state["snake_body"].append(dist)
-            state["snake_body_pos"].append([s.pos.x, s.pos.y])
-
         return state
 
     def getScore(self):
@@ -354,25 +338,24 @@ class Snake(PyGameWrapper):
         self._handle_player_events()
         self.score += self.rewards["tick"]
 
-        hit = pygame.sprite.collide_rect(self.player.head, self.food)
+        hit = self.player.head_rect.colliderect(self.food.rect)
         if hit:  # it hit
             self.score += self.rewards["positive"]
             self.player.grow()
             self.food.new_position(self.player)
 
-        hits = pygame.sprite.spritecollide(
-            self.player.head, self.player.body_group, False)
-        if len(hits) > 0:
+        if self.player.collides():
             self.lives = -1
 
+        head_x, head_y = self.player.positions[0]
         x_check = (
-            self.player.head.pos.x < 0) or (
-            self.player.head.pos.x +
+            head_x < 0) or (
+            head_x +
             self.player_width /
             2 > self.width)
         y_check = (
-            self.player.head.pos.y < 0) or (
-            self.player.head.pos.y +
+            head_y < 0) or (
+            head_y +
             self.player_width /
             2 > self.height)
 
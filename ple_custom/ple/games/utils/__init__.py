@@ -3,3 +3,9 @@ import numpy as np
 
 def percent_round_int(percent, x):
     return np.round(percent * x).astype(int)
+
+
+def round_half_away(values):
+    # pygame rounds float rect coordinates half away from zero
+    values = np.asarray(values)
+    return np.where(values >= 0, np.floor(values + 0.5), np.ceil(values - 0.5)).astype(int)
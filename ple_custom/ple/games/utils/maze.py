@@ -0,0 +1,208 @@
+import numpy as np
+
+# Neighbour offsets in (row, column) order: up, down, left, right
+NEIGHBOURS = ((-1, 0), (1, 0), (0, -1), (0, 1))
+
+
+def make_maze(map_size, rng, complexity=0.75, density=0.75):
+    """
+    Generates a random maze with array operations.
+
+    Walls grow from ``density`` random isles at once: at each of the
+    ``complexity`` steps every isle extends two cells towards a random
+    neighbour cell that is still free, so the work per step is one set of
+    array operations over all isles. When several isles head for the same
+    cell only one of them grows, so the walls stay trees and every corridor
+    cell remains reachable.
+
+    Parameters
+    ----------
+    map_size : int
+        Size of the maze; the grid is ``floor(map_size / 2) * 2 + 1`` cells wide.
+
+    rng : numpy.random.RandomState
+        Random number generator.
+
+    complexity, density : float
+        Length and number of the wall segments, relative to the maze size.
+
+    Returns
+    -------
+    numpy.ndarray
+        (dim, dim) int grid with 1 for walls and 0 for corridors.
+
+    """
+    dim = int(np.floor(map_size / 2) * 2 + 1)
+    half = dim // 2
+
+    complexity = int(complexity * (5 * (dim + dim)))
+    density = int(density * (half * half))
+
+    grid = np.zeros((dim, dim), dtype=bool)
+    grid[0, :] = grid[-1, :] = True
+    grid[:, 0] = grid[:, -1] = True
+
+    # isles start on even cells
+    y = rng.randint(0, half + 1, size=density) * 2
+    x = rng.randint(0, half + 1, size=density) * 2
+    grid[y, x] = True
+
+    offsets = np.array(NEIGHBOURS) * 2
+    for _ in range(complexity):
+        if not density:
+            break
+
+        # pick a random in-bounds neighbour two cells away
+        ny = y[:, np.newaxis] + offsets[:, 0]
+        nx = x[:, np.newaxis] + offsets[:, 1]
+        valid = (ny >= 0) & (ny < dim) & (nx >= 0) & (nx < dim)
+        choice = np.argmax(rng.random_sample(valid.shape) * valid, axis=1)
+        rows = np.arange(density)
+        ny, nx = ny[rows, choice], nx[rows, choice]
+
+        # only the first isle heading for a free cell claims it; two walls
+        # entering the same cell would join two wall trees and close off
+        # the corridors between them
+        grow = ~grid[ny, nx]
+        _, first = np.unique(ny * dim + nx, return_index=True)
+        claimed = np.zeros(density, dtype=bool)
+        claimed[first] = True
+        grow &= claimed
+        grid[ny[grow], nx[grow]] = True
+        grid[(ny[grow] + y[grow]) // 2, (nx[grow] + x[grow]) // 2] = True
+        y[grow], x[grow] = ny[grow], nx[grow]
+
+    return grid.astype(int)
+
+
+def _shifted(array, dy, dx, fill):
+    # out[r, c] = array[r + dy, c + dx], ``fill`` outside the grid
+    out = np.full_like(array, fill)
+    h, w = array.shape
+    out[max(0, -dy):h - max(0, dy), max(0, -dx):w - max(0, dx)] = \
+        array[max(0, dy):h - max(0, -dy), max(0, dx):w - max(0, -dx)]
+    return out
+
+
+class MazeIndex(object):
+    """
+    Spatial lookup tables of a maze grid, built once per maze.
+
+    Every query is then a constant-time array lookup, whatever the maze size.
+
+    Parameters
+    ----------
+    grid : numpy.ndarray
+        (rows, columns) grid, values > 0 are walls.
+
+    start : tuple of int
+        (row, column) cell path distances are measured from.
+
+    Attributes
+    ----------
+    wall : numpy.ndarray
+        True on wall cells.
+
+    wall_distance : numpy.ndarray
+        City-block distance from each cell to the nearest wall (0 on walls).
+
+    wall_neighbours : numpy.ndarray
+        Bit mask of the walls around each cell: 1 up, 2 down, 4 left, 8 right.
+
+    path_distance : numpy.ndarray
+        Number of steps from ``start`` to each corridor cell, or to touch
+        each wall cell from a corridor; -1 where it cannot be reached.
+
+    """
+
+    def __init__(self, grid, start):
+        self.grid = grid
+        self.wall = grid > 0
+        self.start = tuple(int(v) for v in start)
+
+        self.wall_neighbours = np.zeros(grid.shape, dtype=np.uint8)
+        for bit, (dy, dx) in enumerate(NEIGHBOURS):
+            self.wall_neighbours |= (_shifted(self.wall, dy, dx, True)
+                                     << bit).astype(np.uint8)
+
+        self.wall_distance = self._distance_transform()
+        self.path_distance = self._path_distances()
+
+    def _distance_transform(self):
+        # multi-source breadth-first search from all walls at once; one
+        # dilation per distance, which stays small in a maze
+        distance = np.where(self.wall, 0, -1)
+        frontier = self.wall
+        d = 0
+        while True:
+            grown = np.zeros_like(frontier)
+            for dy, dx in NEIGHBOURS:
+                grown |= _shifted(frontier, dy, dx, False)
+            frontier = grown & (distance < 0)
+            if not frontier.any():
+                return distance
+            d += 1
+            distance[frontier] = d
+
+    def _path_distances(self):
+        # breadth-first search over flat cell indices, expanding the whole
+        # frontier with array operations at each step
+        rows, columns = self.grid.shape
+        free = ~self.wall.ravel()
+        distance = np.full(rows * columns, -1)
+
+        start = self.start[0] * columns + self.start[1]
+        distance[start] = 0
+        if free[start]:
+            # borders are walls (or the frontier stays off them), so the
+            # flat offsets never wrap around a row
+            offsets = np.array([dy * columns + dx for dy, dx in NEIGHBOURS])
+            frontier = np.array([start])
+            d = 0
+            while frontier.size:
+                d += 1
+                candidates = (frontier[:, np.newaxis] + offsets).ravel()
+                candidates = candidates[(candidates >= 0) & (candidates < distance.size)]
+                candidates = np.unique(candidates)
+                frontier = candidates[free[candidates] & (distance[candidates] < 0)]
+                distance[frontier] = d
+        distance = distance.reshape(rows, columns)
+
+        # walls are touched one step after their nearest reachable corridor
+        unreached = distance.size
+        reach = np.where((distance >= 0) & ~self.wall, distance, unreached)
+        touch = np.full_like(reach, unreached)
+        for dy, dx in NEIGHBOURS:
+            touch = np.minimum(touch, _shifted(reach, dy, dx, unreached))
+        walls = self.wall & (touch < unreached)
+        distance[walls] = touch[walls] + 1
+        return distance
+
+    def cell(self, pos):
+        """Grid cell (row, column) containing a continuous position."""
+        return int(pos[0]), int(pos[1])
+
+    def is_wall(self, row, column):
+        """Whether the cell is a wall; cells outside the grid count as walls."""
+        if 0 <= row < self.wall.shape[0] and 0 <= column < self.wall.shape[1]:
+            return bool(self.wall[row, column])
+        return True
+
+    def nearest_wall(self, pos):
+        """City-block distance in cells from a position's cell to the nearest wall."""
+        row, column = self.cell(pos)
+        return int(self.wall_distance[row, column])
+
+    def targets(self, max_distance):
+        """
+        Wall cells that can be touched within ``max_distance`` steps of the start.
+
+        Returns
+        -------
+        numpy.ndarray
+            (K, 2) (row, column) cells in row-major order.
+
+        """
+        reachable = self.wall & (self.path_distance >= 0) & \
+            (self.path_distance <= max_distance)
+        return np.argwhere(reachable)
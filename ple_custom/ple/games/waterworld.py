@@ -8,7 +8,7 @@ from .base.pygamewrapper import PyGameWrapper
 from .utils.vec2d import vec2d
 from .utils import percent_round_int
 from pygame.constants import K_w, K_a, K_s, K_d
-from .primitives import Player, Creep
+from .primitives import Player, Creeps
 
 
 class WaterWorld(PyGameWrapper):
@@ -93,7 +93,6 @@ class WaterWorld(PyGameWrapper):
     def _add_creep(self):
         creep_type = self.rng.choice([0, 1])
 
-        creep = None
         pos = (0, 0)
         dist = 0.0
 
@@ -103,21 +102,17 @@ class WaterWorld(PyGameWrapper):
             dist = math.sqrt(
                 (self.player.pos.x - pos[0])**2 + (self.player.pos.y - pos[1])**2)
 
-        creep = Creep(
+        self.creeps.add(
             self.CREEP_COLORS[creep_type],
             self.CREEP_RADII[creep_type],
             pos,
             self.rng.choice([-1, 1], 2),
             self.rng.rand() * self.CREEP_SPEED,
             self.CREEP_REWARD[creep_type],
-            self.CREEP_TYPES[creep_type],
-            self.width,
-            self.height,
+            creep_type,
             self.rng.rand()
         )
 
-        self.creeps.add(creep)
-
         self.creep_counts[self.CREEP_TYPES[creep_type]] += 1
 
     def getGameState(self):
@@ -151,11 +146,11 @@ class WaterWorld(PyGameWrapper):
             }
         }
 
-        for c in self.creeps:
-            dist = math.sqrt((self.player.pos.x - c.pos.x) **
-                             2 + (self.player.pos.y - c.pos.y)**2)
-            state["creep_dist"][c.TYPE].append(dist)
-            state["creep_pos"][c.TYPE].append([c.pos.x, c.pos.y])
+        dist = self.creeps.distances(self.player.pos.x, self.player.pos.y)
+        for i, name in enumerate(self.CREEP_TYPES):
+            of_type = self.creeps.type == i
+            state["creep_dist"][name] = dist[of_type].tolist()
+            state["creep_pos"][name] = self.creeps.pos[of_type].tolist()
 
         return state
 
@@ -186,9 +181,10 @@ class WaterWorld(PyGameWrapper):
             self.player.vel = vec2d((0.0, 0.0))
 
         if self.creeps is None:
-            self.creeps = pygame.sprite.Group()
+            self.creeps = Creeps(self.width, self.height,
+                                 capacity=max(16, self.N_CREEPS))
         else:
-            self.creeps.empty()
+            self.creeps.clear()
 
         for i in range(self.N_CREEPS):
             self._add_creep()
@@ -209,10 +205,13 @@ class WaterWorld(PyGameWrapper):
         self._handle_player_events()
         self.player.update(self.dx, self.dy, dt)
 
-        hits = pygame.sprite.spritecollide(self.player, self.creeps, True)
-        for creep in hits:
-            self.creep_counts[creep.TYPE] -= 1
-            self.score += creep.reward
+        hits = self.creeps.collide(self.player.rect)
+        types = self.creeps.type[hits].tolist()
+        rewards = self.creeps.reward[hits].tolist()
+        self.creeps.remove(hits)
+        for creep_type, reward in zip(types, rewards):
+            self.creep_counts[self.CREEP_TYPES[creep_type]] -= 1
+            self.score += reward
             self._add_creep()
 
         if self.creep_counts["GOOD"] == 0:
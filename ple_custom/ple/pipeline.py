@@ -0,0 +1,187 @@
+import numpy as np
+
+from .screen import grayscale as _grayscale
+
+
+class FrameStack(object):
+    """
+    The last ``k`` frames of an episode, in a mirrored ring buffer.
+
+    Each frame is stored twice, at slot ``i`` and ``i + k`` of a ``2k`` slot
+    buffer, so the last ``k`` frames always form the contiguous slice
+    ``[i + 1, i + 1 + k)``. :meth:`get` returns that slice as a view,
+    oldest frame first, so no history is copied to stack it.
+
+    Parameters
+    ----------
+    k : int
+        Number of frames in a stack.
+
+    frame_shape : tuple of int
+        Shape of one frame.
+
+    dtype : numpy dtype
+        Type of the frames.
+
+    """
+
+    def __init__(self, k, frame_shape, dtype):
+        self.k = k
+        self.buffer = np.zeros((2 * k,) + tuple(frame_shape), dtype=dtype)
+        self.index = k - 1  # slot of the newest frame
+
+    def slot(self):
+        """View of the slot the next frame goes into; call :meth:`commit` once it is written."""
+        return self.buffer[(self.index + 1) % self.k]
+
+    def commit(self):
+        """Makes the frame written into :meth:`slot` the newest one."""
+        self.index = (self.index + 1) % self.k
+        self.buffer[self.index + self.k] = self.buffer[self.index]
+
+    def push(self, frame):
+        """Adds a frame, dropping the oldest one."""
+        self.slot()[...] = frame
+        self.commit()
+
+    def fill(self):
+        """Repeats the newest frame over the whole stack, as at the start of an episode."""
+        self.buffer[:] = self.buffer[self.index]
+
+    def get(self):
+        """
+        The last ``k`` frames.
+
+        Returns
+        -------
+        numpy array
+            (k,) + frame_shape view, oldest frame first. It is overwritten
+            as frames are pushed, so copy it to keep it.
+
+        """
+        return self.buffer[self.index + 1:self.index + 1 + self.k]
+
+
+class ObservationPipeline(object):
+    """
+    ple.ObservationPipeline(
+        source="screen", grayscale=False,
+        crop=None, resize=None,
+        normalize=False, stack=1
+    )
+
+    Turns what PLE observes after each action into the input of an agent:
+    the screen is cropped, resized, converted to grayscale and normalized,
+    then the last ``stack`` observations are kept in a :class:`FrameStack`.
+
+    Cropping is a view of the screen and resizing reads only the pixels it
+    keeps; each observation is then written once, straight into the stack.
+    Give the pipeline to :class:`PLE` as ``observation_pipeline`` and read
+    the stacked observation with :meth:`PLE.getObservation`.
+
+    Parameters
+    ----------
+    source: str (default: "screen")
+        "screen" for the game screen or "state" for the vector returned by
+        :meth:`PLE.getGameState`, which needs a ``state_preprocessor``.
+
+    grayscale: bool (default: False)
+        Converts the screen to grayscale.
+
+    crop: tuple of int or None (default: None)
+        (left, top, right, bottom) box of the screen to keep.
+
+    resize: tuple of int or None (default: None)
+        (width, height) the screen is resized to, by nearest neighbour.
+
+    normalize: bool (default: False)
+        Scales screen values to float32 in [0, 1].
+
+    stack: int (default: 1)
+        Number of consecutive observations returned together.
+
+    """
+
+    def __init__(self, source="screen", grayscale=False, crop=None,
+                 resize=None, normalize=False, stack=1):
+        if source not in ("screen", "state"):
+            raise ValueError("Unknown observation source %r." % source)
+        if source == "state" and (grayscale or crop or resize or normalize):
+            raise ValueError(
+                "State observations can only be stacked, not processed as images.")
+
+        self.source = source
+        self.grayscale = grayscale
+        self.crop = crop
+        self.resize = resize
+        self.normalize = normalize
+        self.stack = stack
+        self.frames = None
+
+    def bind(self, env):
+        """
+        Allocates the buffers for the observations of a PLE environment and
+        starts an episode.
+        """
+        if self.source == "state":
+            self.frames = FrameStack(self.stack, env.getGameStateDims(), np.float64)
+            self.reset(env)
+            return
+
+        width, height = env.getScreenDims()
+        if self.crop is not None:
+            left, top, right, bottom = self.crop
+            width, height = right - left, bottom - top
+
+        self._columns = None
+        if self.resize is not None:
+            # source pixel of each output pixel
+            self._columns = (np.arange(self.resize[0]) * width // self.resize[0])[:, np.newaxis]
+            self._rows = (np.arange(self.resize[1]) * height // self.resize[1])[np.newaxis, :]
+            width, height = self.resize
+
+        shape = (width, height) if self.grayscale else (width, height, 3)
+        self.frames = FrameStack(self.stack, shape, np.float32 if self.normalize else np.uint8)
+
+        self._pixels = np.empty(shape, dtype=np.uint8) if self.normalize else None
+        self._scratch = np.empty((2, width, height), dtype=np.uint16) if self.grayscale else None
+        self.reset(env)
+
+    def _observe(self, env, out):
+        if self.source == "state":
+            out[...] = env.getGameState()
+            return
+
+        screen = env.getScreenView()
+        if self.crop is not None:
+            left, top, right, bottom = self.crop
+            screen = screen[left:right, top:bottom]
+        if self._columns is not None:
+            screen = screen[self._columns, self._rows]
+
+        pixels = out if self._pixels is None else self._pixels
+        if self.grayscale:
+            _grayscale(screen, pixels, self._scratch)
+        else:
+            pixels[...] = screen
+        del screen  # unlocks the game screen
+
+        if self._pixels is not None:
+            np.multiply(pixels, 1.0 / 255.0, out=out)
+
+    def reset(self, env):
+        """Starts an episode: the stack is filled with the current observation."""
+        self._observe(env, self.frames.slot())
+        self.frames.commit()
+        self.frames.fill()
+
+    def push(self, env):
+        """Adds the current observation to the stack."""
+        self._observe(env, self.frames.slot())
+        self.frames.commit()
+
+    def get(self):
+        """
+        The last ``stack`` observations, as a view (see :meth:`FrameStack.get`).
+        """
+        return self.frames.get()
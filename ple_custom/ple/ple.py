@@ -4,6 +4,8 @@ import sys
 
 import pygame
 from .games.base.pygamewrapper import PyGameWrapper
+from .profiling import Profiler
+from .screen import downsampled, grayscale
 
 class PLE(object):
     """
@@ -13,7 +15,8 @@ class PLE(object):
         reward_values={}, force_fps=True,
         display_screen=False, add_noop_action=True,
         NOOP=K_F15, state_preprocessor=None,
-        rng=24
+        rng=24, profile=False,
+        observation_pipeline=None
     )
 
     Main wrapper that interacts with games.
@@ -87,12 +90,23 @@ class PLE(object):
     rng: numpy.random.RandomState, int, array_like or None. (default: 24)
         Number generator which is used by PLE and the games.
 
+    profile: bool (default: False)
+        If True, PLE and the game time each phase of a step (tick, game
+        step, event posting, drawing, reward) with ``time.perf_counter_ns``.
+        The results are returned by :meth:`getProfile`. When False no
+        timing code runs at all.
+
+    observation_pipeline: ple.ObservationPipeline (default: None)
+        Preprocesses and stacks the screen or the game state after every
+        action and reset. The result is returned by :meth:`getObservation`.
+
     """
 
     def __init__(self,
                  game, fps=30, frame_skip=1, num_steps=1,
                  reward_values={}, force_fps=True, display_screen=False,
-                 add_noop_action=True, state_preprocessor=None, rng=24):
+                 add_noop_action=True, state_preprocessor=None, rng=24,
+                 profile=False, observation_pipeline=None):
 
         
         self.game = game
@@ -108,6 +122,7 @@ class PLE(object):
         self.action = []
         self.previous_score = 0
         self.frame_count = 0
+        self._grayscale_scratch = None
 
         # update the scores of games with values we pick
         if reward_values:
@@ -130,6 +145,20 @@ class PLE(object):
                 self.rng = rng
         
         self.game.setRNG(self.rng)
+
+        self.profiler = None
+        if profile:
+            self.profiler = Profiler()
+            self.game.enableProfiling(self.profiler)
+            # the phases of _oneStepAct are timed around the calls it makes
+            wrap = self.profiler.wrap
+            self._oneStepAct = wrap("ple.step", self._oneStepAct)
+            self._setAction = wrap("ple.events", self._setAction)
+            self._tick = wrap("ple.tick", self._tick)
+            self.game.step = wrap("ple.game_step", self.game.step)
+            self._draw_frame = wrap("ple.draw", self._draw_frame)
+            self._getReward = wrap("ple.reward", self._getReward)
+
         self.init()
 
         self.state_preprocessor = state_preprocessor
@@ -144,6 +173,10 @@ class PLE(object):
             else:
                 self.state_dim = self.state_preprocessor(self.state_dim).shape
 
+        self.observation_pipeline = observation_pipeline
+        if self.observation_pipeline is not None:
+            self.observation_pipeline.bind(self)
+
         if game.allowed_fps is not None and self.fps != game.allowed_fps:
             raise ValueError("Game requires %dfps, was given %d." %
                              (game.allowed_fps, game.allowed_fps))
@@ -165,7 +198,16 @@ class PLE(object):
         This method should be explicitly called.
         """
         self.game._setup()
-        self.game.init(self.game.Gap_Vector,self.game.MAX_CONT) #this is the games setup/init
+        self.game.init(*self._initArgs()) #this is the games setup/init
+
+    def _initArgs(self):
+        """
+        Arguments of the game's init(): FlappyBird takes its pipe gaps
+        (Gap_Vector, MAX_CONT), the other games take none.
+        """
+        if hasattr(self.game, "Gap_Vector"):
+            return (self.game.Gap_Vector, self.game.MAX_CONT)
+        return ()
 
     def getActionSet(self):
         """
@@ -262,39 +304,95 @@ class PLE(object):
         self.last_action = []
         self.action = []
         self.previous_score = 0.0
-        self.game.reset(Gap_Vector,MAX_CONT)
+        if hasattr(self.game, "Gap_Vector"):
+            self.game.reset(Gap_Vector,MAX_CONT)
+        else:
+            self.game.reset()
+
+        if self.observation_pipeline is not None:
+            self.observation_pipeline.reset(self)
 
-    def getScreenRGB(self):
+    def getScreenRGB(self, out=None, downsample=1):
         """
         Gets the current game screen in RGB format.
 
+        Parameters
+        ----------
+
+        out : numpy uint8 array or None (default: None)
+            Preallocated array the screen is copied into, so that no new
+            array is allocated.
+
+        downsample : int (default: 1)
+            Keeps every n-th pixel along both axes.
+
         Returns
         --------
         numpy uint8 array
-            Returns a numpy array with the shape (width, height, 3).
+            Returns a numpy array with the shape (width, height, 3), or
+            ``out`` if it was given.
 
 
         """
+        if out is None and downsample == 1:
+            return self.game.getScreenRGB()
 
-        return self.game.getScreenRGB()
+        view = downsampled(self.game.getScreenView(), downsample)
+        if out is None:
+            return view.copy()
+        out[...] = view
+        return out
 
-    def getScreenGrayscale(self):
+    def getScreenView(self, downsample=1):
         """
-        Gets the current game screen in Grayscale format. Converts from RGB using relative lumiance.
+        Gets the current game screen in RGB format without copying it.
+
+        The array references the screen's pixels and, for pygame games,
+        locks the screen: delete it before the next call to act.
+
+        Parameters
+        ----------
+
+        downsample : int (default: 1)
+            Keeps every n-th pixel along both axes.
 
         Returns
         --------
         numpy uint8 array
-                Returns a numpy array with the shape (width, height).
+            Returns a numpy array view with the shape (width, height, 3).
+
 
+        """
+        return downsampled(self.game.getScreenView(), downsample)
 
+    def getScreenGrayscale(self, out=None, downsample=1):
         """
-        frame = self.getScreenRGB()
-        frame = 0.21 * frame[:, :, 0] + 0.72 * \
-            frame[:, :, 1] + 0.07 * frame[:, :, 2]
-        frame = np.round(frame).astype(np.uint8)
+        Gets the current game screen in Grayscale format. Converts from RGB using relative lumiance,
+        in integer arithmetic straight from the screen's pixels.
 
-        return frame
+        Parameters
+        ----------
+
+        out : numpy uint8 array or None (default: None)
+            Preallocated array the frame is written into, so that no new
+            array is allocated.
+
+        downsample : int (default: 1)
+            Keeps every n-th pixel along both axes.
+
+        Returns
+        --------
+        numpy uint8 array
+                Returns a numpy array with the shape (width, height), or ``out`` if it was given.
+
+
+        """
+        view = downsampled(self.game.getScreenView(), downsample)
+        shape = (2,) + view.shape[:2]
+        if self._grayscale_scratch is None or self._grayscale_scratch.shape != shape:
+            self._grayscale_scratch = np.empty(shape, dtype=np.uint16)
+
+        return grayscale(view, out, self._grayscale_scratch)
 
     def saveScreen(self, filename):
         """
@@ -372,7 +470,30 @@ class PLE(object):
             Returns the reward that the agent has accumlated while performing the action.
 
         """
-        return sum(self._oneStepAct(action) for i in range(self.frame_skip))
+        reward = sum(self._oneStepAct(action) for i in range(self.frame_skip))
+        if self.observation_pipeline is not None:
+            self.observation_pipeline.push(self)
+        return reward
+
+    def getObservation(self):
+        """
+        Gets the observation built by the observation pipeline: the last
+        frames or game states, preprocessed and stacked.
+
+        Returns
+        -------
+
+        numpy array
+            Returns a view with the shape (stack,) + observation shape,
+            oldest first. It is overwritten by the next call to act, so
+            copy it to keep it.
+
+        """
+        if self.observation_pipeline is None:
+            raise ValueError(
+                "Was asked for an observation but PLE was created without an observation_pipeline!")
+
+        return self.observation_pipeline.get()
 
     def _draw_frame(self):
         """
@@ -401,6 +522,32 @@ class PLE(object):
 
         return self._getReward()
 
+    def getProfile(self, reset=False):
+        """
+        Gets the per-phase timings recorded since profiling started (or since the last reset).
+
+        Parameters
+        ----------
+
+        reset : bool (default: False)
+            Clears the accumulators after reading them.
+
+        Returns
+        -------
+
+        dict
+            Maps phase names ("ple.*" for PLE, "<game>.*" for the game) to a dict with the number of calls, total and mean time, p50/p90/p99 estimates and a power-of-two histogram, all in nanoseconds.
+
+        """
+        if self.profiler is None:
+            raise ValueError(
+                "Was asked for a profile but PLE was created with profile=False!")
+
+        profile = self.profiler.summary()
+        if reset:
+            self.profiler.reset()
+        return profile
+
     def _setAction(self, action):
         """
             Instructs the game to perform an action if its not a NOOP
@@ -0,0 +1,113 @@
+import time
+
+# Durations are bucketed by bit length: bucket b holds [2**(b-1), 2**b) ns
+NUM_BUCKETS = 64
+
+
+class Phase(object):
+    """
+    Accumulates the durations of one instrumented phase.
+
+    Parameters
+    ----------
+    name: string
+        Name the phase is reported under, e.g. "ple.game_step".
+    """
+
+    __slots__ = ("name", "calls", "total_ns", "buckets")
+
+    def __init__(self, name):
+        self.name = name
+        self.reset()
+
+    def add(self, elapsed_ns):
+        """
+        Records one call that took ``elapsed_ns`` nanoseconds.
+        """
+        self.calls += 1
+        self.total_ns += elapsed_ns
+        self.buckets[elapsed_ns.bit_length()] += 1
+
+    def reset(self):
+        self.calls = 0
+        self.total_ns = 0
+        self.buckets = [0] * NUM_BUCKETS
+
+    def percentile(self, q):
+        """
+        Upper bound (in ns) of the histogram bucket holding the q-th percentile.
+        """
+        if not self.calls:
+            return 0
+        target = q / 100.0 * self.calls
+        seen = 0
+        for b, count in enumerate(self.buckets):
+            seen += count
+            if seen >= target:
+                return 1 << b
+        return 1 << (NUM_BUCKETS - 1)
+
+    def summary(self):
+        return {
+            "calls": self.calls,
+            "total_ns": self.total_ns,
+            "mean_ns": self.total_ns / self.calls if self.calls else 0.0,
+            "p50_ns": self.percentile(50),
+            "p90_ns": self.percentile(90),
+            "p99_ns": self.percentile(99),
+            "histogram": [(1 << b, count) for b, count in enumerate(self.buckets) if count],
+        }
+
+
+class Profiler(object):
+    """
+    Collection of per-phase accumulators shared by PLE and a game.
+
+    Instrumented code wraps the methods of its phases once, with
+    :meth:`wrap`, or asks for a phase with :meth:`phase` and calls
+    :meth:`Phase.add` with ``time.perf_counter_ns()`` differences. Nothing
+    is instrumented unless profiling was requested, so a disabled profiler
+    costs nothing.
+    """
+
+    clock = staticmethod(time.perf_counter_ns)
+
+    def __init__(self):
+        self.phases = {}
+
+    def phase(self, name):
+        """
+        Returns the accumulator for ``name``, creating it if needed.
+        """
+        if name not in self.phases:
+            self.phases[name] = Phase(name)
+        return self.phases[name]
+
+    def wrap(self, name, function):
+        """
+        Returns ``function`` with each call timed as the phase ``name``.
+
+        Assigned over a bound method on an instance, it times that method
+        while the code calling it stays the same as without profiling.
+        """
+        phase = self.phase(name)
+        clock = self.clock
+
+        def timed(*args, **kwargs):
+            start = clock()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                phase.add(clock() - start)
+
+        return timed
+
+    def summary(self):
+        """
+        Returns a dict of phase name to its aggregated statistics.
+        """
+        return dict((name, phase.summary()) for name, phase in self.phases.items())
+
+    def reset(self):
+        for phase in self.phases.values():
+            phase.reset()
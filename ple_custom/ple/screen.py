@@ -0,0 +1,67 @@
+import numpy as np
+
+
+def grayscale(rgb, out=None, scratch=None):
+    """
+    Relative luminance ``0.21 R + 0.72 G + 0.07 B`` of an RGB frame.
+
+    Computed in integer arithmetic, ``(21 R + 72 G + 7 B + 50) // 100``,
+    so it rounds halves up where the float formula rounds them to even.
+    No float frame is allocated; with ``out`` and ``scratch`` nothing is.
+
+    Parameters
+    ----------
+    rgb : numpy uint8 array
+        (width, height, 3) frame, possibly a strided view.
+
+    out : numpy uint8 array or None
+        (width, height) array the result is written into.
+
+    scratch : numpy uint16 array or None
+        (2, width, height) work space, reused between calls.
+
+    Returns
+    -------
+    numpy uint8 array
+        ``out``, or a new array if it was None.
+
+    """
+    shape = rgb.shape[:2]
+    if out is None:
+        out = np.empty(shape, dtype=np.uint8)
+    if scratch is None:
+        scratch = np.empty((2,) + shape, dtype=np.uint16)
+
+    total, term = scratch
+    np.multiply(rgb[:, :, 0], 21, out=total, dtype=np.uint16)
+    np.multiply(rgb[:, :, 1], 72, out=term, dtype=np.uint16)
+    total += term
+    np.multiply(rgb[:, :, 2], 7, out=term, dtype=np.uint16)
+    total += term
+    total += 50
+    total //= 100
+    np.copyto(out, total, casting="unsafe")
+    return out
+
+
+def downsampled(frame, factor):
+    """
+    Every ``factor``-th pixel of a frame along both axes, as a view.
+
+    Parameters
+    ----------
+    frame : numpy array
+        (width, height, ...) frame.
+
+    factor : int
+        Subsampling step; 1 returns the frame itself.
+
+    """
+    if factor == 1:
+        return frame
+    return frame[::factor, ::factor]
+
+
+def downsampledDims(dims, factor):
+    """(width, height) of a frame of size ``dims`` after :func:`downsampled`."""
+    return tuple(-(-d // factor) for d in dims)
@@ -0,0 +1,291 @@
+import multiprocessing
+from multiprocessing import resource_tracker, shared_memory
+
+import numpy as np
+import pygame
+
+from .ple import PLE
+from .screen import downsampledDims
+
+
+class _Env(object):
+    """
+    One game of a VectorPLE, drawing on its own offscreen surface.
+
+    PLE draws every game on the pygame display, of which a process has only
+    one; the offscreen surface lets several games live side by side.
+    """
+
+    def __init__(self, make_game, observation, downsample, rng, kwargs):
+        self.p = PLE(make_game(), rng=rng, display_screen=False, **kwargs)
+        self.game = self.p.game
+        self.game.screen = pygame.Surface(self.game.getScreenDims()).convert()
+        self.observation = observation
+        self.downsample = downsample
+        self.actions = self.p.getActionSet()
+
+    def observationDims(self):
+        dims = downsampledDims(self.game.getScreenDims(), self.downsample)
+        if self.observation == "rgb":
+            return dims + (3,), np.uint8
+        if self.observation == "grayscale":
+            return dims, np.uint8
+        return self.p.getGameStateDims(), np.float64
+
+    def observe(self, out):
+        """Writes the current observation into ``out``."""
+        if self.observation == "state":
+            out[...] = self.p.getGameState()
+        elif self.observation == "rgb":
+            self.p.getScreenRGB(out, self.downsample)
+        else:
+            self.p.getScreenGrayscale(out, self.downsample)
+
+    def reset(self, out):
+        self.p.reset_game(*self.p._initArgs())
+        self.observe(out)
+
+    def step(self, action, out):
+        reward = self.p.act(action)
+        done = self.p.game_over()
+        if done:
+            self.p.reset_game(*self.p._initArgs())
+        self.observe(out)
+        return reward, done
+
+
+def _worker_main(conn, index, make_game, observation, downsample, rng, kwargs):
+    env = _Env(make_game, observation, downsample, rng, kwargs)
+    shape, dtype = env.observationDims()
+    conn.send((env.actions, shape, np.dtype(dtype).str))
+
+    memory = shared_memory.SharedMemory(name=conn.recv())
+    size = int(np.prod(shape)) * np.dtype(dtype).itemsize
+    out = np.ndarray(shape, dtype=dtype, buffer=memory.buf, offset=index * size)
+    try:
+        while True:
+            command, action = conn.recv()
+            if command == "step":
+                conn.send(env.step(action, out))
+            elif command == "reset":
+                env.reset(out)
+                conn.send(None)
+            else:
+                break
+    finally:
+        del out
+        memory.close()
+        conn.close()
+
+
+class VectorPLE(object):
+    """
+    ple.VectorPLE(
+        make_game, num_envs,
+        observation="rgb", downsample=1,
+        processes=False, rng=24, **kwargs
+    )
+
+    Runs ``num_envs`` independent copies of a game and steps them together.
+
+    Observations of all the games are written into one preallocated array,
+    returned by :meth:`reset` and :meth:`step`; it is overwritten by the
+    next call, so copy it to keep it. A game that reaches a terminal state
+    is reset right away: its ``done`` flag is set and its observation is
+    the first one of the new episode.
+
+    Parameters
+    ----------
+    make_game: callable
+        Returns a new game instance, e.g. the game class. With
+        ``processes=True`` it is called in the worker, so it must be
+        picklable.
+
+    num_envs: int
+        The number of games K.
+
+    observation: str (default: "rgb")
+        "rgb" for (K, width, height, 3) uint8 screens, "grayscale" for
+        (K, width, height) uint8 screens or "state" for the (K, ...) output
+        of ``state_preprocessor`` applied to getGameState.
+
+    downsample: int (default: 1)
+        Screens keep every n-th pixel along both axes.
+
+    processes: bool (default: False)
+        If True every game runs in a subprocess and writes its observations
+        into shared memory, so the games step in parallel. Otherwise they
+        run one after another in this process.
+
+    rng: int (default: 24)
+        Seed of the first game; game i is seeded with ``rng + i``.
+
+    kwargs:
+        Passed on to each :class:`PLE` (fps, frame_skip, num_steps,
+        reward_values, force_fps, add_noop_action, state_preprocessor).
+
+    """
+
+    def __init__(self, make_game, num_envs, observation="rgb", downsample=1,
+                 processes=False, rng=24, **kwargs):
+        if observation not in ("rgb", "grayscale", "state"):
+            raise ValueError("Unknown observation type %r." % observation)
+        if observation == "state" and kwargs.get("state_preprocessor") is None:
+            raise ValueError(
+                "Asked for state observations without a state_preprocessor!")
+
+        self.num_envs = num_envs
+        self.observation = observation
+        self.processes = processes
+        self._memory = None
+        self._closed = False
+
+        if processes:
+            self._envs = None
+            self._conns = []
+            self._workers = []
+            # workers share this process' tracker of the shared memory, so
+            # that the segment is released once, by close()
+            resource_tracker.ensure_running()
+            for i in range(num_envs):
+                parent, child = multiprocessing.Pipe()
+                worker = multiprocessing.Process(
+                    target=_worker_main,
+                    args=(child, i, make_game, observation, downsample,
+                          rng + i, kwargs))
+                worker.daemon = True
+                worker.start()
+                child.close()
+                self._conns.append(parent)
+                self._workers.append(worker)
+
+            replies = [conn.recv() for conn in self._conns]
+            self.actions, shape, dtype = replies[0]
+            dtype = np.dtype(dtype)
+            size = num_envs * int(np.prod(shape)) * dtype.itemsize
+            self._memory = shared_memory.SharedMemory(create=True, size=max(size, 1))
+            self.obs = np.ndarray((num_envs,) + tuple(shape), dtype=dtype,
+                                  buffer=self._memory.buf)
+            for conn in self._conns:
+                conn.send(self._memory.name)
+        else:
+            self._envs = [_Env(make_game, observation, downsample, rng + i, kwargs)
+                          for i in range(num_envs)]
+            self.actions = self._envs[0].actions
+            shape, dtype = self._envs[0].observationDims()
+            self.obs = np.zeros((num_envs,) + tuple(shape), dtype=dtype)
+
+        self.rewards = np.zeros(num_envs)
+        self.dones = np.zeros(num_envs, dtype=bool)
+
+    def getActionSet(self):
+        """
+        Gets the actions the games support, as :meth:`PLE.getActionSet`.
+
+        Returns
+        --------
+
+        list of pygame.constants
+
+        """
+        return list(self.actions)
+
+    def getObservationDims(self):
+        """
+        Gets the shape of the observations of all the games.
+
+        Returns
+        -------
+
+        tuple of int
+            (num_envs, ...) shape of the arrays returned by :meth:`step`.
+
+        """
+        return self.obs.shape
+
+    def reset(self):
+        """
+        Resets every game to a clean initial state.
+
+        Returns
+        -------
+
+        numpy array
+            The observations of all the games.
+
+        """
+        if self._envs is not None:
+            for env, out in zip(self._envs, self.obs):
+                env.reset(out)
+        else:
+            for conn in self._conns:
+                conn.send(("reset", None))
+            for conn in self._conns:
+                conn.recv()
+
+        self.dones[:] = False
+        return self.obs
+
+    def step(self, actions):
+        """
+        Performs one action on each game.
+
+        Parameters
+        ----------
+
+        actions : sequence
+            One action per game, taken from :meth:`getActionSet`.
+
+        Returns
+        -------
+
+        tuple
+            (observations, rewards, dones) arrays with one row per game.
+
+        """
+        if len(actions) != self.num_envs:
+            raise ValueError("Expected %d actions, got %d." %
+                             (self.num_envs, len(actions)))
+
+        if self._envs is not None:
+            for i, (env, action) in enumerate(zip(self._envs, actions)):
+                self.rewards[i], self.dones[i] = env.step(action, self.obs[i])
+        else:
+            for conn, action in zip(self._conns, actions):
+                conn.send(("step", action))
+            for i, conn in enumerate(self._conns):
+                self.rewards[i], self.dones[i] = conn.recv()
+
+        return self.obs, self.rewards, self.dones
+
+    def close(self):
+        """
+        Stops the worker processes and frees the shared observation memory.
+        """
+        if self._closed:
+            return
+        self._closed = True
+
+        if self._envs is None:
+            for conn in self._conns:
+                try:
+                    conn.send(("close", None))
+                except (BrokenPipeError, EOFError):
+                    pass
+            for worker in self._workers:
+                worker.join()
+            for conn in self._conns:
+                conn.close()
+
+            # arrays handed out by step() still point into the memory; it is
+            # unmapped once the last of them is gone
+            self.obs = None
+            try:
+                self._memory.close()
+            except BufferError:
+                pass
+            self._memory.unlink()
+
+    def __del__(self):
+        if hasattr(self, "_closed"):
+            self.close()
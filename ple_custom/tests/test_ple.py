@@ -45,11 +45,49 @@ class MyTestCase(unittest.TestCase):
         game = MonsterKong()
         self.run_a_game(game)
 
+    def test_monsterkong_keep_level(self):
+        import pygame
+        from ple.games.monsterkong import MonsterKong
+        game = MonsterKong(levels="keep")
+        pygame.init()
+        game.screen = pygame.display.set_mode(game.getScreenDims(), 0, 32)
+        game.rng = np.random.RandomState(24)
+        game.init()
+        board = game.newGame
+        layout = [row[:] for row in board.map]
+        walls = list(board.Walls)
+        coins = [coin.getPosition() for coin in board.Coins]
+        for i in range(NUM_STEPS):
+            game.step(33)
+        game.init()
+        self.assertIs(game.newGame, board)
+        self.assertEqual(board.map, layout)
+        self.assertEqual(board.Walls, walls)
+        self.assertEqual([coin.getPosition() for coin in board.Coins], coins)
+        self.assertEqual(len(board.coinGroup), len(coins))
+        self.assertEqual((board.score, board.lives, board.Fireballs), (0, 3, []))
+
     def test_flappybird(self):
         from ple.games.flappybird import FlappyBird
         game = FlappyBird()
         self.run_a_game(game)
 
+    def test_flappybird_profile(self):
+        from ple import PLE
+        from ple.games.flappybird import FlappyBird
+        p = PLE(FlappyBird(), display_screen=False, profile=True)
+        p.init()
+        for i in range(NUM_STEPS):
+            if p.game_over():
+                p.reset_game()
+            p.act(p.NOOP)
+        profile = p.getProfile(reset=True)
+        steps = profile["ple.step"]["calls"]
+        self.assertTrue(steps > 0)
+        for phase in ("ple.tick", "ple.game_step", "ple.draw", "flappybird.collision", "flappybird.draw"):
+            self.assertEqual(profile[phase]["calls"], steps)
+        self.assertEqual(p.getProfile()["ple.step"]["calls"], 0)
+
     def test_pixelcopter(self):
         from ple.games.pixelcopter import Pixelcopter
         game = Pixelcopter()
@@ -65,6 +103,48 @@ class MyTestCase(unittest.TestCase):
         game = RaycastMaze()
         self.run_a_game(game)
 
+    def test_raycast_batch(self):
+        from ple.games.raycast import RayCastPlayer, make_map, make_box
+        map_grid = make_box(make_map(12), (4, 4), (7, 7), fill=2, isFilled=False)
+        block_types = {0: {"pass_through": True, "color": None},
+                       1: {"pass_through": False, "color": (255, 255, 255)},
+                       2: {"pass_through": False, "color": (255, 100, 100)}}
+        player = RayCastPlayer(map_grid, (1.5, 1.5), (1.0, 0.0), 48, 48, 1,
+                               20, 13, (0.0, 0.66), {}, block_types)
+        angles = np.linspace(0.0, 2 * np.pi, 5)
+        pos = np.array([[1.5, 1.5], [2.5, 9.5], [10.2, 2.7], [9.5, 9.5], [2.0, 3.0]], dtype=np.float32)
+        dirs = np.stack([np.cos(angles), np.sin(angles)], axis=1).astype(np.float32)
+        planes = np.stack([-0.66 * np.sin(angles), 0.66 * np.cos(angles)], axis=1).astype(np.float32)
+        columns, tops, bottoms, coloring = player.draw_batch(pos, dirs, planes)
+        for i in range(len(pos)):
+            player.pos, player.dir, player.plane = pos[i:i + 1], dirs[i:i + 1], planes[i:i + 1]
+            c, t, b, col = player.draw()
+            self.assertTrue(np.array_equal(t[:, 0], tops[i]))
+            self.assertTrue(np.array_equal(b[:, 0], bottoms[i]))
+            self.assertTrue(np.array_equal(col, coloring[i]))
+
+    def test_maze_index(self):
+        from ple.games.utils.maze import make_maze, MazeIndex
+        grid = make_maze(11, np.random.RandomState(7))
+        maze = MazeIndex(grid, (1, 1))
+        self.assertEqual(maze.path_distance[1, 1], 0)
+        self.assertTrue((maze.wall_distance[grid > 0] == 0).all())
+        self.assertTrue((maze.wall_distance[grid == 0] >= 1).all())
+        for row, column in maze.targets(4):
+            self.assertTrue(grid[row, column] > 0)
+            self.assertTrue(1 <= maze.path_distance[row, column] <= 4)
+        self.assertTrue(maze.is_wall(-1, 0))
+
+    def test_maze_connected(self):
+        from ple.games.utils.maze import make_maze, MazeIndex
+        for size in (10, 20, 51):
+            for seed in range(200):
+                grid = make_maze(size, np.random.RandomState(seed))
+                start = tuple(np.argwhere(grid == 0)[0])
+                maze = MazeIndex(grid, start)
+                self.assertTrue((maze.path_distance[grid == 0] >= 0).all(),
+                                "maze of size %d, seed %d is disconnected" % (size, seed))
+
     def test_snake(self):
         from ple.games.snake import Snake
         game = Snake()
@@ -75,11 +155,102 @@ class MyTestCase(unittest.TestCase):
         game = WaterWorld()
         self.run_a_game(game)
 
+    def test_creeps(self):
+        import pygame
+        from ple.games.primitives import Creeps
+        pygame.init()
+        pygame.display.set_mode((64, 64))
+        creeps = Creeps(64, 64, capacity=1)
+        for i, x in enumerate([10.0, 30.0, 60.0]):
+            creeps.add((40, 140, 40), 3, (x, 20.0), (1, 1), 30.0, 1.0, i % 2, 0.0)
+        self.assertEqual(len(creeps), 3)
+        self.assertTrue(np.allclose(creeps.direction, np.sqrt(0.5)))
+        creeps.update(0.1)
+        # the last one bounced off the right wall
+        self.assertEqual(creeps.pos[2, 0], 61.0)
+        self.assertTrue(creeps.direction[2, 0] < 0 < creeps.direction[0, 0])
+        hits = creeps.collide(pygame.Rect(0, 0, 40, 40))
+        self.assertEqual(hits.tolist(), [0, 1])
+        creeps.remove(hits)
+        self.assertEqual(creeps.type.tolist(), [0])
+        self.assertEqual(creeps.distances(61.0, 22.0 + 3.0 * np.sqrt(0.5)).tolist(), [2.0])
+
     def test_pong(self):
         from ple.games.pong import Pong
         game = Pong()
         self.run_a_game(game)
 
+    def test_screen_buffers(self):
+        from ple import PLE
+        from ple.games.catcher import Catcher
+        p = PLE(Catcher())
+        for i in range(10):
+            p.act(p.NOOP)
+        rgb = p.getScreenRGB()
+        out = np.zeros_like(rgb)
+        self.assertTrue(p.getScreenRGB(out) is out)
+        self.assertTrue(np.array_equal(out, rgb))
+        self.assertTrue(np.array_equal(p.getScreenRGB(downsample=2), rgb[::2, ::2]))
+
+        gray = np.zeros(rgb.shape[:2], dtype=np.uint8)
+        p.getScreenGrayscale(gray)
+        luminance = 0.21 * rgb[:, :, 0] + 0.72 * rgb[:, :, 1] + 0.07 * rgb[:, :, 2]
+        self.assertTrue((np.abs(gray - luminance) <= 0.5 + 1e-9).all())
+        self.assertTrue(np.array_equal(p.getScreenGrayscale(downsample=3), gray[::3, ::3]))
+
+    def test_observation_pipeline(self):
+        from ple import PLE, ObservationPipeline
+        from ple.games.catcher import Catcher
+        pipeline = ObservationPipeline(grayscale=True, crop=(0, 8, 64, 64),
+                                       resize=(28, 28), normalize=True, stack=4)
+        p = PLE(Catcher(), observation_pipeline=pipeline)
+        obs = p.getObservation()
+        self.assertEqual(obs.shape, (4, 28, 28))
+        self.assertTrue((obs == obs[-1]).all())
+
+        frames = []
+        for i in range(10):
+            p.act(p.getActionSet()[i % 3])
+            gray = p.getScreenGrayscale()[0:64, 8:64]
+            frames.append(gray[np.arange(28) * 64 // 28][:, np.arange(28) * 56 // 28] / 255.0)
+        self.assertTrue(np.allclose(p.getObservation(), frames[-4:]))
+
+        states = PLE(Catcher(), state_preprocessor=lambda s: np.array(list(s.values()), dtype=float),
+                     observation_pipeline=ObservationPipeline(source="state", stack=3))
+        history = []
+        for i in range(5):
+            states.act(states.NOOP)
+            history.append(states.getGameState())
+        self.assertTrue(np.array_equal(states.getObservation(), history[-3:]))
+
+    def run_vector_game(self, make_game, processes=False):
+        from ple import VectorPLE
+        envs = VectorPLE(make_game, 3, processes=processes)
+        actions = envs.getActionSet()
+        obs = envs.reset()
+        self.assertEqual(obs.shape, envs.getObservationDims())
+        for i in range(NUM_STEPS):
+            picks = [actions[np.random.randint(0, len(actions))] for k in range(3)]
+            obs, rewards, dones = envs.step(picks)
+            self.assertEqual(rewards.shape, (3,))
+            self.assertEqual(dones.shape, (3,))
+        self.assertEqual(obs.dtype, np.uint8)
+        self.assertTrue(obs.any())
+        envs.close()
+
+    def test_vector_flappybird(self):
+        from ple.games.flappybird import FlappyBird
+        self.run_vector_game(FlappyBird)
+
+    def test_vector_catcher(self):
+        from ple.games.catcher import Catcher
+        self.run_vector_game(Catcher)
+        self.run_vector_game(Catcher, processes=True)
+
+    def test_vector_pong(self):
+        from ple.games.pong import Pong
+        self.run_vector_game(Pong)
+
     def test_doom_not_defined(self):
         from nose.tools import assert_raises
         def invoke_doom():
@@ -0,0 +1,192 @@
+from __future__ import print_function
+
+import random
+
+
+class AdaptiveScenarioSelector(object):
+    """
+    Decide, generation by generation, how many episodes each pipe scenario gets.
+
+    Every genome has a fixed budget of ``num_scenarios`` episodes. The selector
+    tracks the pass rate of each scenario (a pass means every pipe of the
+    scenario was cleared) over the whole population. A scenario that every
+    genome keeps passing no longer separates genomes, so after ``patience``
+    saturated generations it is dropped and its episodes are handed to the
+    active scenarios with the highest failure variance ``p * (1 - p)``.
+
+    Re-running a scenario with the same pipe gaps replays the exact same game,
+    so extra episodes are played on jittered variants of the scenario gaps.
+    Variants are seeded per (scenario, episode), which keeps them identical for
+    all genomes and across generations.
+
+    Parameters:
+    -----------
+    num_scenarios : int
+        Number of base scenarios; also the per-genome episode budget.
+    saturation_threshold : float
+        Pass rate at or above which a scenario counts as saturated.
+    patience : int
+        Consecutive saturated generations before a scenario is dropped.
+    reprobe_interval : int
+        Every this many generations dropped scenarios are played once more
+        to check that the population still passes them (0 disables it).
+    smoothing : float
+        Weight of the newest generation in the smoothed failure variance.
+    jitter : int
+        Maximum pixel offset applied to each gap of a scenario variant.
+    gap_range : tuple of int
+        Allowed (min, max) gap start for scenario variants.
+    seed : int
+        Seed for the variant gap generator.
+    """
+
+    def __init__(self, num_scenarios, saturation_threshold=1.0, patience=3,
+                 reprobe_interval=10, smoothing=0.5, jitter=15,
+                 gap_range=(25, 192), seed=0):
+        self.num_scenarios = num_scenarios
+        self.budget = num_scenarios
+        self.saturation_threshold = saturation_threshold
+        self.patience = patience
+        self.reprobe_interval = reprobe_interval
+        self.smoothing = smoothing
+        self.jitter = jitter
+        self.gap_range = gap_range
+        self.seed = seed
+
+        self.generation = 0
+        self.pass_rate = [None] * num_scenarios
+        self.failure_variance = [0.0] * num_scenarios
+        self.saturated_streak = [0] * num_scenarios
+        self.dropped = {}   # scenario -> normalized score substituted while dropped
+        self.history = []   # one allocation report per generation
+
+        self.allocation = {i: 1 for i in range(num_scenarios)}
+        self._reset_counters()
+
+    def _reset_counters(self):
+        self._episodes = [0] * self.num_scenarios
+        self._passes = [0] * self.num_scenarios
+        self._score_sum = [0.0] * self.num_scenarios
+
+    def is_active(self, scenario):
+        """Return True if the scenario is played this generation."""
+        return scenario in self.allocation
+
+    def episodes(self, scenario):
+        """Number of episodes a genome plays on the scenario this generation."""
+        return self.allocation.get(scenario, 0)
+
+    def dropped_score(self, scenario):
+        """Normalized score credited for a scenario that is not played."""
+        return self.dropped[scenario]
+
+    def episode_gaps(self, scenario, episode, base_gaps):
+        """
+        Pipe gaps for one episode of a scenario.
+
+        Episode 0 is the scenario itself; later episodes are jittered variants.
+        """
+        if episode == 0 or self.jitter <= 0:
+            return base_gaps
+
+        rng = random.Random((self.seed * 1000003 + scenario) * 1009 + episode)
+        low, high = self.gap_range
+        return [min(high, max(low, gap + rng.randint(-self.jitter, self.jitter)))
+                for gap in base_gaps]
+
+    def record(self, scenario, passed, normalized_score):
+        """Record the outcome of one episode played on a scenario."""
+        self._episodes[scenario] += 1
+        self._passes[scenario] += 1 if passed else 0
+        self._score_sum[scenario] += normalized_score
+
+    def end_generation(self):
+        """
+        Update pass-rate statistics and plan the next generation's budget.
+
+        Returns:
+        --------
+        str
+            Human-readable summary of the new allocation.
+        """
+        for i in range(self.num_scenarios):
+            if not self._episodes[i]:
+                continue
+
+            rate = self._passes[i] / float(self._episodes[i])
+            mean_score = self._score_sum[i] / self._episodes[i]
+            self.pass_rate[i] = rate
+            self.failure_variance[i] = (
+                self.smoothing * rate * (1.0 - rate)
+                + (1.0 - self.smoothing) * self.failure_variance[i]
+            )
+
+            if rate >= self.saturation_threshold:
+                self.saturated_streak[i] += 1
+            else:
+                self.saturated_streak[i] = 0
+
+            if i in self.dropped:
+                # Re-probe of a dropped scenario
+                if rate >= self.saturation_threshold:
+                    self.dropped[i] = mean_score
+                else:
+                    del self.dropped[i]
+            elif (self.saturated_streak[i] >= self.patience
+                  and len(self.dropped) < self.num_scenarios - 1):
+                self.dropped[i] = mean_score
+
+        self.generation += 1
+        self.allocation = self._plan()
+        self._reset_counters()
+
+        report = self._describe()
+        self.history.append({
+            'generation': self.generation,
+            'allocation': dict(self.allocation),
+            'dropped': sorted(self.dropped),
+            'pass_rate': list(self.pass_rate),
+        })
+        return report
+
+    def _plan(self):
+        active = [i for i in range(self.num_scenarios) if i not in self.dropped]
+        allocation = {i: 1 for i in active}
+
+        if self.reprobe_interval and self.generation % self.reprobe_interval == 0:
+            for i in self.dropped:
+                allocation[i] = 1
+
+        extra = self.budget - sum(allocation.values())
+        if extra <= 0:
+            return allocation
+
+        weights = [self.failure_variance[i] for i in active]
+        if sum(weights) <= 0.0:
+            weights = [1.0] * len(active)
+        total = sum(weights)
+
+        # Largest-remainder split of the freed episodes
+        shares = [extra * w / total for w in weights]
+        granted = [int(s) for s in shares]
+        order = sorted(range(len(active)), key=lambda k: (granted[k] - shares[k], k))
+        for k in order[:extra - sum(granted)]:
+            granted[k] += 1
+
+        for i, g in zip(active, granted):
+            allocation[i] += g
+        return allocation
+
+    def _describe(self):
+        parts = []
+        for i in range(self.num_scenarios):
+            rate = self.pass_rate[i]
+            rate_text = "n/a" if rate is None else "{:.0%}".format(rate)
+            if i in self.dropped and i not in self.allocation:
+                parts.append("S{} dropped (pass {})".format(i + 1, rate_text))
+            elif i in self.dropped:
+                parts.append("S{} probe (pass {})".format(i + 1, rate_text))
+            else:
+                parts.append("S{} x{} (pass {}, var {:.3f})".format(
+                    i + 1, self.allocation[i], rate_text, self.failure_variance[i]))
+        return "Scenario budget: " + ", ".join(parts)
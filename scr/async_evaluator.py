@@ -0,0 +1,287 @@
+from __future__ import print_function
+
+import multiprocessing
+import time
+import traceback
+from collections import deque
+from multiprocessing.connection import wait
+
+
+def _worker_main(worker_id, task_queue, results, eval_function, env_factory):
+    """
+    Worker process loop.
+
+    The environment is built once and reused for every genome the worker
+    evaluates. Messages on the task queue are:
+
+    - ('setup', config, args): configuration for the coming generation;
+    - ('eval', index, genome): evaluate one genome;
+    - None: shut down.
+
+    Results are sent on the worker's own pipe, from this thread: a worker
+    killed at any point cannot leave a lock shared with other workers held.
+    """
+    env = env_factory()
+    config = None
+    args = ()
+
+    while True:
+        message = task_queue.get()
+        if message is None:
+            break
+
+        if message[0] == 'setup':
+            _, config, args = message
+            continue
+
+        _, index, genome = message
+        start = time.perf_counter()
+        try:
+            result = eval_function(env, genome, config, *args)
+        except Exception:
+            results.send(('error', worker_id, index, traceback.format_exc(), 0.0))
+            continue
+        results.send(('done', worker_id, index, result, time.perf_counter() - start))
+
+
+class AsyncEvaluator(object):
+    """
+    Evaluate genomes on persistent worker processes with work stealing.
+
+    Genomes are ordered longest-expected-first and dealt to per-worker queues
+    so that every worker starts with about the same expected load. A worker
+    takes its next genome from the front of its own queue; once that is empty
+    it steals from the back of the queue with the most expected work left.
+    Each worker holds one genome at a time, so a slow genome never keeps
+    other genomes waiting behind it.
+
+    A worker that dies (e.g. a crash in pygame, or killed for memory) is
+    restarted and its genome handed to the new process; a genome that kills
+    more than ``max_restarts`` workers raises RuntimeError.
+
+    The expected runtime of a genome is its own last runtime (for genomes that
+    survive into the next generation) or the mean runtime of its parents,
+    taken from ``ancestors`` (``population.reproduction.ancestors``).
+
+    Parameters:
+    -----------
+    num_workers : int
+        Number of worker processes.
+    eval_function : callable
+        ``eval_function(env, genome, config, *args)``; its return value is
+        passed back unchanged. Must be importable by the workers.
+    env_factory : callable
+        Builds the environment each worker keeps for its whole lifetime.
+    ancestors : dict, optional
+        Mapping of genome id to the tuple of its parent ids.
+    max_restarts : int
+        Worker deaths tolerated per genome before giving up on it.
+    """
+
+    def __init__(self, num_workers, eval_function, env_factory, ancestors=None,
+                 max_restarts=2):
+        self.num_workers = num_workers
+        self.ancestors = ancestors if ancestors is not None else {}
+        self.max_restarts = max_restarts
+        self.runtimes = {}   # genome id -> last measured evaluation time (s)
+        self.history = []    # per-generation scheduling statistics
+        self.restarts = 0    # workers restarted after dying
+
+        self._eval_function = eval_function
+        self._env_factory = env_factory
+        self._results = [None] * num_workers
+        self._task_queues = [None] * num_workers
+        self._workers = [None] * num_workers
+        for worker_id in range(num_workers):
+            self._start_worker(worker_id)
+
+    def _start_worker(self, worker_id):
+        """(Re)start the worker process in slot ``worker_id``."""
+        task_queue = multiprocessing.Queue()
+        reader, writer = multiprocessing.Pipe(duplex=False)
+        worker = multiprocessing.Process(
+            target=_worker_main,
+            args=(worker_id, task_queue, writer, self._eval_function, self._env_factory)
+        )
+        worker.daemon = True
+        worker.start()
+        writer.close()
+        if self._results[worker_id] is not None:
+            self._results[worker_id].close()
+        self._results[worker_id] = reader
+        self._task_queues[worker_id] = task_queue
+        self._workers[worker_id] = worker
+
+    def expected_runtime(self, genome_id, default):
+        """Estimate how long a genome takes to evaluate."""
+        if genome_id in self.runtimes:
+            return self.runtimes[genome_id]
+
+        parents = [self.runtimes[p] for p in self.ancestors.get(genome_id, ())
+                   if p in self.runtimes]
+        if parents:
+            return sum(parents) / len(parents)
+        return default
+
+    def evaluate(self, genomes, config, *args):
+        """
+        Evaluate a generation and return one result per genome, in order.
+
+        Parameters:
+        -----------
+        genomes : list
+            List of (genome_id, genome) tuples.
+        config : neat.Config
+            NEAT configuration, sent to the workers once per generation.
+        *args
+            Extra arguments forwarded to ``eval_function``.
+        """
+        start = time.perf_counter()
+
+        default = (sum(self.runtimes.values()) / len(self.runtimes)) if self.runtimes else 1.0
+        expected = [self.expected_runtime(genome_id, default) for genome_id, _ in genomes]
+        order = sorted(range(len(genomes)), key=lambda i: expected[i], reverse=True)
+
+        # Longest-processing-time first: deal each genome to the lightest queue
+        queues = [deque() for _ in range(self.num_workers)]
+        loads = [0.0] * self.num_workers
+        for index in order:
+            worker_id = loads.index(min(loads))
+            queues[worker_id].append(index)
+            loads[worker_id] += expected[index]
+
+        # Replace workers lost since the last generation
+        for worker_id, worker in enumerate(self._workers):
+            if not worker.is_alive():
+                self._start_worker(worker_id)
+                self.restarts += 1
+
+        for task_queue in self._task_queues:
+            task_queue.put(('setup', config, args))
+
+        results = [None] * len(genomes)
+        busy = [0.0] * self.num_workers
+        finished_at = [0.0] * self.num_workers
+        counts = [0] * self.num_workers
+        in_flight = [None] * self.num_workers   # genome index each worker holds
+        deaths = [0] * len(genomes)
+        steals = 0
+        pending = 0
+
+        def dispatch(worker_id):
+            """Send the next genome to a worker; return True if it was stolen."""
+            stolen = not queues[worker_id]
+            if stolen:
+                victim = max((w for w in range(self.num_workers) if queues[w]),
+                             key=lambda w: loads[w])
+                index = queues[victim].pop()
+            else:
+                victim = worker_id
+                index = queues[victim].popleft()
+            loads[victim] -= expected[index]
+            in_flight[worker_id] = index
+            self._task_queues[worker_id].put(('eval', index, genomes[index][1]))
+            return stolen
+
+        def restart_dead_workers():
+            """Restart workers that died and hand them back their genome."""
+            for worker_id, worker in enumerate(self._workers):
+                if worker.is_alive():
+                    continue
+                index = in_flight[worker_id]
+                if index is not None:
+                    deaths[index] += 1
+                    if deaths[index] > self.max_restarts:
+                        raise RuntimeError(
+                            "Worker {} died {} times on genome {} (exit code {})".format(
+                                worker_id, deaths[index], genomes[index][0], worker.exitcode))
+                self._start_worker(worker_id)
+                self.restarts += 1
+                self._task_queues[worker_id].put(('setup', config, args))
+                if index is not None:
+                    self._task_queues[worker_id].put(('eval', index, genomes[index][1]))
+
+        def receive():
+            """Wait until a worker sends a result or dies; return the results sent."""
+            ready = wait(self._results + [worker.sentinel for worker in self._workers])
+            messages = []
+            for worker_id, conn in enumerate(self._results):
+                # a dead worker's pipe may still hold the result it sent before dying
+                if conn not in ready and self._workers[worker_id].is_alive():
+                    continue
+                while conn.poll():
+                    try:
+                        messages.append(conn.recv())
+                    except (EOFError, OSError):
+                        break
+            return messages
+
+        for worker_id in range(self.num_workers):
+            if any(queues):
+                steals += dispatch(worker_id)
+                pending += 1
+
+        while pending:
+            for status, worker_id, index, payload, elapsed in receive():
+                in_flight[worker_id] = None
+                pending -= 1
+                if status == 'error':
+                    raise RuntimeError(
+                        "Worker {} failed on genome {}:\n{}".format(
+                            worker_id, genomes[index][0], payload))
+
+                results[index] = payload
+                self.runtimes[genomes[index][0]] = elapsed
+                busy[worker_id] += elapsed
+                counts[worker_id] += 1
+                finished_at[worker_id] = time.perf_counter() - start
+
+                if any(queues):
+                    steals += dispatch(worker_id)
+                    pending += 1
+            restart_dead_workers()
+
+        wall = time.perf_counter() - start
+
+        # Forget runtimes of genomes that are no longer in the population
+        current = set(genome_id for genome_id, _ in genomes)
+        self.runtimes = dict((k, v) for k, v in self.runtimes.items() if k in current)
+
+        utilization = [b / wall if wall > 0 else 0.0 for b in busy]
+        # Workers that got no genome do not count as finishing early
+        first_idle = min([finished_at[w] for w in range(self.num_workers) if counts[w]] or [wall])
+        self.history.append({
+            'wall_time': wall,
+            'busy_time': busy,
+            'utilization': utilization,
+            'genomes_per_worker': counts,
+            'steals': steals,
+            'straggler_wait': wall - first_idle,
+        })
+        return results
+
+    def report(self):
+        """One-line summary of the last generation's worker utilization."""
+        if not self.history:
+            return "Worker utilization: n/a"
+        stats = self.history[-1]
+        per_worker = ", ".join("{:.0%}".format(u) for u in stats['utilization'])
+        return "Worker utilization: mean {:.0%} [{}], {} steals, straggler wait {:.2f}s of {:.2f}s".format(
+            sum(stats['utilization']) / self.num_workers, per_worker,
+            stats['steals'], stats['straggler_wait'], stats['wall_time'])
+
+    def stop(self):
+        """Shut down the worker processes."""
+        for task_queue in self._task_queues:
+            task_queue.put(None)
+        for worker in self._workers:
+            worker.join()
+        for conn in self._results:
+            conn.close()
+        self._workers = []
+        self._task_queues = []
+        self._results = []
+
+    def __del__(self):
+        if self._workers:
+            self.stop()
@@ -0,0 +1,428 @@
+from __future__ import print_function
+
+import sys
+import time
+
+import numpy as np
+from neat.activations import sigmoid_activation
+from neat.aggregations import sum_aggregation
+
+
+# Python 3.12 switched float sum() to Neumaier compensated summation
+COMPENSATED_SUM = sys.version_info >= (3, 12)
+
+# Outputs this close to the flap threshold are recomputed with the scalar
+# network, which uses math.exp instead of np.exp.
+THRESHOLD_MARGIN = 1e-9
+
+
+def _round_half_away(x):
+    """Round like pygame.Rect does when assigned a float coordinate."""
+    return np.trunc(x + np.copysign(0.5, x))
+
+
+class BatchedNetworks(object):
+    """
+    Feed-forward networks of a whole population packed into padded arrays.
+
+    Node ``k`` of every network lives in value slot ``NUM_INPUTS + k`` and
+    is computed from up to ``L`` weighted links. Missing links point at a
+    slot that is always zero; missing nodes write into a scratch slot.
+    Sums are accumulated link by link in the order ``FeedForwardNetwork``
+    uses, so a forward pass gives the same floats as ``net.activate``.
+    Networks using anything but sigmoid/sum nodes are activated with the
+    scalar network instead.
+
+    Parameters:
+    -----------
+    nets : list of neat.nn.FeedForwardNetwork
+        Compiled networks, one per genome.
+    """
+
+    def __init__(self, nets):
+        self.nets = nets
+        num_inputs = len(nets[0].input_nodes)
+        max_nodes = max(len(net.node_evals) for net in nets) if nets else 0
+        max_links = max([len(links) for net in nets for _, _, _, _, _, links in net.node_evals] or [1])
+
+        self.num_inputs = num_inputs
+        self.num_slots = num_inputs + max_nodes + 2
+        zero_slot = self.num_slots - 2
+        scratch_slot = self.num_slots - 1
+
+        n = len(nets)
+        self.src = np.full((n, max_nodes, max_links), zero_slot, dtype=np.intp)
+        self.weight = np.zeros((n, max_nodes, max_links))
+        self.bias = np.zeros((n, max_nodes))
+        self.response = np.zeros((n, max_nodes))
+        self.dst = np.full((n, max_nodes), scratch_slot, dtype=np.intp)
+        self.output = np.full(n, zero_slot, dtype=np.intp)
+        self.scalar = np.zeros(n, dtype=bool)
+
+        for row, net in enumerate(nets):
+            slot = dict((key, i) for i, key in enumerate(net.input_nodes))
+            for k, (node, act, agg, bias, response, links) in enumerate(net.node_evals):
+                if act is not sigmoid_activation or agg is not sum_aggregation:
+                    self.scalar[row] = True
+                for j, (i, w) in enumerate(links):
+                    self.src[row, k, j] = slot[i]
+                    self.weight[row, k, j] = w
+                self.bias[row, k] = bias
+                self.response[row, k] = response
+                slot[node] = num_inputs + k
+                self.dst[row, k] = num_inputs + k
+            self.output[row] = slot.get(net.output_nodes[0], zero_slot)
+
+    def take(self, rows):
+        """Return a copy restricted to the given rows (population compaction)."""
+        packed = BatchedNetworks.__new__(BatchedNetworks)
+        packed.nets = [self.nets[i] for i in rows]
+        packed.num_inputs = self.num_inputs
+        packed.num_slots = self.num_slots
+        for name in ('src', 'weight', 'bias', 'response', 'dst', 'output', 'scalar'):
+            setattr(packed, name, getattr(self, name)[rows])
+        return packed
+
+    def activate(self, inputs):
+        """
+        Forward pass for every network.
+
+        Parameters:
+        -----------
+        inputs : numpy.ndarray
+            (N, num_inputs) observations.
+
+        Returns:
+        --------
+        numpy.ndarray
+            (N,) value of the first output node.
+        """
+        n = inputs.shape[0]
+        rows = np.arange(n)
+        values = np.zeros((n, self.num_slots))
+        values[:, :self.num_inputs] = inputs
+
+        for k in range(self.src.shape[1]):
+            products = np.take_along_axis(values, self.src[:, k, :], axis=1) * self.weight[:, k, :]
+
+            total = 0.0 + products[:, 0]
+            if COMPENSATED_SUM:
+                compensation = np.zeros(n)
+                for j in range(1, products.shape[1]):
+                    x = products[:, j]
+                    t = total + x
+                    compensation += np.where(np.abs(total) >= np.abs(x),
+                                             (total - t) + x, (x - t) + total)
+                    total = t
+                total = np.where((compensation != 0.0) & np.isfinite(compensation),
+                                 total + compensation, total)
+            else:
+                for j in range(1, products.shape[1]):
+                    total = total + products[:, j]
+
+            z = np.clip(5.0 * (self.bias[:, k] + self.response[:, k] * total), -60.0, 60.0)
+            values[rows, self.dst[:, k]] = 1.0 / (1.0 + np.exp(-z))
+
+        return values[rows, self.output]
+
+
+class BatchedFlappy(object):
+    """
+    Array version of ``FlappyBird.step`` for a population of birds.
+
+    Every bird of an episode flies through the same pipes, and pipes move
+    independently of the birds, so pipe state is shared while the bird
+    state (position, velocity, flap thrust) is one array entry per bird.
+    Physics constants are read from an initialized ``FlappyBird``.
+
+    Every bird starts at rest, so the game must be created with
+    ``reset_velocity=True``: otherwise each episode starts with the fall
+    speed of the one played before it, possibly by another genome.
+
+    Parameters:
+    -----------
+    game : ple.games.FlappyBird
+        Initialized game whose constants are mirrored.
+    fps : int
+        Frame rate PLE runs the game at (the tick is 1000 / fps ms).
+    """
+
+    def __init__(self, game, fps=30):
+        if not game.reset_velocity:
+            raise ValueError("Batched physics needs a FlappyBird created with reset_velocity=True")
+        player = game.player
+        pipe = next(iter(game.pipe_group))
+
+        self.width = game.width
+        self.height = game.height
+        self.pipe_gap = game.pipe_gap
+        self.pipe_width = pipe.width
+        self.pipe_speed = pipe.speed
+        self.pipe_offsets = [offset + 60 * i for i, offset in enumerate(game.pipe_offsets)]
+        self.recycle_offset = game.width * 0.7
+        self.rewards = dict(game.rewards)
+
+        self.init_pos = game.init_pos
+        self.player_width = player.image.get_width()
+        self.player_height = player.height
+        self.image_height = player.image.get_height()
+        self.flap_power = player.FLAP_POWER
+        self.max_drop_speed = player.MAX_DROP_SPEED
+        self.gravity = player.GRAVITY
+        self.dt = (1000.0 / fps) / 1000.0
+        self.ground = 0.79 * game.height - player.height
+
+    def _pipe_x(self, offset):
+        return self.width + self.pipe_width + offset
+
+    def _next_pipe(self, pipe_x):
+        """Index of the pipe the observation refers to (see getGameState)."""
+        ahead = [(x + self.pipe_width / 2 - self.init_pos[0], j)
+                 for j, x in enumerate(pipe_x)
+                 if x + self.pipe_width / 2 > self.init_pos[0]]
+        ahead.sort(key=lambda p: p[0])
+        next_pipe, next_next_pipe = ahead[1][1], ahead[0][1]
+        if pipe_x[next_next_pipe] < pipe_x[next_pipe]:
+            next_pipe = next_next_pipe
+        return next_pipe
+
+    def run_episode(self, networks, gaps, num_pipes):
+        """
+        Play one episode with every network and the given pipe gaps.
+
+        Birds are removed from the active arrays as soon as they finish, so
+        late frames only simulate the survivors.
+
+        Returns:
+        --------
+        tuple
+            (score, distance, y_factor, frames): per-bird arrays and the
+            number of bird-frames simulated.
+        """
+        n = len(networks.nets)
+        score = np.zeros(n)
+        distance = np.zeros(n)
+        y_factor = np.zeros(n)
+        bird_frames = 0
+
+        # Shared pipe state, as left by FlappyBird.init
+        max_cont = num_pipes
+        pipe_x = [self._pipe_x(offset) for offset in self.pipe_offsets]
+        pipe_gap_start = []
+        cont_gap = 0
+        for _ in pipe_x:
+            if cont_gap == max_cont:
+                cont_gap = 0
+            pipe_gap_start.append(int(gaps[cont_gap]))
+            cont_gap += 1
+
+        # Bird state of the active birds
+        ids = np.arange(n)
+        pos_x = self.init_pos[0]
+        pos_y = np.full(n, float(self.init_pos[1]))
+        vel = np.zeros(n)
+        thrust_time = np.zeros(n)
+        flapped = np.ones(n, dtype=bool)
+        active_score = np.zeros(n)
+        active_distance = np.zeros(n)
+        centered = False   # the player rect is only centered by its first update
+
+        while ids.size:
+            bird_frames += ids.size
+
+            # === Observation and decisions ===
+            j = self._next_pipe(pipe_x)
+            top = pipe_gap_start[j]
+            bottom = top + self.pipe_gap
+            inputs = np.empty((ids.size, 3))
+            inputs[:, 0] = pos_y
+            inputs[:, 1] = bottom
+            inputs[:, 2] = (bottom - top) / 2
+
+            output = networks.activate(inputs)
+            recheck = np.flatnonzero(networks.scalar | (np.abs(output - 0.4) < THRESHOLD_MARGIN))
+            for row in recheck:
+                output[row] = networks.nets[row].activate(tuple(inputs[row]))[0]
+            flap = output >= 0.4
+
+            # === FlappyBird.step ===
+            flap &= pos_y > -2.0 * self.image_height
+            vel[flap] = 0.0
+            flapped |= flap
+
+            if centered:
+                bird_left = _round_half_away(float(pos_x)) - self.player_width // 2
+                bird_top = _round_half_away(pos_y) - self.player_height // 2
+            else:
+                bird_left = 0
+                bird_top = np.zeros(ids.size)
+
+            decrements = np.zeros(ids.size, dtype=int)
+            passed = 0
+            hits = None
+            for p in range(len(pipe_x)):
+                if hits is None:
+                    # Pipe-gap violations among the pipes the bird rect touches
+                    hits = np.zeros(ids.size, dtype=int)
+                    for h in range(len(pipe_x)):
+                        pipe_left = _round_half_away(pipe_x[h]) - self.pipe_width // 2
+                        pipe_top = _round_half_away(self.height / 2) - self.height // 2
+                        hit = ((bird_left < pipe_left + self.pipe_width)
+                               & (bird_left + self.player_width > pipe_left)
+                               & (bird_top < pipe_top + self.height)
+                               & (bird_top + self.player_height > pipe_top))
+                        top_check = (pos_y - self.player_height / 2 + 12) <= pipe_gap_start[h]
+                        bot_check = (pos_y + self.player_height) > pipe_gap_start[h] + self.pipe_gap
+                        hits += hit * (top_check.astype(int) + bot_check.astype(int))
+
+                x = pipe_x[p]
+                if (x - self.pipe_width / 2 - 20) <= pos_x < (x + self.pipe_width / 2):
+                    decrements += hits
+
+                if (x - self.pipe_width / 2) <= pos_x < (x - self.pipe_width / 2 + 4):
+                    passed += 1
+
+                if x < -self.pipe_width:
+                    if cont_gap == max_cont:
+                        cont_gap = 0
+                    pipe_gap_start[p] = int(gaps[cont_gap])
+                    cont_gap += 1
+                    pipe_x[p] = self._pipe_x(self.recycle_offset)
+                    hits = None
+
+            decrements += pos_y >= self.ground
+            decrements += pos_y <= 0
+
+            # BirdPlayer.update
+            gravity = (vel < self.max_drop_speed) & (thrust_time == 0.0)
+            vel[gravity] += self.gravity
+            thrust = ((thrust_time + self.dt) <= (1.0 / 30.0)) & flapped
+            thrust_time = np.where(thrust, thrust_time + self.dt, 0.0)
+            vel[thrust] += -1.0 * self.flap_power
+            flapped &= thrust
+            pos_y = pos_y + vel
+            centered = True
+
+            pipe_x = [x - self.pipe_speed for x in pipe_x]
+
+            # === PLE reward and the episode loop of play_scenario ===
+            dead = decrements > 0
+            reward = (self.rewards["tick"] + self.rewards["positive"] * passed
+                      + np.where(dead, self.rewards["loss"], 0.0))
+            gained = reward > 0
+            active_score += gained
+            finished = gained & (active_score == num_pipes)
+            active_distance += ~finished
+
+            crashed = dead & ~finished
+            if crashed.any():
+                j = self._next_pipe(pipe_x)
+                post_top = pipe_gap_start[j]
+                post_bottom = post_top + self.pipe_gap
+                y_factor[ids[crashed]] = np.abs(
+                    pos_y[crashed] - (post_top + (post_bottom - post_top) / 2))
+
+            done = finished | crashed
+            if done.any():
+                score[ids[done]] = active_score[done]
+                distance[ids[done]] = active_distance[done]
+
+                keep = np.flatnonzero(~done)
+                ids = ids[keep]
+                pos_y = pos_y[keep]
+                vel = vel[keep]
+                thrust_time = thrust_time[keep]
+                flapped = flapped[keep]
+                active_score = active_score[keep]
+                active_distance = active_distance[keep]
+                networks = networks.take(keep)
+
+        return score, distance, y_factor, bird_frames
+
+
+class BatchedEvaluator(object):
+    """
+    Evaluate a whole generation at once with batched networks and physics.
+
+    Drop-in replacement for the per-genome loop of ``eval_genomes``: it
+    returns the same ``(scenario_scores, raw_scores, outcomes)`` tuple per
+    genome as ``evaluate_genome``.
+
+    Parameters:
+    -----------
+    game : ple.games.FlappyBird
+        Initialized game whose physics constants are mirrored.
+    num_pipes : int
+        Pipes to clear to finish a scenario.
+    """
+
+    def __init__(self, game, num_pipes):
+        self.physics = BatchedFlappy(game)
+        self.num_pipes = num_pipes
+        self.history = []   # per-generation frame counts and timings
+
+    def evaluate(self, genomes, config, selector, fitness, scenarios):
+        """
+        Evaluate every genome on every scenario scheduled by the selector.
+
+        Episode scores of all genomes come from one ``fitness.episode_score``
+        call on the result arrays.
+        """
+        import neat
+
+        start = time.perf_counter()
+        n = len(genomes)
+        networks = BatchedNetworks([neat.nn.FeedForwardNetwork.create(genome, config)
+                                    for _, genome in genomes])
+
+        scenario_scores = [[] for _ in range(n)]
+        raw_scores = [[] for _ in range(n)]
+        outcomes = [[] for _ in range(n)]
+        bird_frames = 0
+
+        for i, base_gaps in enumerate(scenarios):
+            if not selector.is_active(i):
+                for row in range(n):
+                    scenario_scores[row].append(selector.dropped_score(i))
+                    raw_scores[row].append(float(self.num_pipes))
+                continue
+
+            episodes = selector.episodes(i)
+            total_score = [0.0] * n
+            total_raw = [0.0] * n
+            for episode in range(episodes):
+                gaps = selector.episode_gaps(i, episode, base_gaps)
+                score, distance, y_factor, frames = self.physics.run_episode(
+                    networks, gaps, self.num_pipes)
+                bird_frames += frames
+
+                normalized = fitness.episode_score(score, distance, y_factor, self.physics.height)
+                passed = score == self.num_pipes
+                episode_frames = (distance + passed).astype(int).tolist()
+                for row in range(n):
+                    outcomes[row].append((i, bool(passed[row]), float(normalized[row]), episode_frames[row]))
+                    total_score[row] += float(normalized[row])
+                    total_raw[row] += float(score[row])
+
+            for row in range(n):
+                scenario_scores[row].append(total_score[row] / episodes)
+                raw_scores[row].append(total_raw[row] / episodes)
+
+        wall = time.perf_counter() - start
+        self.history.append({
+            'wall_time': wall,
+            'bird_frames': bird_frames,
+            'bird_frames_per_second': bird_frames / wall if wall > 0 else 0.0,
+        })
+        return list(zip(scenario_scores, raw_scores, outcomes))
+
+    def report(self):
+        """One-line summary of the last generation's simulation throughput."""
+        if not self.history:
+            return "Batched evaluation: n/a"
+        stats = self.history[-1]
+        return "Batched evaluation: {} bird-frames in {:.2f}s ({:.0f}/s)".format(
+            stats['bird_frames'], stats['wall_time'], stats['bird_frames_per_second'])
+
+    def stop(self):
+        """Nothing to release; present for parity with the parallel evaluators."""
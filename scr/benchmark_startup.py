@@ -0,0 +1,78 @@
+from __future__ import print_function
+
+import argparse
+import os
+import subprocess
+import sys
+import time
+
+SCR_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Timed code run in a fresh interpreter; prints the elapsed seconds of each step
+CHILD = """
+import sys, time
+start = time.perf_counter()
+sys.path.insert(0, {scr!r})
+import train_agent
+imported = time.perf_counter()
+{extra}
+print(imported - start, time.perf_counter() - imported)
+"""
+
+STAGES = [
+    # (name, code run after the import; its time is reported separately)
+    ('import train_agent', ''),
+    ('first environment', 'train_agent.get_env()'),
+    ('worker environment', 'train_agent.make_worker_env()'),
+]
+
+
+def run_stage(extra):
+    """Run one stage in a fresh interpreter; return (process, import, extra) seconds."""
+    code = CHILD.format(scr=SCR_DIR, extra=extra)
+    env = dict(os.environ, SDL_VIDEODRIVER='dummy', SDL_AUDIODRIVER='dummy')
+    start = time.perf_counter()
+    output = subprocess.check_output([sys.executable, '-c', code], env=env,
+                                     stderr=subprocess.DEVNULL, universal_newlines=True)
+    process = time.perf_counter() - start
+    import_time, extra_time = map(float, output.split()[-2:])
+    return process, import_time, extra_time
+
+
+def slowest_imports(count):
+    """Modules with the largest cumulative import time, from ``python -X importtime``."""
+    code = "import sys; sys.path.insert(0, {!r}); import train_agent".format(SCR_DIR)
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', code],
+                            stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+                            universal_newlines=True)
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        rows.append((int(cumulative), name.rstrip()))
+    return sorted(rows, reverse=True)[:count]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure the startup time of the training entry point.")
+    parser.add_argument('--repeat', type=int, default=5, help="Fresh interpreters per stage")
+    parser.add_argument('--imports', type=int, default=0, metavar='N',
+                        help="Also list the N slowest imports (cumulative)")
+    args = parser.parse_args()
+
+    print("{:<20}{:>12}{:>12}{:>12}".format('stage', 'process ms', 'import ms', 'stage ms'))
+    for name, extra in STAGES:
+        runs = sorted(run_stage(extra) for _ in range(args.repeat))
+        median = runs[len(runs) // 2]
+        print("{:<20}{:>12.1f}{:>12.1f}{:>12.1f}".format(
+            name, median[0] * 1e3, median[1] * 1e3, median[2] * 1e3))
+
+    if args.imports:
+        print("\nSlowest imports (cumulative ms):")
+        for cumulative, name in slowest_imports(args.imports):
+            print("  {:>9.1f}  {}".format(cumulative / 1e3, name))
+
+
+if __name__ == '__main__':
+    main()
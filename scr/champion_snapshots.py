@@ -0,0 +1,108 @@
+from __future__ import print_function
+
+import copy
+import hashlib
+import json
+import os
+
+import neat
+
+
+def genome_signature(genome):
+    """
+    Topology and weights of a genome, in a canonical order.
+
+    Two genomes with the same signature draw the same network diagram.
+    """
+    nodes = sorted((key, node.bias, node.response, node.activation, node.aggregation)
+                   for key, node in genome.nodes.items())
+    connections = sorted((key, connection.weight, connection.enabled)
+                         for key, connection in genome.connections.items())
+    return nodes, connections
+
+
+def genome_digest(genome):
+    """Hex digest of genome_signature, used to address champion snapshots."""
+    return hashlib.sha1(repr(genome_signature(genome)).encode()).hexdigest()
+
+
+class ChampionSnapshotReporter(neat.reporting.BaseReporter):
+    """
+    NEAT reporter that draws the current champion every ``interval`` generations.
+
+    Snapshots are content-addressed: the diagram of a champion is written to
+    ``<directory>/<digest>.gv`` (and its rendering), where the digest covers
+    the topology and weights. A champion that did not change since the last
+    snapshot is not drawn again; ``index.jsonl`` in the same directory maps
+    every snapshot generation to its digest, fitness and size, so topology
+    growth can be followed while a long run goes on.
+
+    Drawing happens on a RenderPipeline, i.e. in a background process. The
+    pipeline is not part of the reporter's pickled state (checkpoints pickle
+    every reporter); a restored reporter only tracks the champion until
+    ``pipeline`` is set again.
+
+    Parameters:
+    -----------
+    pipeline : render_pipeline.RenderPipeline
+        Pipeline the diagrams are rendered on.
+    interval : int
+        Generations between snapshots.
+    node_names : dict, optional
+        Names of the input and output nodes in the diagram.
+    directory : str
+        Subdirectory of the pipeline's output directory for the snapshots.
+    """
+
+    def __init__(self, pipeline, interval, node_names=None, directory='champions'):
+        self.pipeline = pipeline
+        self.interval = interval
+        self.node_names = node_names
+        self.directory = directory
+        self.generation = None
+        self.champion = None
+        self.last_digest = None
+        self.history = []   # (generation, digest) of every snapshot
+
+        path = os.path.join(pipeline.output_dir, directory)
+        if not os.path.isdir(path):
+            os.makedirs(path)
+        self.index_path = os.path.join(path, 'index.jsonl')
+
+    def __getstate__(self):
+        state = dict(self.__dict__)
+        state['pipeline'] = None
+        return state
+
+    def start_generation(self, generation):
+        self.generation = generation
+
+    def post_evaluate(self, config, population, species, best_genome):
+        if self.champion is None or best_genome.fitness > self.champion.fitness:
+            # Elites are evaluated again in later generations; keep the
+            # fitness this champion was chosen on
+            self.champion = copy.deepcopy(best_genome)
+
+    def end_generation(self, config, population, species_set):
+        if self.pipeline is None or self.champion is None or (self.generation + 1) % self.interval:
+            return
+
+        import neat_visualizations
+
+        digest = genome_digest(self.champion)
+        self.history.append((self.generation, digest))
+        with open(self.index_path, 'a') as f:
+            f.write(json.dumps({
+                'generation': self.generation,
+                'digest': digest,
+                'fitness': self.champion.fitness,
+                'nodes': len(self.champion.nodes),
+                'connections': sum(1 for c in self.champion.connections.values() if c.enabled),
+            }) + "\n")
+
+        if digest == self.last_digest:
+            return
+        self.last_digest = digest
+        self.pipeline.submit(os.path.join(self.directory, digest + '.gv'),
+                             neat_visualizations.draw_neural_network, config, self.champion,
+                             node_names=self.node_names, key=digest)
@@ -0,0 +1,38 @@
+from __future__ import print_function
+
+import os
+
+import neat
+
+
+class RetainingCheckpointer(neat.Checkpointer):
+    """
+    ``neat.Checkpointer`` that only keeps the most recent checkpoints on disk.
+
+    Parameters:
+    -----------
+    generation_interval : int
+        Generations between checkpoints.
+    keep : int
+        Number of checkpoints to keep; older ones are deleted after each
+        save. 0 keeps every checkpoint, like ``neat.Checkpointer``.
+    filename_prefix : str
+        Prefix of the checkpoint files, followed by the generation number.
+    """
+
+    def __init__(self, generation_interval=1, keep=0, filename_prefix='neat-checkpoint-'):
+        neat.Checkpointer.__init__(self, generation_interval, filename_prefix=filename_prefix)
+        self.keep = keep
+        self.saved = []   # checkpoint files written by this run, oldest first
+
+    def save_checkpoint(self, config, population, species_set, generation):
+        neat.Checkpointer.save_checkpoint(self, config, population, species_set, generation)
+        self.saved.append('{0}{1}'.format(self.filename_prefix, generation))
+
+        if self.keep:
+            while len(self.saved) > self.keep:
+                old = self.saved.pop(0)
+                try:
+                    os.remove(old)
+                except OSError:
+                    pass
@@ -0,0 +1,353 @@
+from __future__ import print_function
+
+import argparse
+import ipaddress
+import multiprocessing
+import os
+import queue
+import socket
+import sys
+import threading
+import time
+import traceback
+from multiprocessing.connection import Client, Listener
+
+
+def _is_loopback(host):
+    if host == 'localhost':
+        return True
+    try:
+        return ipaddress.ip_address(host).is_loopback
+    except ValueError:
+        return False
+
+
+def run_worker(address, authkey, eval_function, env_factory, retry_seconds=30.0):
+    """
+    Serve genome batches from a coordinator until it shuts down.
+
+    The worker keeps a single environment for its whole lifetime and
+    evaluates every genome of a batch with
+    ``eval_function(env, genome, config, *args)``.
+
+    Parameters:
+    -----------
+    address : tuple
+        (host, port) of the coordinator.
+    authkey : bytes
+        Shared secret of the coordinator.
+    eval_function : callable
+        Per-genome evaluation function.
+    env_factory : callable
+        Builds the persistent environment of this worker.
+    retry_seconds : float
+        How long to keep retrying the connection while the coordinator starts.
+    """
+    deadline = time.time() + retry_seconds
+    while True:
+        try:
+            conn = Client(address, authkey=authkey)
+            break
+        except OSError:
+            if time.time() > deadline:
+                raise
+            time.sleep(0.5)
+
+    env = env_factory()
+    config = None
+    args = ()
+    conn.send(('hello', '{}:{}'.format(socket.gethostname(), os.getpid())))
+
+    try:
+        while True:
+            message = conn.recv()
+            if message is None:
+                break
+
+            if message[0] == 'setup':
+                _, _, config, args = message
+                continue
+
+            _, batch_id, tasks = message
+            results = []
+            try:
+                for index, genome in tasks:
+                    start = time.perf_counter()
+                    result = eval_function(env, genome, config, *args)
+                    results.append((index, result, time.perf_counter() - start))
+            except Exception:
+                conn.send(('error', batch_id, traceback.format_exc()))
+                continue
+            conn.send(('results', batch_id, results))
+    except EOFError:
+        pass
+    finally:
+        conn.close()
+
+
+class _Node(object):
+    """Coordinator-side bookkeeping for one connected worker."""
+
+    def __init__(self, name, conn):
+        self.name = name
+        self.conn = conn
+        self.generation = None   # generation whose setup the node has received
+        self.alive = True
+        self.genomes = 0         # genomes evaluated in the current generation
+        self.busy_time = 0.0     # evaluation time reported in the current generation
+
+
+class DistributedEvaluator(object):
+    """
+    Coordinator that farms genome evaluation out to worker nodes over TCP.
+
+    Workers connect with :func:`run_worker` (or ``python distributed_evaluator.py
+    HOST:PORT`` on another machine). Every generation the coordinator sends the
+    NEAT config and extra arguments to each node once, then hands out batches
+    of ``(index, genome)`` pairs; results come back one message per batch.
+    When a node drops its connection (or exceeds ``timeout`` on a batch), the
+    batch it held is put back in the queue for the remaining nodes.
+
+    Messages are pickled, so anyone holding the authkey can run code on the
+    coordinator and on the workers. The coordinator listens on the loopback
+    interface by default; another address needs an explicit secret.
+
+    Parameters:
+    -----------
+    address : tuple
+        (host, port) to listen on; port 0 picks a free port.
+    authkey : bytes, optional
+        Shared secret workers must present. Required unless ``address`` is a
+        loopback address, in which case a random one is generated (only
+        workers started with :meth:`spawn_local_workers` can then connect).
+    batch_size : int
+        Genomes per batch message.
+    timeout : float, optional
+        Seconds a node may spend on one batch before it is considered lost.
+    node_wait : float
+        Seconds :meth:`evaluate` waits for a node to connect while none is
+        alive before it raises RuntimeError.
+    """
+
+    def __init__(self, address=('127.0.0.1', 6000), authkey=None,
+                 batch_size=4, timeout=None, node_wait=60.0):
+        if authkey is None:
+            if not _is_loopback(address[0]):
+                raise ValueError(
+                    "An explicit authkey is required to listen on {}".format(address[0]))
+            authkey = os.urandom(32)
+        self.authkey = authkey
+        self.batch_size = batch_size
+        self.timeout = timeout
+        self.node_wait = node_wait
+        self.history = []   # per-generation throughput statistics
+
+        self._listener = Listener(address, authkey=authkey)
+        self.address = self._listener.address
+        self._nodes = []
+        self._lock = threading.Lock()
+        self._tasks = queue.Queue()
+        self._results = queue.Queue()
+        self._generation = 0
+        self._setup = None
+        self._closed = False
+        self._local_workers = []
+
+        self._accept_thread = threading.Thread(target=self._accept_loop)
+        self._accept_thread.daemon = True
+        self._accept_thread.start()
+
+    def spawn_local_workers(self, count, eval_function, env_factory):
+        """Start ``count`` worker processes on this host (single-host mode)."""
+        host = self.address[0]
+        if host in ('0.0.0.0', ''):
+            host = '127.0.0.1'
+        for _ in range(count):
+            worker = multiprocessing.Process(
+                target=run_worker,
+                args=((host, self.address[1]), self.authkey, eval_function, env_factory)
+            )
+            worker.daemon = True
+            worker.start()
+            self._local_workers.append(worker)
+
+    def _accept_loop(self):
+        while not self._closed:
+            try:
+                conn = self._listener.accept()
+            except Exception:
+                if self._closed:
+                    return
+                continue
+            if self._closed:
+                conn.close()
+                return
+
+            try:
+                _, name = conn.recv()
+            except (EOFError, OSError):
+                conn.close()
+                continue
+
+            node = _Node(name, conn)
+            with self._lock:
+                self._nodes.append(node)
+            handler = threading.Thread(target=self._serve_node, args=(node,))
+            handler.daemon = True
+            handler.start()
+
+    def _serve_node(self, node):
+        while not self._closed:
+            try:
+                batch = self._tasks.get(timeout=0.5)
+            except queue.Empty:
+                continue
+
+            batch_id, tasks = batch
+            try:
+                if node.generation != self._generation:
+                    node.conn.send(('setup',) + self._setup)
+                    node.generation = self._generation
+                node.conn.send(('batch', batch_id, tasks))
+                if self.timeout is not None and not node.conn.poll(self.timeout):
+                    raise EOFError("batch timed out")
+                reply = node.conn.recv()
+            except (EOFError, OSError):
+                # Lost the node: hand its batch to someone else
+                node.alive = False
+                self._tasks.put(batch)
+                try:
+                    node.conn.close()
+                except OSError:
+                    pass
+                return
+
+            if reply[0] == 'error':
+                self._results.put(('error', node, reply[2]))
+                continue
+
+            for index, result, elapsed in reply[2]:
+                node.genomes += 1
+                node.busy_time += elapsed
+                self._results.put(('done', index, result))
+
+    def evaluate(self, genomes, config, *args):
+        """
+        Evaluate a generation on the connected nodes and return results in order.
+
+        Blocks until every genome has been evaluated; batches of lost nodes
+        are requeued, so the call completes as long as one node remains.
+        Raises RuntimeError once no node has been alive for ``node_wait``
+        seconds.
+        """
+        start = time.perf_counter()
+        self._generation += 1
+        self._setup = (self._generation, config, args)
+        with self._lock:
+            self._nodes = [node for node in self._nodes if node.alive]
+            for node in self._nodes:
+                node.genomes = 0
+                node.busy_time = 0.0
+
+        for batch_id, first in enumerate(range(0, len(genomes), self.batch_size)):
+            tasks = [(index, genomes[index][1])
+                     for index in range(first, min(first + self.batch_size, len(genomes)))]
+            self._tasks.put((batch_id, tasks))
+
+        results = [None] * len(genomes)
+        remaining = len(genomes)
+        orphaned_since = None
+        while remaining:
+            try:
+                message = self._results.get(timeout=1.0)
+            except queue.Empty:
+                with self._lock:
+                    alive = any(node.alive for node in self._nodes)
+                if alive:
+                    orphaned_since = None
+                elif orphaned_since is None:
+                    orphaned_since = time.perf_counter()
+                elif time.perf_counter() - orphaned_since > self.node_wait:
+                    self._drop_tasks()
+                    raise RuntimeError(
+                        "No worker node alive for {:.0f}s with {} genomes left to evaluate".format(
+                            self.node_wait, remaining))
+                continue
+            if message[0] == 'error':
+                raise RuntimeError("Node {} failed:\n{}".format(message[1].name, message[2]))
+            _, index, result = message
+            if results[index] is None:
+                results[index] = result
+                remaining -= 1
+
+        wall = time.perf_counter() - start
+        with self._lock:
+            nodes = list(self._nodes)
+        self.history.append({
+            'wall_time': wall,
+            'genomes_per_second': len(genomes) / wall if wall > 0 else 0.0,
+            'nodes': dict((node.name, {
+                'genomes': node.genomes,
+                'busy_time': node.busy_time,
+                'genomes_per_second': node.genomes / wall if wall > 0 else 0.0,
+                'alive': node.alive,
+            }) for node in nodes),
+        })
+        return results
+
+    def _drop_tasks(self):
+        # batches of an abandoned generation must not reach later ones
+        while True:
+            try:
+                self._tasks.get_nowait()
+            except queue.Empty:
+                return
+
+    def report(self):
+        """One-line summary of the last generation's per-node throughput."""
+        if not self.history:
+            return "Node throughput: n/a"
+        stats = self.history[-1]
+        parts = ["{} {:.1f} genomes/s{}".format(
+            name, node['genomes_per_second'], "" if node['alive'] else " (lost)")
+            for name, node in sorted(stats['nodes'].items())]
+        return "Node throughput: {:.1f} genomes/s total [{}]".format(
+            stats['genomes_per_second'], ", ".join(parts))
+
+    def stop(self):
+        """Tell the nodes to shut down and close the listener."""
+        self._closed = True
+        with self._lock:
+            nodes = list(self._nodes)
+        for node in nodes:
+            try:
+                node.conn.send(None)
+                node.conn.close()
+            except OSError:
+                pass
+
+        # Wake up the accept() call so the accept thread can exit
+        host = self.address[0] if self.address[0] not in ('0.0.0.0', '') else '127.0.0.1'
+        try:
+            Client((host, self.address[1]), authkey=self.authkey).close()
+        except Exception:
+            pass
+        self._listener.close()
+
+        for worker in self._local_workers:
+            worker.join()
+        self._local_workers = []
+
+
+if __name__ == '__main__':
+    # Entry point for remote worker nodes
+    parser = argparse.ArgumentParser(description="Flappy NEAT distributed evaluation worker.")
+    parser.add_argument('coordinator', help="Coordinator address as HOST:PORT")
+    parser.add_argument('--authkey', required=True, help="Shared secret of the coordinator")
+    cli_args = parser.parse_args()
+
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    from train_agent import evaluate_genome, make_worker_env
+
+    host, port = cli_args.coordinator.rsplit(':', 1)
+    run_worker((host, int(port)), cli_args.authkey.encode(), evaluate_genome, make_worker_env)
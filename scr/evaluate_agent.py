@@ -38,8 +38,9 @@ scenario_gaps = [[randint(0, 160) for _ in range(NUM_PIPES)] for _ in range(NUM_
 
 # === GAME ENVIRONMENT SETUP ===
 
-# Initialize Flappy Bird game environment with custom pipe gap configuration
-game = FlappyBird(Var=True, Gap_Vector=random_gaps, MAX_CONT=NUM_PIPES, pipe_gap=100)
+# Initialize Flappy Bird game environment with custom pipe gap configuration,
+# episodes starting at rest as in training
+game = FlappyBird(Var=True, Gap_Vector=random_gaps, MAX_CONT=NUM_PIPES, pipe_gap=100, reset_velocity=True)
 env = PLE(game)
 
 # === NEAT SETUP ===
@@ -0,0 +1,160 @@
+from __future__ import print_function
+
+from configparser import ConfigParser
+
+import numpy as np
+
+# Name of the section read from the NEAT configuration file
+CONFIG_SECTION = 'FlappyFitness'
+
+# === OBJECTIVE REGISTRY ===
+OBJECTIVES = {}
+
+
+def register_objective(name):
+    """
+    Register an episode objective under ``name``.
+
+    An objective is called as ``objective(fitness, score, distance, y_factor, height)``
+    with the FitnessFunction holding the weights and normalizers, and must only use
+    arithmetic that works on floats and on NumPy arrays alike.
+    """
+    def decorator(function):
+        OBJECTIVES[name] = function
+        return function
+    return decorator
+
+
+@register_objective('distance_score_alignment')
+def distance_score_alignment(fitness, score, distance, y_factor, height):
+    """Reward frames survived and pipes passed, penalize distance to the gap center."""
+    return (
+        fitness.weight_distance * (distance / fitness.distance_normalizer)
+        + fitness.weight_score * (score / fitness.score_normalizer)
+        - fitness.weight_y_factor * (y_factor / height)
+    )
+
+
+@register_objective('survival')
+def survival(fitness, score, distance, y_factor, height):
+    """Reward frames survived only."""
+    return fitness.weight_distance * (distance / fitness.distance_normalizer)
+
+
+@register_objective('pipes')
+def pipes(fitness, score, distance, y_factor, height):
+    """Reward pipes passed only."""
+    return fitness.weight_score * (score / fitness.score_normalizer)
+
+
+class FitnessFunction(object):
+    """
+    Fitness of Flappy Bird genomes, from single episodes to the final value.
+
+    ``episode_score`` turns the raw result of a scenario episode (pipes
+    passed, frames survived, distance to the gap center at the crash) into a
+    normalized score using the registered objective. Calling the object
+    combines the per-scenario scores of many genomes into their fitness with
+    the scenario weights. Both steps accept whole arrays, so batched
+    evaluators score a generation in one call.
+
+    The defaults reproduce the original hardcoded formula. Values can be
+    overridden in a ``[FlappyFitness]`` section of the NEAT configuration
+    file, which NEAT itself ignores::
+
+        [FlappyFitness]
+        objective           = distance_score_alignment
+        weight_distance     = 1.0
+        weight_score        = 1.0
+        weight_y_factor     = 0.08
+        distance_normalizer = 195
+        score_normalizer    = 3
+        scenario_weights    = 1.0 2.0 6.0
+        round_digits        = 4
+    """
+
+    def __init__(self, objective='distance_score_alignment', weight_distance=1.0,
+                 weight_score=1.0, weight_y_factor=0.08, distance_normalizer=195,
+                 score_normalizer=3, scenario_weights=(1.0, 2.0, 6.0), round_digits=4):
+        if objective not in OBJECTIVES:
+            raise ValueError("Unknown fitness objective {!r}; registered: {}".format(
+                objective, ", ".join(sorted(OBJECTIVES))))
+
+        self.objective = objective
+        self.weight_distance = weight_distance
+        self.weight_score = weight_score
+        self.weight_y_factor = weight_y_factor
+        self.distance_normalizer = distance_normalizer
+        self.score_normalizer = score_normalizer
+        self.scenario_weights = list(scenario_weights)
+        self.round_digits = round_digits
+
+    @classmethod
+    def from_config_file(cls, filename, section=CONFIG_SECTION):
+        """
+        Build a FitnessFunction from a section of a NEAT-style config file.
+
+        Missing keys (or a missing section) keep their default values.
+        """
+        parser = ConfigParser()
+        with open(filename) as f:
+            parser.read_file(f)
+
+        if not parser.has_section(section):
+            return cls()
+
+        kwargs = {}
+        for key, value in parser.items(section):
+            if key == 'objective':
+                kwargs[key] = value.strip()
+            elif key == 'scenario_weights':
+                kwargs[key] = [float(w) for w in value.split()]
+            elif key == 'round_digits':
+                kwargs[key] = int(value)
+            elif key in ('weight_distance', 'weight_score', 'weight_y_factor',
+                         'distance_normalizer', 'score_normalizer'):
+                kwargs[key] = float(value)
+            else:
+                raise ValueError("Unknown key {!r} in [{}]".format(key, section))
+        return cls(**kwargs)
+
+    def episode_score(self, score, distance, y_factor, height):
+        """
+        Normalized score of scenario episodes.
+
+        Parameters:
+        -----------
+        score, distance, y_factor : float or numpy.ndarray
+            Pipes passed, frames survived and distance to the gap center.
+        height : int
+            Screen height used to normalize ``y_factor``.
+        """
+        return OBJECTIVES[self.objective](self, score, distance, y_factor, height)
+
+    def __call__(self, scenario_scores):
+        """
+        Weighted average of per-scenario scores.
+
+        Parameters:
+        -----------
+        scenario_scores : array_like
+            (N, num_scenarios) normalized scores, one row per genome.
+
+        Returns:
+        --------
+        list of float
+            Fitness of each genome, rounded to ``round_digits``.
+        """
+        scores = np.asarray(scenario_scores, dtype=float)
+        if scores.ndim != 2 or scores.shape[1] != len(self.scenario_weights):
+            raise ValueError("Expected scores of shape (N, {}), got {}".format(
+                len(self.scenario_weights), scores.shape))
+
+        # Accumulate scenario by scenario, in the order the scalar formula used
+        total = np.zeros(scores.shape[0])
+        for column, weight in enumerate(self.scenario_weights):
+            total = total + scores[:, column] * weight
+        weighted = total / sum(self.scenario_weights)
+
+        # Python's round() is correctly rounded; np.round can differ on ties
+        return [round(value, self.round_digits) for value in weighted.tolist()]
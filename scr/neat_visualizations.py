@@ -2,12 +2,66 @@ from __future__ import print_function
 
 import copy
 import warnings
-import graphviz
-import matplotlib
-import matplotlib.pyplot as plt
 import numpy as np
 
-matplotlib.use("TkAgg")  
+try:
+    import graphviz
+except ImportError:
+    graphviz = None
+
+try:
+    import matplotlib
+except ImportError:
+    matplotlib = None
+
+_plt = None
+
+
+def _pyplot():
+    """
+    Import pyplot for interactive use, preferring the TkAgg backend.
+
+    Figures that are only saved never go through pyplot (see new_figure), so
+    pyplot and Tk are only loaded when a window has to be shown.
+    """
+    global _plt
+    if _plt is None:
+        import matplotlib.pyplot as plt
+        try:
+            plt.switch_backend("TkAgg")
+        except ImportError:
+            # No Tk on this machine (e.g. headless nodes): keep the default
+            # backend, figures are still saved to files
+            pass
+        _plt = plt
+    return _plt
+
+
+def new_figure():
+    """
+    Create a figure drawn by the non-interactive Agg canvas.
+
+    The figure is independent of pyplot's global state, so it can be
+    rendered in any thread or process and is freed with its last reference.
+    """
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+
+    fig = Figure()
+    FigureCanvasAgg(fig)
+    return fig
+
+
+def _open_figure(view):
+    return _pyplot().figure() if view else new_figure()
+
+
+def _finish_figure(fig, filename, view):
+    fig.savefig(filename)
+    if view:
+        plt = _pyplot()
+        plt.show()
+        plt.close(fig)
 
 
 def plot_fitness_statistics(statistics, ylog=False, view=False, filename='avg_fitness.svg'):
@@ -20,34 +74,71 @@ def plot_fitness_statistics(statistics, ylog=False, view=False, filename='avg_fi
         view (bool): Whether to display the plot after saving.
         filename (str): Output file name for the saved plot.
     """
-    if plt is None:
+    best_fitness = [genome.fitness for genome in statistics.most_fit_genomes]
+    plot_fitness_curves(best_fitness, statistics.get_fitness_mean(), statistics.get_fitness_stdev(),
+                        ylog=ylog, view=view, filename=filename)
+
+
+def plot_fitness_curves(best_fitness, avg_fitness, stdev_fitness, ylog=False, view=False,
+                        filename='avg_fitness.svg'):
+    """
+    Plot average (with one standard deviation) and best fitness per generation.
+
+    Same figure as plot_fitness_statistics, from plain lists.
+    """
+    if matplotlib is None:
         warnings.warn("Plotting not available: matplotlib is not installed.")
         return
 
-    generations = range(len(statistics.most_fit_genomes))
-    best_fitness = [genome.fitness for genome in statistics.most_fit_genomes]
-    avg_fitness = np.array(statistics.get_fitness_mean())
-    stdev_fitness = np.array(statistics.get_fitness_stdev())
+    generations = range(len(best_fitness))
+    avg_fitness = np.array(avg_fitness)
+    stdev_fitness = np.array(stdev_fitness)
 
-    plt.plot(generations, avg_fitness, 'b-', label="Average")
-    plt.plot(generations, avg_fitness - stdev_fitness, 'g-.', label="-1 SD")
-    plt.plot(generations, avg_fitness + stdev_fitness, 'g-.', label="+1 SD")
-    plt.plot(generations, best_fitness, 'r-', label="Best")
+    fig = _open_figure(view)
+    ax = fig.add_subplot()
+    ax.plot(generations, avg_fitness, 'b-', label="Average")
+    ax.plot(generations, avg_fitness - stdev_fitness, 'g-.', label="-1 SD")
+    ax.plot(generations, avg_fitness + stdev_fitness, 'g-.', label="+1 SD")
+    ax.plot(generations, best_fitness, 'r-', label="Best")
 
-    plt.title("Population Average and Best Fitness")
-    plt.xlabel("Generations")
-    plt.ylabel("Fitness")
-    plt.grid()
-    plt.legend(loc="best")
+    ax.set_title("Population Average and Best Fitness")
+    ax.set_xlabel("Generations")
+    ax.set_ylabel("Fitness")
+    ax.grid()
+    ax.legend(loc="best")
 
     if ylog:
-        plt.gca().set_yscale('symlog')
+        ax.set_yscale('symlog')
 
-    plt.savefig(filename)
-    if view:
-        plt.show()
+    _finish_figure(fig, filename, view)
+
+
+def plot_generation_curves(curves, title, ylabel, view=False, filename=None):
+    """
+    Plot one value per generation for several series.
+
+    Parameters:
+        curves (list): (label, color, values) of each series; values[0] is generation 1.
+        title (str): Figure title.
+        ylabel (str): Y-axis label.
+        view (bool): Whether to display the plot after saving.
+        filename (str): Output file name for the saved plot.
+    """
+    if matplotlib is None:
+        warnings.warn("Plotting not available: matplotlib is not installed.")
+        return
+
+    fig = _open_figure(view)
+    ax = fig.add_subplot()
+    for label, color, values in curves:
+        ax.plot(range(1, len(values) + 1), values, linewidth=2, color=color, label=label)
+    ax.set_title(title, fontsize=18)
+    ax.set_xlabel("Generations", fontsize=12)
+    ax.set_ylabel(ylabel, fontsize=12)
+    ax.grid()
+    ax.legend(loc='upper right')
 
-    plt.close()
+    _finish_figure(fig, filename, view)
 
 
 def plot_spiking_neuron_activity(spikes, view=False, filename=None, title=None):
@@ -69,6 +160,7 @@ def plot_spiking_neuron_activity(spikes, view=False, filename=None, title=None):
     I_vals = [I for t, I, v, u, f in spikes]
     f_vals = [f for t, I, v, u, f in spikes]
 
+    plt = _pyplot()
     fig = plt.figure()
 
     plt.subplot(4, 1, 1)
@@ -116,26 +208,32 @@ def plot_species_distribution(statistics, view=False, filename='speciation.svg')
         view (bool): Show plot window after saving.
         filename (str): Output file name for the saved plot.
     """
-    if plt is None:
+    plot_species_sizes(statistics.get_species_sizes(), view=view, filename=filename)
+
+
+def plot_species_sizes(species_sizes, view=False, filename='speciation.svg', generations=None):
+    """
+    Plot species sizes per generation as stacked areas.
+
+    Same figure as plot_species_distribution, from a (generations x species)
+    list. ``generations`` gives the x position of each row (e.g. the bin
+    centers of a SpeciationTracker); rows are generations 0, 1, ... by default.
+    """
+    if matplotlib is None:
         warnings.warn("Plotting not available: matplotlib is not installed.")
         return
 
-    
-    species_sizes = statistics.get_species_sizes()
-    num_generations = len(species_sizes)
+    if generations is None:
+        generations = range(len(species_sizes))
     curves = np.array(species_sizes).T
-    fig, ax = plt.subplots()
-    ax.stackplot(range(num_generations), *curves)
-
-    plt.title("Speciation Over Generations")
-    plt.xlabel("Generations")
-    plt.ylabel("Individuals per Species")
-    plt.savefig(filename)
-
-    if view:
-        plt.show()
+    fig = _open_figure(view)
+    ax = fig.add_subplot()
+    ax.stackplot(generations, *curves)
 
-    plt.close()
+    ax.set_title("Speciation Over Generations")
+    ax.set_xlabel("Generations")
+    ax.set_ylabel("Individuals per Species")
+    _finish_figure(fig, filename, view)
 
 
 def draw_neural_network(config, genome, view=False, filename=None, node_names=None,
@@ -231,5 +329,9 @@ def draw_neural_network(config, genome, view=False, filename=None, node_names=No
                 'penwidth': width
             })
 
-    dot.render(filename, view=view)
+    try:
+        dot.render(filename, view=view)
+    except graphviz.ExecutableNotFound:
+        warnings.warn("Graphviz executables not found; network saved as source only.")
+        dot.save(filename)
     return dot
@@ -0,0 +1,60 @@
+from __future__ import print_function
+
+import neat
+
+
+class ProfileReporter(neat.reporting.BaseReporter):
+    """
+    NEAT reporter that prints where the environment spent its time each generation.
+
+    The environment must be a PLE instance created with ``profile=True``.
+    Its phase timings are read and reset at the end of every generation, so
+    each report covers one generation only. The environment is not part of
+    the reporter's pickled state (checkpoints pickle every reporter); a
+    restored reporter reports nothing until ``env`` is set again.
+
+    Parameters:
+    -----------
+    env : ple.PLE
+        Profiled environment used for serial evaluation.
+    """
+
+    def __init__(self, env):
+        self.env = env
+        self.generation = None
+        self.history = []   # per-generation phase summaries
+
+    def __getstate__(self):
+        state = dict(self.__dict__)
+        state['env'] = None
+        return state
+
+    def start_generation(self, generation):
+        self.generation = generation
+
+    def end_generation(self, config, population, species_set):
+        if self.env is None:
+            return
+        profile = self.env.getProfile(reset=True)
+        self.history.append(profile)
+        print(self.format(profile))
+
+    def format(self, profile):
+        """Table of the phases of one generation, slowest first."""
+        step = profile.get('ple.step')
+        if not step or not step['calls']:
+            return "Step profile: no steps recorded"
+
+        lines = ["Step profile (generation {}): {} steps in {:.1f} ms".format(
+            self.generation, step['calls'], step['total_ns'] / 1e6)]
+        lines.append("  {:<24}{:>9}{:>11}{:>8}{:>10}{:>10}".format(
+            'phase', 'calls', 'total ms', 'share', 'mean us', 'p90 us'))
+        phases = sorted((name for name in profile if name != 'ple.step'),
+                        key=lambda name: profile[name]['total_ns'], reverse=True)
+        for name in phases:
+            stats = profile[name]
+            lines.append("  {:<24}{:>9}{:>11.1f}{:>8.1%}{:>10.1f}{:>10.1f}".format(
+                name, stats['calls'], stats['total_ns'] / 1e6,
+                stats['total_ns'] / float(step['total_ns']),
+                stats['mean_ns'] / 1e3, stats['p90_ns'] / 1e3))
+        return "\n".join(lines)
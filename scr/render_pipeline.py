@@ -0,0 +1,186 @@
+from __future__ import print_function
+
+import hashlib
+import json
+import multiprocessing
+import os
+import pickle
+import queue
+import sys
+import traceback
+
+import neat
+
+# Digest of the inputs each artifact was last rendered from, in the output directory
+MANIFEST = '.render_manifest.json'
+
+
+def _load_manifest(path):
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (IOError, ValueError):
+        return {}
+
+
+def _save_manifest(path, manifest):
+    temporary = path + '.tmp'
+    with open(temporary, 'w') as f:
+        json.dump(manifest, f, indent=1, sort_keys=True)
+    os.replace(temporary, path)
+
+
+def _render_main(jobs, manifest_path):
+    """
+    Render process loop.
+
+    Messages on the job queue are ``(name, path, digest, function, args,
+    kwargs)`` tuples, or None to shut down. When jobs pile up faster than
+    they render, only the newest job of each artifact is rendered.
+    """
+    manifest = _load_manifest(manifest_path)
+
+    stop = False
+    while not stop:
+        batch = [jobs.get()]
+        while True:
+            try:
+                batch.append(jobs.get_nowait())
+            except queue.Empty:
+                break
+
+        latest = {}
+        order = []
+        for message in batch:
+            if message is None:
+                stop = True
+                continue
+            if message[0] not in latest:
+                order.append(message[0])
+            latest[message[0]] = message
+
+        for name in order:
+            _, path, digest, function, args, kwargs = latest[name]
+            try:
+                function(*args, filename=path, **kwargs)
+            except Exception:
+                print("Rendering {} failed:\n{}".format(name, traceback.format_exc()), file=sys.stderr)
+                continue
+            manifest[name] = digest
+            _save_manifest(manifest_path, manifest)
+
+
+class RenderPipeline(object):
+    """
+    Render plots and network diagrams in a background process.
+
+    ``submit`` hands a rendering job to a separate process and returns at
+    once, so evolution never waits for matplotlib or Graphviz. Every job
+    is keyed by a digest of its inputs; a job whose artifact was already
+    rendered from the same inputs is skipped. The digests are kept in a
+    manifest in the output directory, so unchanged figures are not
+    rendered again by later runs either.
+
+    Rendering functions are called as ``function(*args, filename=path, **kwargs)``
+    and must not need a display (e.g. the neat_visualizations functions
+    with ``view=False``, which draw on Agg figures outside pyplot).
+
+    Parameters:
+    -----------
+    output_dir : str
+        Directory the artifacts are written to.
+    """
+
+    def __init__(self, output_dir='.'):
+        if not os.path.isdir(output_dir):
+            os.makedirs(output_dir)
+        self.output_dir = output_dir
+        self.manifest_path = os.path.join(output_dir, MANIFEST)
+        self.submitted = 0
+        self.skipped = 0
+
+        self._digests = _load_manifest(self.manifest_path)
+        self._jobs = None
+        self._process = None
+
+    def submit(self, name, function, *args, **kwargs):
+        """
+        Render ``output_dir/name`` in the background unless its inputs are unchanged.
+
+        Parameters:
+        -----------
+        name : str
+            File name of the artifact.
+        function : callable
+            Module-level rendering function.
+        *args, **kwargs
+            Inputs of the rendering function. A ``key`` keyword argument,
+            if given, is digested instead of them (for inputs that do not
+            pickle reproducibly) and not passed on.
+
+        Returns:
+        --------
+        bool
+            False if the job was skipped.
+        """
+        key = kwargs.pop('key', (args, sorted(kwargs.items())))
+        payload = pickle.dumps((function.__module__, function.__name__, key), protocol=2)
+        digest = hashlib.sha1(payload).hexdigest()
+
+        path = os.path.join(self.output_dir, name)
+        if self._digests.get(name) == digest and os.path.exists(path):
+            self.skipped += 1
+            return False
+
+        if self._process is None:
+            self._jobs = multiprocessing.Queue()
+            self._process = multiprocessing.Process(
+                target=_render_main, args=(self._jobs, self.manifest_path))
+            self._process.daemon = True
+            self._process.start()
+
+        self._digests[name] = digest
+        self._jobs.put((name, path, digest, function, args, kwargs))
+        self.submitted += 1
+        return True
+
+    def stop(self):
+        """Wait for the pending jobs to render and shut down the render process."""
+        if self._process is not None:
+            self._jobs.put(None)
+            self._process.join()
+            self._process = None
+            self._jobs = None
+
+
+class RenderReporter(neat.reporting.BaseReporter):
+    """
+    NEAT reporter that refreshes artifacts every ``interval`` generations.
+
+    Parameters:
+    -----------
+    interval : int
+        Generations between refreshes.
+    render : callable
+        Called as ``render(config)`` at the end of a due generation; it is
+        expected to submit jobs to a RenderPipeline. It is not part of the
+        reporter's pickled state (checkpoints pickle every reporter); a
+        restored reporter renders nothing until ``render`` is set again.
+    """
+
+    def __init__(self, interval, render):
+        self.interval = interval
+        self.render = render
+        self.generation = None
+
+    def __getstate__(self):
+        state = dict(self.__dict__)
+        state['render'] = None
+        return state
+
+    def start_generation(self, generation):
+        self.generation = generation
+
+    def end_generation(self, config, population, species_set):
+        if self.render is not None and (self.generation + 1) % self.interval == 0:
+            self.render(config)
@@ -0,0 +1,133 @@
+from __future__ import print_function
+
+import numpy as np
+
+import neat
+
+
+class SpeciationTracker(neat.reporting.BaseReporter):
+    """
+    Streaming, downsampled record of species sizes for the speciation plot.
+
+    Species sizes are accumulated as generations arrive into at most
+    ``max_bins`` bins of equal width. When the bins are full, neighbouring
+    bins are merged pairwise and the width doubles, so memory stays fixed
+    however long the run is. Each species gets a column while it lives;
+    with more than ``max_species`` columns in use, the smallest extinct
+    species is folded into a shared "other" column (column 0) to make room.
+
+    Any generation range is plotted from at most ``max_bins`` bins, so the
+    cost of a plot does not grow with the number of generations.
+
+    Parameters:
+    -----------
+    max_bins : int
+        Number of generation bins (even).
+    max_species : int
+        Number of species with a column of their own.
+    """
+
+    def __init__(self, max_bins=256, max_species=32):
+        if max_bins < 2 or max_bins % 2:
+            raise ValueError("max_bins must be an even number >= 2")
+        self.max_bins = max_bins
+        self.max_species = max_species
+        self.width = 1          # generations per bin
+        self.generations = 0    # generations recorded so far
+
+        self._sums = np.zeros((max_bins, max_species + 1))
+        self._counts = np.zeros(max_bins, dtype=int)
+        self._totals = np.zeros(max_species + 1)   # all-time size sum of each column
+        self._columns = {}      # species id -> column
+        self._owners = {}       # column -> species id
+        self._alive = set()     # species ids of the last generation
+
+    def post_evaluate(self, config, population, species, best_genome):
+        self.add_generation(dict((sid, len(s.members)) for sid, s in species.species.items()))
+
+    def add_generation(self, sizes):
+        """
+        Record the size of each species in the next generation.
+
+        Parameters:
+        -----------
+        sizes : dict
+            Species id to number of members.
+        """
+        index = self.generations // self.width
+        if index >= self.max_bins:
+            self._merge_bins()
+            index = self.generations // self.width
+
+        self._alive = set(sizes)
+        for sid, size in sizes.items():
+            column = self._column(sid)
+            self._sums[index, column] += size
+            self._totals[column] += size
+        self._counts[index] += 1
+        self.generations += 1
+
+        # Species folded into "other" are forgotten once extinct
+        for sid in [sid for sid, column in self._columns.items() if column == 0 and sid not in self._alive]:
+            del self._columns[sid]
+
+    def _merge_bins(self):
+        half = self.max_bins // 2
+        self._sums[:half] = self._sums[0::2] + self._sums[1::2]
+        self._sums[half:] = 0.0
+        self._counts[:half] = self._counts[0::2] + self._counts[1::2]
+        self._counts[half:] = 0
+        self.width *= 2
+
+    def _column(self, sid):
+        if sid in self._columns:
+            return self._columns[sid]
+
+        if len(self._owners) < self.max_species:
+            column = len(self._owners) + 1
+        else:
+            extinct = [c for c, owner in self._owners.items() if owner not in self._alive]
+            if not extinct:
+                # Every column belongs to a living species
+                self._columns[sid] = 0
+                return 0
+            column = min(extinct, key=lambda c: self._totals[c])
+            self._sums[:, 0] += self._sums[:, column]
+            self._sums[:, column] = 0.0
+            self._totals[0] += self._totals[column]
+            self._totals[column] = 0.0
+            del self._columns[self._owners[column]]
+
+        self._columns[sid] = column
+        self._owners[column] = sid
+        return column
+
+    def series(self, start=0, stop=None):
+        """
+        Mean species sizes per bin over a range of generations.
+
+        Parameters:
+        -----------
+        start, stop : int
+            Generation range [start, stop); by default the whole run.
+
+        Returns:
+        --------
+        tuple
+            (generations, sizes): the center generation of each bin and a
+            (bins, columns) array of mean sizes, without empty columns;
+            column 0 is "other".
+        """
+        if stop is None or stop > self.generations:
+            stop = self.generations
+        first = max(start, 0) // self.width
+        last = (stop - 1) // self.width + 1 if stop > start else first
+
+        counts = self._counts[first:last]
+        used = counts > 0
+        sizes = self._sums[first:last][used] / counts[used][:, None]
+        bins = np.arange(first, last)[used]
+        centers = bins * self.width + (counts[used] - 1) / 2.0
+
+        keep = sizes.any(axis=0)
+        return centers, sizes[:, keep]
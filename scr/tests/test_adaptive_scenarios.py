@@ -0,0 +1,97 @@
+#!/usr/bin/python
+
+
+"""
+
+This tests how the adaptive scenario selector spreads the episode budget
+over the scenarios from one generation to the next.
+
+
+"""
+
+
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from adaptive_scenarios import AdaptiveScenarioSelector
+
+
+def play_generation(selector, passes, episodes=10, score=0.5):
+    """Records ``episodes`` episodes per active scenario, ``passes[i]`` of them passed."""
+    for i, passed in enumerate(passes):
+        if not selector.is_active(i):
+            continue
+        for episode in range(episodes):
+            selector.record(i, episode < passed, 1.0 if episode < passed else score)
+    return selector.end_generation()
+
+
+class AdaptiveScenarioSelectorTestCase(unittest.TestCase):
+
+    def test_drops_after_patience(self):
+        selector = AdaptiveScenarioSelector(3, patience=3, reprobe_interval=0)
+        for generation in range(2):
+            play_generation(selector, [10, 5, 5])
+            self.assertEqual(selector.allocation, {0: 1, 1: 1, 2: 1})
+
+        play_generation(selector, [10, 5, 5])
+        self.assertFalse(selector.is_active(0))
+        self.assertEqual(selector.dropped_score(0), 1.0)
+        self.assertEqual(sum(selector.allocation.values()), selector.budget)
+        self.assertEqual(selector.allocation, {1: 2, 2: 1})
+
+    def test_largest_remainder_split(self):
+        selector = AdaptiveScenarioSelector(5, patience=1, reprobe_interval=0, smoothing=1.0)
+        play_generation(selector, [10, 10, 5, 5, 1])
+        # failure variances 0.25, 0.25 and 0.09 share the two freed episodes
+        self.assertEqual(sorted(selector.dropped), [0, 1])
+        self.assertEqual(selector.allocation, {2: 2, 3: 2, 4: 1})
+
+        play_generation(selector, [0, 0, 0, 0, 5])
+        # saturated everywhere but scenario 4: it takes every freed episode
+        self.assertEqual(selector.allocation, {2: 1, 3: 1, 4: 3})
+
+    def test_keeps_one_scenario(self):
+        selector = AdaptiveScenarioSelector(3, patience=1, reprobe_interval=0)
+        play_generation(selector, [10, 10, 10])
+        self.assertEqual(len(selector.dropped), 2)
+        self.assertEqual(sum(selector.allocation.values()), 3)
+
+    def test_reprobe(self):
+        selector = AdaptiveScenarioSelector(2, patience=1, reprobe_interval=2)
+        play_generation(selector, [10, 5])
+        self.assertFalse(selector.is_active(0))
+
+        play_generation(selector, [0, 5])
+        self.assertEqual(selector.allocation, {0: 1, 1: 1})
+        play_generation(selector, [10, 5], score=0.0)
+        self.assertFalse(selector.is_active(0))
+        self.assertEqual(selector.dropped_score(0), 1.0)
+
+        play_generation(selector, [0, 5])
+        self.assertTrue(selector.is_active(0))
+        # the population no longer passes it: it is played again
+        play_generation(selector, [3, 5])
+        self.assertEqual(selector.dropped, {})
+        self.assertEqual(selector.allocation, {0: 1, 1: 1})
+
+    def test_seeded_jitter(self):
+        base = [25, 105, 185, 25]
+        selector = AdaptiveScenarioSelector(3, jitter=15, gap_range=(25, 192), seed=4)
+        self.assertIs(selector.episode_gaps(1, 0, base), base)
+
+        variant = selector.episode_gaps(1, 1, base)
+        self.assertNotEqual(variant, base)
+        self.assertEqual(variant, AdaptiveScenarioSelector(3, seed=4).episode_gaps(1, 1, base))
+        self.assertNotEqual(variant, selector.episode_gaps(1, 2, base))
+        self.assertNotEqual(variant, AdaptiveScenarioSelector(3, seed=5).episode_gaps(1, 1, base))
+        for gap, base_gap in zip(variant, base):
+            self.assertTrue(25 <= gap <= 192)
+            self.assertTrue(abs(gap - base_gap) <= 15)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,92 @@
+#!/usr/bin/python
+
+
+"""
+
+This tests the worker-process evaluator: results come back in order,
+runtimes are estimated from parents, and a worker killed in the middle
+of a generation is replaced.
+
+
+"""
+
+
+import os
+import shutil
+import signal
+import sys
+import tempfile
+import time
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from async_evaluator import AsyncEvaluator
+
+
+def make_env():
+    return None
+
+
+def evaluate(env, genome, config, marker):
+    """Sleeps ``genome[0]`` seconds; genome ``(delay, True)`` kills its worker once."""
+    delay, kill = genome
+    if kill and not os.path.exists(marker):
+        open(marker, 'w').close()
+        os.kill(os.getpid(), signal.SIGKILL)
+    time.sleep(delay)
+    return delay * 10
+
+
+class AsyncEvaluatorTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.marker = os.path.join(self.directory, "killed")
+        self.evaluator = AsyncEvaluator(3, evaluate, make_env)
+
+    def tearDown(self):
+        self.evaluator.stop()
+        shutil.rmtree(self.directory)
+
+    def test_results_in_order(self):
+        genomes = [(i, (0.01 * (i % 4), False)) for i in range(12)]
+        results = self.evaluator.evaluate(genomes, None, self.marker)
+        self.assertEqual(results, [0.01 * (i % 4) * 10 for i in range(12)])
+        stats = self.evaluator.history[-1]
+        self.assertEqual(sum(stats['genomes_per_worker']), 12)
+        self.assertEqual(sorted(self.evaluator.runtimes), list(range(12)))
+
+    def test_expected_runtime(self):
+        self.evaluator.runtimes = {1: 2.0, 2: 4.0}
+        self.evaluator.ancestors = {3: (1, 2), 4: (1, 9), 5: ()}
+        self.assertEqual(self.evaluator.expected_runtime(1, 0.5), 2.0)
+        self.assertEqual(self.evaluator.expected_runtime(3, 0.5), 3.0)
+        self.assertEqual(self.evaluator.expected_runtime(4, 0.5), 2.0)
+        self.assertEqual(self.evaluator.expected_runtime(5, 0.5), 0.5)
+
+    def test_straggler_wait_ignores_idle_workers(self):
+        self.evaluator.evaluate([(0, (0.2, False))], None, self.marker)
+        stats = self.evaluator.history[-1]
+        self.assertEqual(sorted(stats['genomes_per_worker']), [0, 0, 1])
+        self.assertTrue(stats['straggler_wait'] < stats['wall_time'] / 2)
+
+    def test_restarts_killed_worker(self):
+        genomes = [(i, (0.02, i == 4)) for i in range(9)]
+        results = self.evaluator.evaluate(genomes, None, self.marker)
+        self.assertEqual(results, [0.2] * 9)
+        self.assertEqual(self.evaluator.restarts, 1)
+        self.assertTrue(all(worker.is_alive() for worker in self.evaluator._workers))
+
+        # a genome killing every worker it is given fails the generation
+        os.remove(self.marker)
+        evaluator = AsyncEvaluator(1, evaluate, make_env, max_restarts=0)
+        try:
+            with self.assertRaises(RuntimeError):
+                evaluator.evaluate([(0, (0.0, True))], None, self.marker)
+        finally:
+            evaluator.stop()
+
+
+if __name__ == "__main__":
+    unittest.main()
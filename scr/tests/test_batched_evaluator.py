@@ -0,0 +1,77 @@
+#!/usr/bin/python
+
+
+"""
+
+This tests that the batched evaluator scores genomes exactly like the
+per-genome evaluation in the game, so that changes to the FlappyBird game
+are caught if BatchedFlappy does not mirror them.
+
+
+"""
+
+
+import os
+import random
+import sys
+import unittest
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import neat
+import train_agent
+from batched_evaluator import BatchedEvaluator
+from fitness import FitnessFunction
+
+CONFIG_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                           "..", "..", "config", "flappy_neat_feedforward_config")
+NUM_GENERATIONS = 5
+
+
+class BatchedEvaluatorTestCase(unittest.TestCase):
+
+    def test_matches_serial_evaluation(self):
+        random.seed(7)
+        config = neat.Config(neat.DefaultGenome, neat.DefaultReproduction,
+                             neat.DefaultSpeciesSet, neat.DefaultStagnation, CONFIG_FILE)
+        fitness = FitnessFunction.from_config_file(CONFIG_FILE)
+        # every scenario counts as saturated, so scenarios are dropped after one
+        # generation, re-probed every other one and the rest replayed jittered
+        selector = train_agent.AdaptiveScenarioSelector(
+            len(train_agent.scenario_gaps), saturation_threshold=0.0, patience=1,
+            reprobe_interval=2, gap_range=train_agent.GAP_RANGE, seed=7)
+        scenarios = train_agent.scenario_gaps
+        env = train_agent.make_worker_env()
+        evaluator = BatchedEvaluator(env.game, train_agent.NUM_PIPES)
+        allocations = []
+
+        def eval_genomes(genomes, config):
+            allocations.append(dict(selector.allocation))
+            serial = [train_agent.evaluate_genome(env, genome, config, selector, fitness, scenarios)
+                      for genome_id, genome in genomes]
+            batched = evaluator.evaluate(genomes, config, selector, fitness, scenarios)
+            for (genome_id, genome), expected, result in zip(genomes, serial, batched):
+                self.assertEqual(result, expected, "genome %d" % genome_id)
+
+            # evolve as in training, so later generations have hidden nodes
+            for scenario_scores, raw_scores, outcomes in serial:
+                for scenario, passed, episode_score, frames in outcomes:
+                    selector.record(scenario, passed, episode_score)
+            scores = fitness([scenario_scores for scenario_scores, _, _ in serial])
+            for (genome_id, genome), score in zip(genomes, scores):
+                genome.fitness = score
+            selector.end_generation()
+
+        population = neat.Population(config)
+        population.run(eval_genomes, NUM_GENERATIONS)
+
+        # dropped, re-probed and jittered scenarios were all compared
+        self.assertTrue(any(len(a) < len(scenarios) for a in allocations))
+        self.assertTrue(any(len(a) == len(scenarios) for a in allocations[1:]))
+        self.assertTrue(any(max(a.values()) > 1 for a in allocations))
+
+
+if __name__ == "__main__":
+    unittest.main()
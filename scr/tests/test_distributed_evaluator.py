@@ -0,0 +1,71 @@
+#!/usr/bin/python
+
+
+"""
+
+This tests the coordinator of the distributed evaluator with worker nodes
+started on this host.
+
+
+"""
+
+
+import os
+import sys
+import time
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from distributed_evaluator import DistributedEvaluator
+
+
+def make_env():
+    return None
+
+
+def evaluate(env, genome, config, offset):
+    if genome < 0:
+        os._exit(1)
+    return genome + offset
+
+
+class DistributedEvaluatorTestCase(unittest.TestCase):
+
+    def test_local_nodes(self):
+        evaluator = DistributedEvaluator(('127.0.0.1', 0), batch_size=3)
+        try:
+            evaluator.spawn_local_workers(2, evaluate, make_env)
+            genomes = [(i, i * 10) for i in range(10)]
+            self.assertEqual(evaluator.evaluate(genomes, None, 1), [i * 10 + 1 for i in range(10)])
+            self.assertEqual(evaluator.evaluate(genomes, None, 2), [i * 10 + 2 for i in range(10)])
+        finally:
+            evaluator.stop()
+
+    def test_requires_authkey(self):
+        with self.assertRaises(ValueError):
+            DistributedEvaluator(('0.0.0.0', 0))
+
+    def test_all_nodes_lost(self):
+        evaluator = DistributedEvaluator(('127.0.0.1', 0), node_wait=1.0)
+        try:
+            evaluator.spawn_local_workers(1, evaluate, make_env)
+            self.assertEqual(evaluator.evaluate([(0, 5)], None, 0), [5])
+            with self.assertRaises(RuntimeError):
+                evaluator.evaluate([(0, 5), (1, -1)], None, 0)
+        finally:
+            evaluator.stop()
+
+    def test_no_node(self):
+        evaluator = DistributedEvaluator(('127.0.0.1', 0), node_wait=1.0)
+        try:
+            start = time.perf_counter()
+            with self.assertRaises(RuntimeError):
+                evaluator.evaluate([(0, 0)], None, 0)
+            self.assertTrue(time.perf_counter() - start < 10.0)
+        finally:
+            evaluator.stop()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,70 @@
+#!/usr/bin/python
+
+
+"""
+
+This tests the fitness function: the default objective and weights, its
+array form and its configuration section.
+
+
+"""
+
+
+import os
+import sys
+import tempfile
+import unittest
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from fitness import FitnessFunction
+
+
+class FitnessFunctionTestCase(unittest.TestCase):
+
+    def test_default_formula(self):
+        fitness = FitnessFunction()
+        score, distance, y_factor = 2.0, 150.0, 40.0
+        expected = (distance / 195) + (score / 3) - 0.08 * (y_factor / 512)
+        self.assertEqual(fitness.episode_score(score, distance, y_factor, 512), expected)
+
+        scenario_scores = [[0.3, 0.7, 1.1], [1.0, 0.25, 0.125]]
+        self.assertEqual(fitness(scenario_scores),
+                         [round((s[0] * 1.0 + s[1] * 2.0 + s[2] * 6.0) / (1.0 + 2.0 + 6.0), 4)
+                          for s in scenario_scores])
+
+    def test_arrays_match_scalars(self):
+        fitness = FitnessFunction(objective='pipes')
+        rng = np.random.RandomState(3)
+        score = rng.randint(0, 4, size=20).astype(float)
+        distance = rng.uniform(0, 400, size=20)
+        y_factor = rng.uniform(0, 200, size=20)
+        batched = fitness.episode_score(score, distance, y_factor, 512)
+        for i in range(20):
+            self.assertEqual(batched[i], fitness.episode_score(score[i], distance[i], y_factor[i], 512))
+
+        with self.assertRaises(ValueError):
+            fitness([[1.0, 2.0]])
+
+    def test_config_section(self):
+        with tempfile.NamedTemporaryFile('w', suffix='.cfg', delete=False) as f:
+            f.write("[NEAT]\nfitness_criterion = max\n\n"
+                    "[FlappyFitness]\nobjective = survival\nscenario_weights = 1 1\n"
+                    "round_digits = 2\n")
+        try:
+            fitness = FitnessFunction.from_config_file(f.name)
+        finally:
+            os.remove(f.name)
+        self.assertEqual(fitness.objective, 'survival')
+        self.assertEqual(fitness.scenario_weights, [1.0, 1.0])
+        self.assertEqual(fitness.weight_y_factor, 0.08)
+        self.assertEqual(fitness([[0.125, 0.5]]), [0.31])
+
+        with self.assertRaises(ValueError):
+            FitnessFunction(objective='unknown')
+
+
+if __name__ == "__main__":
+    unittest.main()
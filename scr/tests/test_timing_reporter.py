@@ -0,0 +1,71 @@
+#!/usr/bin/python
+
+
+"""
+
+This tests the metrics the timing reporter writes at the end of each
+generation, including the generation that finds a solution.
+
+
+"""
+
+
+import json
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from timing_reporter import TimingReporter
+
+
+class TimingReporterTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_generation_metrics(self):
+        jsonl = os.path.join(self.directory, "timing.jsonl")
+        prometheus = os.path.join(self.directory, "timing.prom")
+        reporter = TimingReporter(2, prometheus, jsonl)
+
+        reporter.start_generation(0)
+        # (scenario_scores, raw_scores, outcomes) of two genomes
+        reporter.record([([], [], [(0, True, 1.0, 100), (1, False, 0.5, 40)]),
+                         ([], [], [(1, False, 0.2, 20)])], 0.5)
+        reporter.end_generation(None, None, None)
+        # after a fixed number of generations neat reports the last one again
+        reporter.found_solution(None, 1, None)
+
+        # the solving generation ends with found_solution only
+        reporter.start_generation(1)
+        reporter.record([([], [], [(0, True, 1.0, 60)])], 0.25)
+        reporter.found_solution(None, 1, None)
+
+        with open(jsonl) as f:
+            lines = [json.loads(line) for line in f]
+        self.assertEqual(lines, reporter.history)
+        self.assertEqual([m['generation'] for m in lines], [0, 1])
+        self.assertEqual(lines[0]['episodes'], [1, 2])
+        self.assertEqual(lines[0]['frames'], 160)
+        self.assertEqual(lines[0]['mean_episode_frames'], [100.0, 30.0])
+        self.assertEqual(lines[0]['genomes_per_second'], 4.0)
+        self.assertEqual(lines[1]['frames_per_second'], 240.0)
+        self.assertEqual((reporter.genomes_total, reporter.frames_total), (3, 220))
+
+        with open(prometheus) as f:
+            text = f.read()
+        self.assertIn("flappy_neat_generation 1.0\n", text)
+        self.assertIn("flappy_neat_frames_total 220.0\n", text)
+        self.assertIn('flappy_neat_episodes{scenario="1"} 1.0\n', text)
+        self.assertFalse(os.path.exists(prometheus + ".tmp"))
+
+
+if __name__ == "__main__":
+    unittest.main()
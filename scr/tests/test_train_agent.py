@@ -0,0 +1,61 @@
+#!/usr/bin/python
+
+
+"""
+
+This tests the command line of the training driver.
+
+
+"""
+
+
+import os
+import sys
+import unittest
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import train_agent
+
+
+class ParseArgsTestCase(unittest.TestCase):
+
+    def test_defaults(self):
+        options = train_agent.parse_args([])
+        self.assertEqual(options.config, train_agent.DEFAULT_CONFIG)
+        self.assertEqual(options.backend, 'serial')
+        self.assertEqual(options.scenarios, 'alternating')
+        self.assertEqual((options.checkpoint_interval, options.checkpoint_keep), (1, 0))
+        self.assertEqual((options.render_interval, options.champion_interval), (0, 0))
+        self.assertIsNone(options.coordinator)
+        self.assertIsNone(options.authkey)
+        self.assertFalse(options.benchmark)
+
+    def test_options(self):
+        options = train_agent.parse_args([
+            '--generations', '7', '--seed', '3', '--scenarios', 'staircase',
+            '--backend', 'process', '--workers', '2', '--checkpoint-keep', '5',
+            '--local-nodes', '1', '--no-plots', '--benchmark'])
+        self.assertEqual((options.generations, options.seed, options.scenarios), (7, 3, 'staircase'))
+        self.assertEqual((options.backend, options.workers), ('process', 2))
+        self.assertEqual((options.checkpoint_keep, options.local_nodes), (5, 1))
+        self.assertTrue(options.no_plots and options.benchmark)
+
+    def test_invalid_choices(self):
+        for argv in (['--backend', 'gpu'], ['--scenarios', 'zigzag'], ['--generations', 'many']):
+            with self.assertRaises(SystemExit):
+                train_agent.parse_args(argv)
+
+    def test_scenario_sets(self):
+        for name, gaps in train_agent.SCENARIO_SETS.items():
+            self.assertEqual(len(gaps), train_agent.NUM_SCENARIOS)
+            for scenario in gaps:
+                self.assertEqual(len(scenario), train_agent.NUM_PIPES)
+                low, high = train_agent.GAP_RANGE
+                self.assertTrue(all(low <= gap <= high for gap in scenario), name)
+
+
+if __name__ == "__main__":
+    unittest.main()
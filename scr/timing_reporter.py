@@ -0,0 +1,158 @@
+from __future__ import print_function
+
+import json
+import os
+import time
+
+import neat
+
+
+class TimingReporter(neat.reporting.BaseReporter):
+    """
+    NEAT reporter that exports per-generation timing and throughput counters.
+
+    ``eval_genomes`` hands the evaluation results and wall time of each
+    generation to :meth:`record`; the reporter counts genomes, episodes and
+    simulated frames per scenario, and at the end of the generation writes:
+
+    - a Prometheus text-format file (for the node_exporter textfile
+      collector), replaced atomically every generation;
+    - and/or one JSON line per generation appended to a JSONL file.
+
+    Counting happens once per episode, after evaluation, so the frame loop
+    itself is untouched. The generation that reaches the fitness threshold
+    ends with ``found_solution`` instead of ``end_generation``; it is written
+    out there.
+
+    Parameters:
+    -----------
+    num_scenarios : int
+        Number of evaluation scenarios.
+    prometheus_file : str, optional
+        Path of the Prometheus text-format file.
+    jsonl_file : str, optional
+        Path of the JSONL log.
+    prefix : str
+        Prefix of the Prometheus metric names.
+    """
+
+    def __init__(self, num_scenarios, prometheus_file=None, jsonl_file=None, prefix='flappy_neat'):
+        self.num_scenarios = num_scenarios
+        self.prometheus_file = prometheus_file
+        self.jsonl_file = jsonl_file
+        self.prefix = prefix
+        self.generation = None
+        self.frames_total = 0
+        self.genomes_total = 0
+        self.history = []   # per-generation metrics, as written to the JSONL file
+        self._reset()
+
+    def _reset(self):
+        self._written = False
+        self._start = time.perf_counter()
+        self._evaluation_time = 0.0
+        self._genomes = 0
+        self._episodes = [0] * self.num_scenarios
+        self._frames = [0] * self.num_scenarios
+
+    def start_generation(self, generation):
+        self.generation = generation
+        self._reset()
+
+    def record(self, results, evaluation_time):
+        """
+        Count the work done by one call to the evaluator.
+
+        Parameters:
+        -----------
+        results : list
+            ``(scenario_scores, raw_scores, outcomes)`` per genome, as
+            returned by ``evaluate_genome``; outcomes carry the frames of
+            each episode as their last item.
+        evaluation_time : float
+            Wall time of the evaluation in seconds.
+        """
+        episodes = self._episodes
+        frames = self._frames
+        for _, _, outcomes in results:
+            for outcome in outcomes:
+                episodes[outcome[0]] += 1
+                frames[outcome[0]] += outcome[-1]
+        self._genomes += len(results)
+        self._evaluation_time += evaluation_time
+
+    def end_generation(self, config, population, species_set):
+        self._write()
+
+    def found_solution(self, config, generation, best):
+        # Population.run stops before end_generation once a genome solves the
+        # task; after the last of a fixed number of generations it calls this
+        # with the generation already written
+        self._write()
+
+    def _write(self):
+        if self._written or self.generation is None:
+            return
+        self._written = True
+        generation_time = time.perf_counter() - self._start
+        evaluation_time = self._evaluation_time
+        frames = int(sum(self._frames))
+        self.frames_total += frames
+        self.genomes_total += self._genomes
+
+        metrics = {
+            'generation': self.generation,
+            'timestamp': time.time(),
+            'generation_seconds': generation_time,
+            'evaluation_seconds': evaluation_time,
+            'genomes': self._genomes,
+            'frames': frames,
+            'genomes_per_second': self._genomes / evaluation_time if evaluation_time > 0 else 0.0,
+            'frames_per_second': frames / evaluation_time if evaluation_time > 0 else 0.0,
+            'episodes': list(self._episodes),
+            'mean_episode_frames': [float(f) / e if e else 0.0
+                                    for f, e in zip(self._frames, self._episodes)],
+        }
+        self.history.append(metrics)
+
+        if self.jsonl_file is not None:
+            with open(self.jsonl_file, 'a') as f:
+                f.write(json.dumps(metrics) + "\n")
+        if self.prometheus_file is not None:
+            self._write_prometheus(metrics)
+
+    def _write_prometheus(self, metrics):
+        lines = []
+
+        def metric(name, kind, description, samples):
+            name = self.prefix + '_' + name
+            lines.append("# HELP {} {}".format(name, description))
+            lines.append("# TYPE {} {}".format(name, kind))
+            for labels, value in samples:
+                lines.append("{}{} {}".format(name, labels, repr(float(value))))
+
+        metric('generation', 'gauge', "Last completed generation.",
+               [('', metrics['generation'])])
+        metric('generation_seconds', 'gauge', "Wall time of the last generation.",
+               [('', metrics['generation_seconds'])])
+        metric('evaluation_seconds', 'gauge', "Wall time spent evaluating genomes in the last generation.",
+               [('', metrics['evaluation_seconds'])])
+        metric('genomes_per_second', 'gauge', "Genomes evaluated per second in the last generation.",
+               [('', metrics['genomes_per_second'])])
+        metric('frames_per_second', 'gauge', "Frames simulated per second in the last generation.",
+               [('', metrics['frames_per_second'])])
+        metric('genomes_total', 'counter', "Genomes evaluated since the start of the run.",
+               [('', self.genomes_total)])
+        metric('frames_total', 'counter', "Frames simulated since the start of the run.",
+               [('', self.frames_total)])
+        scenarios = range(self.num_scenarios)
+        metric('episodes', 'gauge', "Episodes played per scenario in the last generation.",
+               [('{{scenario="{}"}}'.format(i + 1), metrics['episodes'][i]) for i in scenarios])
+        metric('episode_frames_mean', 'gauge', "Mean episode length in frames per scenario in the last generation.",
+               [('{{scenario="{}"}}'.format(i + 1), metrics['mean_episode_frames'][i]) for i in scenarios])
+
+        # Write then rename, so a scrape never sees a half-written file
+        temporary = self.prometheus_file + '.tmp'
+        with open(temporary, 'w') as f:
+            f.write("\n".join(lines) + "\n")
+        os.replace(temporary, self.prometheus_file)
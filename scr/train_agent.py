@@ -1,16 +1,28 @@
 from __future__ import print_function
+import argparse
+import multiprocessing
+import random
 import sys
 import os
+import time
 
 # Add custom PLE path to sys.path for local module imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'ple_custom'))
 
+# Only light modules are imported here: pygame and PLE are loaded by the
+# first environment, matplotlib and graphviz once a run ends.
 import neat
-import matplotlib.pyplot as plt
-from numpy import *
-from ple import PLE
-from ple.games import FlappyBird
-import neat_visualizations
+from adaptive_scenarios import AdaptiveScenarioSelector
+from async_evaluator import AsyncEvaluator
+from distributed_evaluator import DistributedEvaluator
+from batched_evaluator import BatchedEvaluator
+from champion_snapshots import ChampionSnapshotReporter, genome_digest
+from checkpointer import RetainingCheckpointer
+from fitness import FitnessFunction
+from profile_reporter import ProfileReporter
+from speciation_tracker import SpeciationTracker
+from render_pipeline import RenderPipeline, RenderReporter
+from timing_reporter import TimingReporter
 
 # === GLOBAL METRICS FOR PLOTTING ===
 avg_fitness_per_gen = []   # Average fitness per generation
@@ -22,41 +34,237 @@ best_score_per_gen = []    # Best score per generation
 NUM_SCENARIOS = 3          # Number of game scenarios to test each genome on
 NUM_PIPES = 3              # Number of pipes per scenario
 
-# === WEIGHTS FOR FITNESS FUNCTION ===
-score = 0.0
-distance = 0.0
-y_factor = 0.0
+# === FITNESS FUNCTION ===
+# Weights and normalizers come from the [FlappyFitness] section of the NEAT
+# config (loaded in run()); the defaults are distance 1.0, score 1.0,
+# y-factor 0.08 and scenario weights 1, 2 and 6.
+fitness_function = FitnessFunction()
 
-WEIGHT_DISTANCE = 1.0       # Weight for horizontal distance traveled
-WEIGHT_SCORE = 1.0          # Weight for pipes successfully passed
-WEIGHT_Y_FACTOR = 0.08      # Penalty for vertical deviation from pipe center
+# === PARALLEL EVALUATION ===
+NUM_WORKERS = 1             # More than one evaluates genomes asynchronously in worker processes
+BATCHED_EVALUATION = False  # Evaluate the whole population at once with array physics
 
-# Different weights for each scenario
-WEIGHT_SCENARIO_1 = 1.0
-WEIGHT_SCENARIO_2 = 2.0
-WEIGHT_SCENARIO_3 = 6.0
+# === DISTRIBUTED EVALUATION ===
+COORDINATOR_ADDRESS = None  # (host, port) to serve genomes to worker nodes, e.g. ('127.0.0.1', 6000)
+COORDINATOR_AUTHKEY = None  # Shared secret of the worker nodes; required unless listening on loopback
+LOCAL_NODES = 0             # Worker nodes started on this host for the coordinator
+
+# === PROFILING ===
+PROFILE = False             # Time each phase of the environment step and report it per generation
+
+# === TIMING METRICS ===
+TIMING_PROMETHEUS_FILE = None  # e.g. 'flappy_neat.prom' for the node_exporter textfile collector
+TIMING_JSONL_FILE = None       # e.g. 'flappy_neat_timing.jsonl'
+
+# === OUTPUTS ===
+HEADLESS = False           # Never open a game window or plot windows; plots are only saved
 
 # === ENVIRONMENT SETUP ===
 # Initialize the game with a default pipe gap configuration
 initial_gaps = [25 for _ in range(NUM_PIPES)]
-game = FlappyBird(Var=True, Gap_Vector=initial_gaps, MAX_CONT=NUM_PIPES, pipe_gap=100)
-env = PLE(game)
+PIPE_GAP = 100
+GAP_RANGE = (25, 192)      # FlappyBird's (pipe_min, pipe_max) for PIPE_GAP on its 512 px screen
+
+
+def make_env(display_screen=True, profile=False):
+    """
+    Build a Flappy Bird environment with the default pipe gap configuration.
+
+    Parameters:
+    -----------
+    display_screen : bool
+        Whether the environment draws every frame to the screen.
+    profile : bool
+        Whether the environment times the phases of every step.
+    """
+    from ple import PLE
+    from ple.games.flappybird import FlappyBird
+
+    # Episodes start at rest: carrying the fall speed over would make a genome's
+    # fitness depend on the genome the same environment evaluated before it
+    game = FlappyBird(Var=True, Gap_Vector=initial_gaps, MAX_CONT=NUM_PIPES, pipe_gap=PIPE_GAP,
+                      reset_velocity=True)
+    env = PLE(game, display_screen=display_screen, profile=profile)
+    env.force_fps = True
+    return env
+
+
+def make_worker_env():
+    """Environment factory for evaluation workers, which never draw."""
+    return make_env(display_screen=False)
+
+
+# Environment of the main process, built on first use by get_env()
+env = None
+
+
+def get_env():
+    """Return the main process environment, building it on first use."""
+    global env
+    if env is None:
+        # Only this environment is profiled: ProfileReporter reads it
+        env = make_env(display_screen=not HEADLESS, profile=PROFILE)
+    return env
+
+
+# Parallel or distributed evaluator used by eval_genomes (created in run())
+evaluator = None
+
+# Collects throughput counters from eval_genomes (created in run())
+timing_reporter = None
+
+# Named pipe gap configurations, one list of gaps per scenario
+SCENARIO_SETS = {
+    # Low gaps alternating with gaps that get higher from scenario to scenario
+    'alternating': [
+        [25 if i % 2 == 0 else 25 + 80 * j for i in range(NUM_PIPES)]
+        for j in range(NUM_SCENARIOS)
+    ],
+    # Every pipe at the same height: low, middle and high
+    'constant': [[gap] * NUM_PIPES for gap in (25, 108, 192)],
+    # Gaps climbing from pipe to pipe, more steeply from scenario to scenario
+    'staircase': [
+        [min(25 + 40 * (j + 1) * i, GAP_RANGE[1]) for i in range(NUM_PIPES)]
+        for j in range(NUM_SCENARIOS)
+    ],
+}
 
 # Define custom pipe gap configurations for each scenario
-scenario_gaps = [
-    [25 if i % 2 == 0 else 25 + 80 * j for i in range(NUM_PIPES)]
-    for j in range(NUM_SCENARIOS)
-]
+scenario_gaps = SCENARIO_SETS['alternating']
+
+# Tracks per-scenario pass rates and moves episodes away from saturated scenarios
+scenario_selector = AdaptiveScenarioSelector(NUM_SCENARIOS, gap_range=GAP_RANGE)
+
+
+def set_scenarios(name, seed=0):
+    """
+    Evaluate genomes on one of the SCENARIO_SETS from now on.
+
+    Parameters:
+    -----------
+    name : str
+        Key of the scenario set.
+    seed : int
+        Seed of the scenario selector's gap jitter.
+    """
+    global scenario_gaps, scenario_selector
+    scenario_gaps = SCENARIO_SETS[name]
+    scenario_selector = AdaptiveScenarioSelector(len(scenario_gaps), gap_range=GAP_RANGE, seed=seed)
+
+
+def play_scenario(env, net, gaps):
+    """
+    Play one Flappy Bird episode with the given pipe gaps.
+
+    The episode ends when the bird crashes or after NUM_PIPES pipes.
+
+    Parameters:
+    -----------
+    env : ple.PLE
+        Environment the episode is played in.
+    net : neat.nn.FeedForwardNetwork
+        Network deciding when to flap.
+    gaps : list
+        Gap start of each pipe in the episode.
+
+    Returns:
+    --------
+    tuple
+        (score, distance, y_factor) of the episode.
+    """
+    score = 0.0
+    distance = 0.0
+    y_factor = 0.0
+
+    env.reset_game(gaps, NUM_PIPES)
+
+    while True:
+        state = env.game.getGameState()
+        inp_y = state["player_y"]
+        inp_pipe_bottom = state["next_pipe_bottom_y"]
+        inp_pipe_center = (state["next_pipe_bottom_y"] - state["next_pipe_top_y"]) / 2
+
+        output = net.activate((inp_y, inp_pipe_bottom, inp_pipe_center))
+        action = 119 if output[0] >= 0.4 else None
+        result = env.act(action)
+
+        if result > 0:
+            score += 1
+            if score == NUM_PIPES:
+                break
+
+        distance += 1.0
+
+        if env.game_over():
+            post_state = env.game.getGameState()
+            y_factor = abs(
+                post_state["player_y"]
+                - (post_state["next_pipe_top_y"]
+                   + (post_state["next_pipe_bottom_y"]
+                      - post_state["next_pipe_top_y"]) / 2)
+            )
+            break
+
+    return score, distance, y_factor
+
+
+def evaluate_genome(env, genome, config, selector, fitness, scenarios):
+    """
+    Play every scenario scheduled by the scenario selector with one genome.
+
+    Scenarios dropped by the selector are credited with the score the
+    population reached on them when they saturated. This function only
+    reads its arguments, so it can run in a worker process on copies of them.
+
+    Parameters:
+    -----------
+    scenarios : list
+        Base pipe gaps of each scenario.
+
+    Returns:
+    --------
+    tuple
+        (scenario_scores, raw_scores, outcomes): one score per scenario and
+        the (scenario, passed, normalized_score, frames) outcome of every episode.
+    """
+    net = neat.nn.FeedForwardNetwork.create(genome, config)
+    scenario_scores = []
+    raw_scores = []
+    outcomes = []
 
-print(game.height)
+    for i, base_gaps in enumerate(scenarios):
+        if not selector.is_active(i):
+            scenario_scores.append(selector.dropped_score(i))
+            raw_scores.append(float(NUM_PIPES))
+            continue
+
+        episodes = selector.episodes(i)
+        total_score = 0.0
+        total_raw = 0.0
+        for episode in range(episodes):
+            gaps = selector.episode_gaps(i, episode, base_gaps)
+            score, distance, y_factor = play_scenario(env, net, gaps)
+
+            episode_score = fitness.episode_score(score, distance, y_factor, env.game.height)
+            passed = score == NUM_PIPES
+            # The frame clearing the last pipe ends the episode before it is counted in distance
+            outcomes.append((i, passed, episode_score, int(distance) + passed))
+            total_score += episode_score
+            total_raw += score
+
+        scenario_scores.append(total_score / episodes)
+        raw_scores.append(total_raw / episodes)
+
+    return scenario_scores, raw_scores, outcomes
 
 
 def eval_genomes(genomes, config):
     """
     Evaluate each genome across multiple Flappy Bird scenarios.
 
-    Each genome is tested in three different pipe configurations.
-    Fitness is calculated based on the number of pipes passed,
+    Each genome is tested in three different pipe configurations; the
+    scenario selector may drop saturated scenarios and replay harder ones
+    on jittered gaps. Fitness is calculated based on the number of pipes passed,
     horizontal distance traveled, and vertical alignment to the pipe center.
 
     Parameters:
@@ -66,82 +274,27 @@ def eval_genomes(genomes, config):
     config : neat.Config
         NEAT configuration object with genome architecture and evolution settings.
     """
-    networks = []
-    scenario_fitness_scores = []
     scenario_raw_scores = []
 
-    # Create neural networks for all genomes
-    for genome_id, genome in genomes:
-        networks.append(neat.nn.FeedForwardNetwork.create(genome, config))
-
-    # Evaluate each genome in all scenarios
-    for net, (genome_id, genome) in zip(networks, genomes):
-        scenario_scores = []
-        raw_scores = []
-        env.init()
-
-        for i in range(NUM_SCENARIOS):
-            score = 0.0
-            distance = 0.0
-            y_factor = 0.0
-
-            while True:
-                state = env.game.getGameState()
-                inp_y = state["player_y"]
-                inp_pipe_bottom = state["next_pipe_bottom_y"]
-                inp_pipe_center = (state["next_pipe_bottom_y"] - state["next_pipe_top_y"]) / 2
-
-                output = net.activate((inp_y, inp_pipe_bottom, inp_pipe_center))
-                action = 119 if output[0] >= 0.4 else None
-                result = env.act(action)
-
-                env.display_screen = True
-                env.force_fps = True
-
-                if result > 0:
-                    score += 1
-                    if score == NUM_PIPES:
-                        if i < NUM_SCENARIOS:
-                            env.reset_game(scenario_gaps[i], NUM_PIPES)
-                            break
-                        break
-
-                distance += 1.0
-
-                if env.game_over():
-                    post_state = env.game.getGameState()
-                    if i < NUM_SCENARIOS:
-                        y_factor = abs(
-                            post_state["player_y"]
-                            - (post_state["next_pipe_top_y"]
-                               + (post_state["next_pipe_bottom_y"]
-                                  - post_state["next_pipe_top_y"]) / 2)
-                        )
-                        env.reset_game(scenario_gaps[i], NUM_PIPES)
-                        break
-                    break
-
-            normalized_score = (
-                WEIGHT_DISTANCE * (distance / 195)
-                + WEIGHT_SCORE * (score / 3)
-                - WEIGHT_Y_FACTOR * (y_factor / game.height)
-            )
-            scenario_scores.append(normalized_score)
-            raw_scores.append(score)
-
-        # Compute weighted average fitness over all scenarios
-        weighted_fitness = round(
-            (
-                scenario_scores[0] * WEIGHT_SCENARIO_1
-                + scenario_scores[1] * WEIGHT_SCENARIO_2
-                + scenario_scores[2] * WEIGHT_SCENARIO_3
-            ) / (WEIGHT_SCENARIO_1 + WEIGHT_SCENARIO_2 + WEIGHT_SCENARIO_3),
-            4
-        )
+    # Evaluate each genome in all scenarios, in worker processes if available
+    start = time.perf_counter()
+    if evaluator is not None:
+        results = evaluator.evaluate(genomes, config, scenario_selector, fitness_function, scenario_gaps)
+    else:
+        results = [evaluate_genome(get_env(), genome, config, scenario_selector, fitness_function, scenario_gaps)
+                   for genome_id, genome in genomes]
+    if timing_reporter is not None:
+        timing_reporter.record(results, time.perf_counter() - start)
+
+    for scenario_scores, raw_scores, outcomes in results:
+        for scenario, passed, episode_score, frames in outcomes:
+            scenario_selector.record(scenario, passed, episode_score)
+        scenario_raw_scores.append(round(sum(raw_scores) / len(raw_scores), 4))
 
+    # Compute weighted average fitness over all scenarios, for all genomes at once
+    scenario_fitness_scores = fitness_function([scenario_scores for scenario_scores, _, _ in results])
+    for (genome_id, genome), weighted_fitness in zip(genomes, scenario_fitness_scores):
         genome.fitness = weighted_fitness
-        scenario_fitness_scores.append(weighted_fitness)
-        scenario_raw_scores.append(round(sum(raw_scores) / len(raw_scores), 4))
 
     # Record metrics for plotting
     avg_fitness_per_gen.append(round(sum(scenario_fitness_scores) / len(scenario_fitness_scores), 4))
@@ -154,10 +307,83 @@ def eval_genomes(genomes, config):
     print("Avg fitness:", avg_fitness_per_gen[-1])
     print("Best score:", max(scenario_raw_scores))
     print("Avg score:", avg_score_per_gen[-1])
+    print(scenario_selector.end_generation())
+    if evaluator is not None:
+        print(evaluator.report())
     print("\n")
 
 
-def run(config_file):
+BACKENDS = ('serial', 'process', 'batched', 'distributed')
+
+DEFAULT_CONFIG = os.path.join(os.path.dirname(__file__), '..', 'config', 'flappy_neat_feedforward_config')
+
+
+def parse_args(argv=None):
+    """
+    Parse the training command line; defaults come from the module settings.
+
+    Parameters:
+    -----------
+    argv : list, optional
+        Arguments to parse instead of sys.argv[1:].
+    """
+    if COORDINATOR_ADDRESS is not None:
+        backend = 'distributed'
+    elif NUM_WORKERS > 1:
+        backend = 'process'
+    elif BATCHED_EVALUATION:
+        backend = 'batched'
+    else:
+        backend = 'serial'
+
+    parser = argparse.ArgumentParser(description="Train Flappy Bird agents with NEAT.")
+    parser.add_argument('--config', default=DEFAULT_CONFIG, help="NEAT configuration file")
+    parser.add_argument('--generations', type=int, default=100, help="Number of generations to run")
+    parser.add_argument('--seed', type=int, default=None, help="Seed of NEAT's random numbers and of the scenario jitter")
+    parser.add_argument('--scenarios', choices=sorted(SCENARIO_SETS), default='alternating',
+                        help="Pipe gap configurations genomes are evaluated on")
+
+    group = parser.add_argument_group("evaluation")
+    group.add_argument('--backend', choices=BACKENDS, default=backend,
+                       help="serial: one environment in this process; process: worker processes; "
+                            "batched: whole population with array physics; distributed: worker nodes over TCP")
+    group.add_argument('--workers', type=int, default=NUM_WORKERS if NUM_WORKERS > 1 else multiprocessing.cpu_count(),
+                       help="Worker processes of the process backend")
+    group.add_argument('--coordinator', default=None if COORDINATOR_ADDRESS is None else '{}:{}'.format(*COORDINATOR_ADDRESS),
+                       metavar='HOST:PORT', help="Address the distributed backend listens on (default 127.0.0.1:6000)")
+    group.add_argument('--authkey', default=COORDINATOR_AUTHKEY,
+                       help="Shared secret of the distributed backend; required to listen on a non-loopback "
+                            "address (default: random, only local nodes can connect)")
+    group.add_argument('--local-nodes', type=int, default=LOCAL_NODES,
+                       help="Worker nodes the distributed backend starts on this host")
+
+    group = parser.add_argument_group("checkpoints")
+    group.add_argument('--checkpoint-interval', type=int, default=1, help="Generations between checkpoints (0 disables them)")
+    group.add_argument('--checkpoint-keep', type=int, default=0, help="Checkpoints kept on disk (0 keeps all)")
+    group.add_argument('--checkpoint-prefix', default='neat-checkpoint-', help="Checkpoint file prefix")
+
+    group = parser.add_argument_group("outputs")
+    group.add_argument('--output-dir', default='.', help="Directory of the plots and the winner network drawing")
+    group.add_argument('--headless', action='store_true', default=HEADLESS,
+                       help="Open no game or plot window; plots are only saved")
+    group.add_argument('--no-plots', action='store_true', help="Skip the plots at the end of the run")
+    group.add_argument('--render-interval', type=int, default=0, metavar='K',
+                       help="Also refresh the plots in the background every K generations (0: only at the end)")
+    group.add_argument('--champion-interval', type=int, default=0, metavar='K',
+                       help="Draw the champion network into OUTPUT_DIR/champions every K generations (0 disables)")
+
+    group = parser.add_argument_group("profiling")
+    group.add_argument('--profile', action='store_true', default=PROFILE,
+                       help="Report per-phase step timings every generation (serial backend)")
+    group.add_argument('--timing-jsonl', default=TIMING_JSONL_FILE, help="Append generation timing metrics to this JSONL file")
+    group.add_argument('--timing-prometheus', default=TIMING_PROMETHEUS_FILE,
+                       help="Write generation timing metrics to this Prometheus text file")
+    group.add_argument('--benchmark', action='store_true',
+                       help="Measure throughput only: no checkpoints or plots, a summary at the end")
+    return parser.parse_args(argv)
+
+
+def run(config_file, options=None):
     """
     Run the NEAT evolution process with given configuration.
 
@@ -171,7 +397,20 @@ def run(config_file):
     -----------
     config_file : str
         Path to the NEAT configuration file.
+    options : argparse.Namespace, optional
+        Parsed command line (see parse_args); the module settings by default.
     """
+    if options is None:
+        options = parse_args([])
+
+    global HEADLESS, PROFILE
+    HEADLESS = options.headless
+    PROFILE = options.profile
+
+    if options.seed is not None:
+        random.seed(options.seed)
+    set_scenarios(options.scenarios, seed=options.seed or 0)
+
     config = neat.Config(
         neat.DefaultGenome,
         neat.DefaultReproduction,
@@ -180,49 +419,164 @@ def run(config_file):
         config_file
     )
 
+    global fitness_function
+    fitness_function = FitnessFunction.from_config_file(config_file)
+    if len(fitness_function.scenario_weights) != len(scenario_gaps):
+        raise ValueError("The fitness function weights {} scenarios, the '{}' set has {}".format(
+            len(fitness_function.scenario_weights), options.scenarios, len(scenario_gaps)))
+
     # Create population and attach reporters
     population = neat.Population(config)
     population.add_reporter(neat.StdOutReporter(True))
     stats = neat.StatisticsReporter()
     population.add_reporter(stats)
-    population.add_reporter(neat.Checkpointer(1))
-
-    # Run NEAT for 100 generations
-    winner = population.run(eval_genomes, 100)
+    speciation = SpeciationTracker()
+    population.add_reporter(speciation)
+    if options.checkpoint_interval > 0 and not options.benchmark:
+        population.add_reporter(RetainingCheckpointer(
+            options.checkpoint_interval, options.checkpoint_keep, options.checkpoint_prefix))
+    if PROFILE:
+        # Only the main environment is profiled, i.e. serial evaluation
+        population.add_reporter(ProfileReporter(get_env()))
+
+    # Export generation timing and throughput for dashboards
+    global timing_reporter
+    if options.timing_prometheus is not None or options.timing_jsonl is not None or options.benchmark:
+        timing_reporter = TimingReporter(len(scenario_gaps), options.timing_prometheus, options.timing_jsonl)
+        population.add_reporter(timing_reporter)
+
+    # Evaluate on worker nodes, worker processes or batched arrays as requested
+    global evaluator
+    if options.backend == 'distributed':
+        host, port = (options.coordinator or '127.0.0.1:6000').rsplit(':', 1)
+        if options.authkey is None and options.local_nodes <= 0:
+            # Nodes started elsewhere could never learn a generated key
+            raise ValueError("The distributed backend needs --authkey or --local-nodes")
+        authkey = None if options.authkey is None else options.authkey.encode()
+        evaluator = DistributedEvaluator((host, int(port)), authkey)
+        evaluator.spawn_local_workers(options.local_nodes, evaluate_genome, make_worker_env)
+    elif options.backend == 'process':
+        evaluator = AsyncEvaluator(options.workers, evaluate_genome, make_worker_env,
+                                   ancestors=population.reproduction.ancestors)
+    elif options.backend == 'batched':
+        evaluator = BatchedEvaluator(get_env().game, NUM_PIPES)
+
+    # Plots are rendered in a background process, so evolution never waits for them
+    pipeline = None
+    plots = not (options.benchmark or options.no_plots)
+    if plots or options.champion_interval > 0:
+        pipeline = RenderPipeline(options.output_dir)
+    if options.champion_interval > 0:
+        population.add_reporter(ChampionSnapshotReporter(pipeline, options.champion_interval, NODE_NAMES))
+    if plots:
+        if options.render_interval > 0:
+            population.add_reporter(RenderReporter(
+                options.render_interval,
+                lambda config: submit_plots(pipeline, config, stats.best_genome(), stats, speciation)))
+
+    start = time.perf_counter()
+    try:
+        winner = population.run(eval_genomes, options.generations)
+        wall = time.perf_counter() - start
+        if plots and HEADLESS:
+            submit_plots(pipeline, config, winner, stats, speciation)
+    finally:
+        if evaluator is not None:
+            evaluator.stop()
+            evaluator = None
+        # Also on errors: the render process would otherwise keep the interpreter alive
+        if pipeline is not None:
+            pipeline.stop()
 
     print('\nBest genome:\n{!s}'.format(winner))
 
+    if options.benchmark:
+        print(benchmark_summary(timing_reporter.history, wall, options))
+    if plots and not HEADLESS:
+        plot_results(config, winner, stats, speciation, options.output_dir)
+    return winner
+
+
+def benchmark_summary(history, wall, options):
+    """Throughput of a benchmark run, from the TimingReporter history."""
+    genomes = sum(h['genomes'] for h in history)
+    frames = sum(h['frames'] for h in history)
+    evaluation = sum(h['evaluation_seconds'] for h in history)
+    return ("Benchmark ({} backend{}): {} generations in {:.2f}s, {:.1f} genomes/s, "
+            "{:.0f} frames/s, {:.0%} of the time in evaluation").format(
+        options.backend,
+        ", {} workers".format(options.workers) if options.backend == 'process' else "",
+        len(history), wall, genomes / wall if wall > 0 else 0.0,
+        frames / evaluation if evaluation > 0 else 0.0,
+        evaluation / wall if wall > 0 else 0.0)
+
+
+# Names of the network inputs and output in the network drawing
+NODE_NAMES = {-3: 'Player_Y', -2: 'Pipe_Bottom_Y', -1: 'Gap_Center_Y', 0: 'Jump_Prob'}
+
+
+def plot_results(config, winner, stats, speciation, output_dir='.'):
+    """
+    Draw the winner network, the species and fitness statistics and the
+    per-generation fitness and score curves into ``output_dir``, showing
+    every figure in a window.
+    """
+    # Plotting libraries are only needed from here on
+    import neat_visualizations
+
+    if not os.path.isdir(output_dir):
+        os.makedirs(output_dir)
+
+    def output(filename):
+        return os.path.join(output_dir, filename)
+
     # Visualize the winning neural network and species evolution
-    node_names = {-3: 'Player_Y', -2: 'Pipe_Bottom_Y', -1: 'Gap_Center_Y', 0: 'Jump_Prob'}
-    neat_visualizations.draw_neural_network(config, winner, view=True, node_names=node_names)
-    neat_visualizations.plot_species_distribution(stats, view=True)
-    neat_visualizations.plot_fitness_statistics(stats, view=True)
-
-    # === Plot: Fitness over generations ===
-    plt.plot(range(1, len(avg_fitness_per_gen) + 1), avg_fitness_per_gen, linewidth=2, color='blue', label='Average Fitness')
-    plt.plot(range(1, len(best_fitness_per_gen) + 1), best_fitness_per_gen, linewidth=2, color='red', label='Best Fitness')
-    plt.title("Fitness over Generations", fontsize=18)
-    plt.xlabel("Generations", fontsize=12)
-    plt.ylabel("Fitness Score", fontsize=12)
-    plt.grid()
-    plt.legend(loc='upper right')
-    plt.savefig('Fitness.png')
-    plt.show()
-
-    # === Plot: Score over generations ===
-    plt.plot(range(1, len(avg_score_per_gen) + 1), avg_score_per_gen, linewidth=2, color='blue', label='Average Score')
-    plt.plot(range(1, len(best_score_per_gen) + 1), best_score_per_gen, linewidth=2, color='red', label='Best Score')
-    plt.title("Score over Generations", fontsize=18)
-    plt.xlabel("Generations", fontsize=12)
-    plt.ylabel("Score", fontsize=12)
-    plt.grid()
-    plt.legend(loc='upper right')
-    plt.savefig('Score.png')
-    plt.show()
+    neat_visualizations.draw_neural_network(config, winner, view=True, filename=output('winner_network.gv'),
+                                            node_names=NODE_NAMES)
+    generations, species_sizes = speciation.series()
+    neat_visualizations.plot_species_sizes(species_sizes, view=True, filename=output('speciation.svg'),
+                                           generations=generations)
+    neat_visualizations.plot_fitness_statistics(stats, view=True, filename=output('avg_fitness.svg'))
+
+    for filename, title, ylabel, curves in generation_curves():
+        neat_visualizations.plot_generation_curves(curves, title, ylabel, view=True, filename=output(filename))
+
+
+def generation_curves():
+    """(filename, title, ylabel, curves) of the per-generation fitness and score plots."""
+    return [
+        ('Fitness.png', "Fitness over Generations", "Fitness Score",
+         [('Average Fitness', 'blue', list(avg_fitness_per_gen)),
+          ('Best Fitness', 'red', list(best_fitness_per_gen))]),
+        ('Score.png', "Score over Generations", "Score",
+         [('Average Score', 'blue', list(avg_score_per_gen)),
+          ('Best Score', 'red', list(best_score_per_gen))]),
+    ]
+
+
+def submit_plots(pipeline, config, genome, stats, speciation):
+    """
+    Queue the artifacts of plot_results on a RenderPipeline, without windows.
+
+    Artifacts whose inputs did not change since they were last rendered
+    (e.g. the network of a best genome that is still the best) are skipped.
+    """
+    import neat_visualizations
+
+    pipeline.submit('winner_network.gv', neat_visualizations.draw_neural_network, config, genome,
+                    node_names=NODE_NAMES, key=(genome_digest(genome), NODE_NAMES))
+    generations, species_sizes = speciation.series()
+    pipeline.submit('speciation.svg', neat_visualizations.plot_species_sizes, species_sizes,
+                    generations=generations)
+    pipeline.submit('avg_fitness.svg', neat_visualizations.plot_fitness_curves,
+                    [g.fitness for g in stats.most_fit_genomes],
+                    stats.get_fitness_mean(), stats.get_fitness_stdev())
+
+    for filename, title, ylabel, curves in generation_curves():
+        pipeline.submit(filename, neat_visualizations.plot_generation_curves, curves, title, ylabel)
 
 
 if __name__ == '__main__':
-    # Entry point: resolve config path and launch run()
-    local_dir = os.path.dirname(__file__)
-    config_path = os.path.join(local_dir, '..', 'config', 'flappy_neat_feedforward_config')
-    run(config_path)
+    # Entry point: parse the command line and launch run()
+    cli_options = parse_args()
+    run(cli_options.config, cli_options)